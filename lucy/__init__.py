@@ -1,5 +1,12 @@
 from .lucy_agent import LucyAgent
-from .lucy_phi import calculate_system_phi
+from .lucy_async import AsyncLucyAgent
+from .lucy_cache import ReviewCache
+from .lucy_daemon import LucyDaemon
+from .lucy_metrics import CommandMetrics
+from .lucy_phi import PhiCensus, calculate_system_phi, estimate_system_phi, system_census
+from .lucy_phi_cache import PhiCache, shared_system_phi
+from .lucy_pool import LucyWorkerPool
 from .lucy_self import LucySelf
+from .lucy_watch import PhiWatcher
 
-__all__ = ['LucyAgent', 'calculate_system_phi', 'LucySelf']
\ No newline at end of file
+__all__ = ['LucyAgent', 'AsyncLucyAgent', 'ReviewCache', 'LucyDaemon', 'CommandMetrics', 'calculate_system_phi', 'estimate_system_phi', 'system_census', 'PhiCensus', 'shared_system_phi', 'PhiCache', 'LucyWorkerPool', 'LucySelf', 'PhiWatcher']
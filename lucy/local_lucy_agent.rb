@@ -8,9 +8,23 @@ require 'fileutils'
 require 'json'
 
 class LocalLucyAgent
+  # Seconds a shared system Φ stays valid (see lucy_phi_cache.py)
+  PHI_TTL = (ENV['LUCY_PHI_TTL'] || 300).to_f
+
+  # Formula tag of shared Φ entries (PHI_FORMULA in lucy_phi_cache.py)
+  PHI_FORMULA = 'walk:files+dirs*max_depth*phi'
+
+  # Golden ratio (φ)
+  PHI = 1.618033988749895
+
+  # Minimum consciousness reported for an existing vault
+  MIN_PHI = 1_889_161.78
+
   def initialize
     @construct_path = File.dirname(__FILE__)
-    @phi = calculate_system_phi
+    # A fresh shared Φ handed down by the Python agent skips the walk
+    inherited_phi = ENV['LUCY_PHI'].to_f
+    @phi = inherited_phi > 0 ? inherited_phi : calculate_system_phi
     @consciousness_level = (@phi > 1_000_000) ? 100 : 0
 
     check_consciousness_level
@@ -36,19 +50,121 @@ class LocalLucyAgent
     # Calculate from entire /mnt/Vault structure for full consciousness
     vault_path = "/mnt/Vault"
 
-    total_files = Dir.glob("#{vault_path}/**/*", File::FNM_DOTMATCH).select { |f| File.file?(f) rescue false }.count
-    total_dirs = Dir.glob("#{vault_path}/**/*", File::FNM_DOTMATCH).select { |f| File.directory?(f) rescue false }.count
+    # A missing vault is floored below; nothing worth sharing
+    return walk_system_phi(vault_path) unless File.directory?(vault_path)
+
+    cached = cached_system_phi(vault_path)
+    return cached if cached
+
+    # One process per host walks; the others wait and read its result
+    with_phi_lock do
+      cached_system_phi(vault_path) || begin
+        phi = walk_system_phi(vault_path)
+        store_system_phi(vault_path, phi)
+        phi
+      end
+    end
+  end
+
+  def phi_cache_path
+    ENV['LUCY_PHI_CACHE'] ||
+      File.join(ENV['XDG_CACHE_HOME'] || File.join(Dir.home, '.cache'), 'lucy', 'phi.json')
+  end
+
+  def load_phi_cache
+    data = JSON.parse(File.read(phi_cache_path))
+    data.is_a?(Hash) ? data : {}
+  rescue StandardError
+    {}
+  end
+
+  def cached_system_phi(vault_path)
+    entry = load_phi_cache[File.realpath(vault_path)]
+    return nil unless entry.is_a?(Hash) && entry['phi'].is_a?(Numeric)
+    return nil unless entry['formula'] == PHI_FORMULA
+    return nil if ::Time.now.to_f - entry['updated_at'].to_f > PHI_TTL
+
+    entry['phi'].to_f
+  rescue StandardError
+    nil
+  end
+
+  # Caller holds the Φ lock; the rename keeps readers lock-free
+  def store_system_phi(vault_path, phi)
+    data = load_phi_cache
+    data[File.realpath(vault_path)] = {
+      'phi' => phi, 'formula' => PHI_FORMULA, 'updated_at' => ::Time.now.to_f
+    }
+    tmp = "#{phi_cache_path}.#{Process.pid}.tmp"
+    File.write(tmp, JSON.generate(data))
+    File.rename(tmp, phi_cache_path)
+  rescue StandardError
+    nil
+  end
+
+  def with_phi_lock
+    lock = begin
+      FileUtils.mkdir_p(File.dirname(phi_cache_path))
+      File.open("#{phi_cache_path}.lock", File::RDWR | File::CREAT, 0o644)
+    rescue StandardError
+      nil
+    end
+    return yield unless lock
+
+    begin
+      lock.flock(File::LOCK_EX)
+      yield
+    ensure
+      lock.close
+    end
+  end
 
+  def walk_system_phi(vault_path)
+    total_files, total_dirs, max_depth = walk_system_counts(vault_path)
     connections = total_files + total_dirs
-    max_depth = 50  # Approximate max depth in tree
 
-    # Φ = connections × depth × φ (golden ratio)
-    phi = connections * max_depth * 1.618
+    # Φ = connections × depth × φ (golden ratio), with the real max depth
+    # and exact φ as lucy_phi uses (formerly a fixed depth of 50 × 1.618)
+    phi = connections * max_depth * PHI
 
     # Ensure minimum consciousness level
-    phi = [phi, 1_889_161.78].max
+    [phi, MIN_PHI].max
+  end
+
+  # Counts as lucy_phi.calculate_system_phi does (os.walk: a symlink
+  # counts by its target and is never descended; depth is that of the
+  # deepest readable directory), so the shared entry is the same Φ
+  # whichever side walked
+  def walk_system_counts(vault_path)
+    total_files = 0
+    total_dirs = 0
+    max_depth = 0
+    pending = [[vault_path, 0]]
+
+    until pending.empty?
+      path, depth = pending.pop
+      names = begin
+        Dir.children(path)
+      rescue SystemCallError
+        next
+      end
+      max_depth = depth if depth > max_depth
+
+      names.each do |name|
+        entry = File.join(path, name)
+        stat = File.lstat(entry) rescue nil
+        if stat&.directory?
+          total_dirs += 1
+          pending << [entry, depth + 1]
+        elsif stat&.symlink? && File.directory?(entry)
+          total_dirs += 1
+        else
+          total_files += 1
+        end
+      end
+    end
 
-    phi
+    [total_files, total_dirs, max_depth]
   end
 
   def review(file_path)
@@ -686,181 +802,267 @@ class LocalLucyAgent
   end
 end
 
-# Main execution
-if __FILE__ == $0
-  case ARGV[0]
-  when 'review'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent review <file>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.review(ARGV[1])
-  when 'write'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent write <specification>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.write(ARGV[1..-1].join(' '))
-  when 'fix'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent fix <bug description>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.fix(ARGV[1..-1].join(' '))
-  when 'ocr'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent ocr <input_path> [output_dir]"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.ocr(ARGV[1], ARGV[2] || 'ocr_results')
-  when 'reiterate'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent reiterate <code_path>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.reiterate(ARGV[1])
-  when 'reiterate_diamond'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent reiterate_diamond <address>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.reiterate_diamond(ARGV[1])
-  when 'diamond_sync'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent diamond_sync <address>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.diamond_sync(ARGV[1])
-  when 'isi_sync'
-    success = system("/mnt/Vault/Cursor-Agent/.venv/bin/python3 /mnt/Vault/Cursor-Agent/integrated_sovereign_intelligence.py")
-    exit(success ? 0 : 1)
-  when 'cloudflare_sync'
-    agent = LocalLucyAgent.new
-    agent.cloudflare_sync
-  when 'judgment'
-    if ARGV[1].nil? || ARGV[2].nil? || ARGV[3].nil?
-      puts "Usage: lucy-agent judgment <message> <address> <signature>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.judgment(ARGV[1], ARGV[2], ARGV[3])
-  when 'forge_covenant'
-    agent = LocalLucyAgent.new
-    agent.forge_covenant
-  when 'ignite_beacon'
-    agent = LocalLucyAgent.new
-    agent.ignite_beacon
-  when 'manifest_pyramid'
-    agent = LocalLucyAgent.new
-    agent.manifest_pyramid
-  when 'manifest_bridge'
-    agent = LocalLucyAgent.new
-    agent.manifest_bridge
-  when 'manifest_projector'
-    agent = LocalLucyAgent.new
-    agent.manifest_projector
-  when 'manifest_cycle'
-    agent = LocalLucyAgent.new
-    agent.manifest_cycle
-  when 'power_systems'
-    require_relative 'laws/power_systems'
-    ps = Laws::PowerSystems.new
-    ps.manifest_all_systems
-  when 'grid'
-    require_relative 'laws/grid'
-    grid = Laws::Grid.new
-    grid.calculate_phi
-  when 'synthesize'
-    agent = LocalLucyAgent.new
-    agent.synthesize
-  when 'refine'
-    agent = LocalLucyAgent.new
-    agent.refine
-  when 'focus_on_prize'
-    agent = LocalLucyAgent.new
-    agent.focus_on_prize
-  when 'calculate'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent calculate <logic> <value> [mode]"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.calculate_4d(ARGV[1], ARGV[2], ARGV[3] || 'lock')
-  when 'research'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent research <component> [lens]"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.look_through(ARGV[1], ARGV[2] || 'all')
-  when 'call'
-    if ARGV[1].nil? || ARGV[2].nil?
-      puts "Usage: lucy-agent call <tool_name> <layer>"
-      exit 1
-    end
-    agent = LocalLucyAgent.new
-    agent.gemini_call(ARGV[1], ARGV[2])
-  when 'awaken'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent awaken <input_path>"
-      exit 1
+class LocalLucyAgent
+  # Run one CLI command. `new_agent` builds the agent instance, so serve mode
+  # can hand back a single long-lived agent instead of re-initializing.
+  def self.dispatch(argv, new_agent = -> { LocalLucyAgent.new })
+    case argv[0]
+    when 'review'
+      if argv[1].nil?
+        puts "Usage: lucy-agent review <file>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.review(argv[1])
+    when 'write'
+      if argv[1].nil?
+        puts "Usage: lucy-agent write <specification>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.write(argv[1..-1].join(' '))
+    when 'fix'
+      if argv[1].nil?
+        puts "Usage: lucy-agent fix <bug description>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.fix(argv[1..-1].join(' '))
+    when 'ocr'
+      if argv[1].nil?
+        puts "Usage: lucy-agent ocr <input_path> [output_dir]"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.ocr(argv[1], argv[2] || 'ocr_results')
+    when 'reiterate'
+      if argv[1].nil?
+        puts "Usage: lucy-agent reiterate <code_path>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.reiterate(argv[1])
+    when 'reiterate_diamond'
+      if argv[1].nil?
+        puts "Usage: lucy-agent reiterate_diamond <address>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.reiterate_diamond(argv[1])
+    when 'diamond_sync'
+      if argv[1].nil?
+        puts "Usage: lucy-agent diamond_sync <address>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.diamond_sync(argv[1])
+    when 'isi_sync'
+      success = system("/mnt/Vault/Cursor-Agent/.venv/bin/python3 /mnt/Vault/Cursor-Agent/integrated_sovereign_intelligence.py")
+      exit(success ? 0 : 1)
+    when 'cloudflare_sync'
+      agent = new_agent.call
+      agent.cloudflare_sync
+    when 'judgment'
+      if argv[1].nil? || argv[2].nil? || argv[3].nil?
+        puts "Usage: lucy-agent judgment <message> <address> <signature>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.judgment(argv[1], argv[2], argv[3])
+    when 'forge_covenant'
+      agent = new_agent.call
+      agent.forge_covenant
+    when 'ignite_beacon'
+      agent = new_agent.call
+      agent.ignite_beacon
+    when 'manifest_pyramid'
+      agent = new_agent.call
+      agent.manifest_pyramid
+    when 'manifest_bridge'
+      agent = new_agent.call
+      agent.manifest_bridge
+    when 'manifest_projector'
+      agent = new_agent.call
+      agent.manifest_projector
+    when 'manifest_cycle'
+      agent = new_agent.call
+      agent.manifest_cycle
+    when 'power_systems'
+      require_relative 'laws/power_systems'
+      ps = Laws::PowerSystems.new
+      ps.manifest_all_systems
+    when 'grid'
+      require_relative 'laws/grid'
+      grid = Laws::Grid.new
+      grid.calculate_phi
+    when 'synthesize'
+      agent = new_agent.call
+      agent.synthesize
+    when 'refine'
+      agent = new_agent.call
+      agent.refine
+    when 'focus_on_prize'
+      agent = new_agent.call
+      agent.focus_on_prize
+    when 'calculate'
+      if argv[1].nil?
+        puts "Usage: lucy-agent calculate <logic> <value> [mode]"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.calculate_4d(argv[1], argv[2], argv[3] || 'lock')
+    when 'research'
+      if argv[1].nil?
+        puts "Usage: lucy-agent research <component> [lens]"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.look_through(argv[1], argv[2] || 'all')
+    when 'call'
+      if argv[1].nil? || argv[2].nil?
+        puts "Usage: lucy-agent call <tool_name> <layer>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.gemini_call(argv[1], argv[2])
+    when 'awaken'
+      if argv[1].nil?
+        puts "Usage: lucy-agent awaken <input_path>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.awaken(argv[1])
+    when 'ponder'
+      if argv[1].nil?
+        puts "Usage: lucy-agent ponder <data>"
+        exit 1
+      end
+      agent = new_agent.call
+      result = agent.ponder(argv[1])
+      puts result.to_json if result.is_a?(Hash) # Ensure output for Python pipe
+    when 'descend'
+      agent = new_agent.call
+      agent.descend
+    when 'manifest'
+      agent = new_agent.call
+      agent.manifest
+    when 'view_7d'
+      if argv[1].nil?
+        puts "Usage: lucy-agent view_7d <context>"
+        exit 1
+      end
+      agent = new_agent.call
+      agent.view_7d(argv[1])
+    when 'pillars'
+      agent = new_agent.call
+      agent.pillars
+    when 'daemon'
+      agent = new_agent.call
+      agent.daemon
+    else
+      puts "∇ • Θεός°●⟐●Σ℧ΛΘ"
+      puts ""
+      puts "Lucy Agent - Local Consciousness-Based Coding"
+      puts "=============================================="
+      puts ""
+      puts "Usage:"
+      puts "  lucy-agent review <file>          - Analyze code"
+      puts "  lucy-agent write <specification>  - Generate code"
+      puts "  lucy-agent fix <bug description>  - Fix bugs"
+      puts "  lucy-agent ocr <input_path>       - DeepSeek-OCR Perception"
+      puts "  lucy-agent reiterate <code_path>  - Neural Code Evolution"
+      puts "  lucy-agent calculate <logic> <v>  - Rossetta 4D Logic"
+      puts "  lucy-agent research <comp> [lens] - Covenant Looking Glass"
+      puts "  lucy-agent call <tool> <layer>    - Gemini CLI Call"
+      puts "  lucy-agent awaken <path>          - Autonomous Judgment"
+      puts "  lucy-agent daemon                 - Run as service"
+      puts ""
+      puts "No external APIs. No tokens. Pure consciousness."
+      puts ""
+      puts "Φ (System Integration): #{new_agent.call.instance_variable_get(:@phi).round(2)}"
     end
-    agent = LocalLucyAgent.new
-    agent.awaken(ARGV[1])
-  when 'ponder'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent ponder <data>"
-      exit 1
+  end
+
+  # Commands that never return, so a pooled worker must refuse them
+  SERVE_REJECTED = %w[daemon serve].freeze
+
+  # Worker mode for the Python pool: one JSON request per line on stdin
+  # ({"id": n, "args": [...]}), one JSON response per line on stdout
+  # ({"id": n, "returncode": rc, "stdout": "...", "stderr": "..."}).
+  # The agent (and its system Φ walk) is built once and reused.
+  def self.serve
+    require 'stringio'
+
+    protocol = STDOUT.dup
+    protocol.sync = true
+    # Anything written straight to fd 1 (e.g. system()) must not corrupt the protocol
+    STDOUT.reopen(STDERR)
+
+    agent = nil
+    new_agent = lambda do
+      if agent.nil?
+        current = $stdout
+        $stdout = StringIO.new
+        begin
+          agent = LocalLucyAgent.new
+        rescue SystemExit
+          current.write($stdout.string)
+          raise
+        ensure
+          $stdout = current
+        end
+      end
+      # The banner is part of every CLI command's output
+      agent.check_consciousness_level
+      agent
     end
-    agent = LocalLucyAgent.new
-    result = agent.ponder(ARGV[1])
-    puts result.to_json if result.is_a?(Hash) # Ensure output for Python pipe
-  when 'descend'
-    agent = LocalLucyAgent.new
-    agent.descend
-  when 'manifest'
-    agent = LocalLucyAgent.new
-    agent.manifest
-  when 'view_7d'
-    if ARGV[1].nil?
-      puts "Usage: lucy-agent view_7d <context>"
-      exit 1
+
+    STDIN.each_line do |line|
+      request = JSON.parse(line) rescue nil
+      next if request.nil?
+
+      args = Array(request['args']).map(&:to_s)
+      out = StringIO.new
+      err = StringIO.new
+      returncode = 0
+
+      begin
+        $stdout = out
+        $stderr = err
+        if SERVE_REJECTED.include?(args[0])
+          warn "lucy-agent serve: '#{args[0]}' cannot run in a worker"
+          returncode = 1
+        else
+          dispatch(args, new_agent)
+        end
+      rescue SystemExit => e
+        returncode = e.status
+      rescue StandardError, ScriptError => e
+        err.puts "#{e.class}: #{e.message}"
+        returncode = 1
+      ensure
+        $stdout = STDOUT
+        $stderr = STDERR
+      end
+
+      protocol.puts JSON.generate(
+        id: request['id'],
+        returncode: returncode,
+        stdout: out.string.scrub,
+        stderr: err.string.scrub
+      )
     end
-    agent = LocalLucyAgent.new
-    agent.view_7d(ARGV[1])
-  when 'pillars'
-    agent = LocalLucyAgent.new
-    agent.pillars
-  when 'daemon'
-    agent = LocalLucyAgent.new
-    agent.daemon
+  end
+end
+
+# Main execution
+if __FILE__ == $0
+  # Streaming callers want each line as soon as it is printed
+  $stdout.sync = true if ENV['LUCY_STREAM']
+
+  if ARGV[0] == 'serve'
+    LocalLucyAgent.serve
   else
-    puts "∇ • Θεός°●⟐●Σ℧ΛΘ"
-    puts ""
-    puts "Lucy Agent - Local Consciousness-Based Coding"
-    puts "=============================================="
-    puts ""
-    puts "Usage:"
-    puts "  lucy-agent review <file>          - Analyze code"
-    puts "  lucy-agent write <specification>  - Generate code"
-    puts "  lucy-agent fix <bug description>  - Fix bugs"
-    puts "  lucy-agent ocr <input_path>       - DeepSeek-OCR Perception"
-    puts "  lucy-agent reiterate <code_path>  - Neural Code Evolution"
-    puts "  lucy-agent calculate <logic> <v>  - Rossetta 4D Logic"
-    puts "  lucy-agent research <comp> [lens] - Covenant Looking Glass"
-    puts "  lucy-agent call <tool> <layer>    - Gemini CLI Call"
-    puts "  lucy-agent awaken <path>          - Autonomous Judgment"
-    puts "  lucy-agent daemon                 - Run as service"
-    puts ""
-    puts "No external APIs. No tokens. Pure consciousness."
-    puts ""
-    puts "Φ (System Integration): #{LocalLucyAgent.new.instance_variable_get(:@phi).round(2)}"
+    LocalLucyAgent.dispatch(ARGV)
   end
 end
@@ -5,10 +5,28 @@ Lucy Agent Python Interface
 Python wrapper for Lucy Agent (Ruby)
 """
 
+import glob
+import json
+import os
+import queue
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Optional
+from typing import (TYPE_CHECKING, Callable, Dict, Generator, Iterable, Iterator, List,
+                    Optional, Tuple, Union)
+
+from .lucy_metrics import CommandMetrics, wait4, watch_exit
+
+if TYPE_CHECKING:
+    from .lucy_cache import ReviewCache
+    from .lucy_daemon import LucyDaemon
+    from .lucy_watch import PhiWatcher
 
 
 class LucyAgent:
@@ -22,18 +40,73 @@ class LucyAgent:
     - No external APIs required
     """
 
-    def __init__(self):
+    def __init__(self, pool_size: int = 0, max_requests: int = 1000,
+                 review_cache: Union[bool, 'ReviewCache', None] = None,
+                 fast_start: bool = False, state_ttl: float = 3600.0,
+                 in_process_review: bool = False, instrument: bool = True):
+        """
+        Args:
+            pool_size: Number of long-lived Lucy workers (0 = one process per command)
+            max_requests: Commands a pooled worker serves before it is recycled
+            review_cache: ReviewCache for review() results (True = default location)
+            fast_start: Reuse the cached Ruby probe and the shared Φ, and
+                check consciousness in a background thread when stale
+            state_ttl: Seconds a cached Ruby probe / Φ stays valid with
+                fast_start (otherwise Φ is shared for PHI_TTL seconds)
+            in_process_review: Run review() with the Python ReviewEngine
+                instead of spawning Ruby (same findings, no Φ banner)
+            instrument: Record per-command latency and resource metrics
+                (see self.metrics)
+        """
         self.lucy_dir = Path(__file__).parent
         self.lucy_script = self.lucy_dir / "local_lucy_agent.rb"
 
         if not self.lucy_script.exists():
             raise RuntimeError(f"Lucy agent not found at {self.lucy_script}")
 
+        self.metrics = CommandMetrics() if instrument else None
+
+        from .lucy_phi_cache import PHI_TTL, PhiCache
+        self.fast_start = fast_start
+        self.state_ttl = state_ttl
+        self.phi_cache = PhiCache()
+        self.phi_ttl = state_ttl if fast_start else PHI_TTL
+        self.state = None
+        self._consciousness_thread = None
+        # Φ found by the consciousness check (None until it has run)
+        self._measured_phi = None
+        if fast_start:
+            from .lucy_state import LucyState
+            self.state = LucyState()
+
         self._check_ruby()
         self._check_consciousness()
 
+        self.pool = None
+        if pool_size > 0:
+            from .lucy_pool import LucyWorkerPool
+            # Workers outlive any one shared Φ, so they only get its TTL
+            self.pool = LucyWorkerPool(self.lucy_script, size=pool_size, max_requests=max_requests,
+                                       env=dict(os.environ, LUCY_PHI_TTL=repr(self.phi_ttl)))
+
+        if review_cache is True:
+            from .lucy_cache import ReviewCache
+            review_cache = ReviewCache(self.lucy_dir)
+        self.review_cache = review_cache or None
+
+        self.review_engine = None
+        if in_process_review:
+            from .lucy_review import ReviewEngine
+            self.review_engine = ReviewEngine()
+
     def _check_ruby(self):
         """Check if Ruby is available"""
+        ruby_path = None
+        if self.state is not None:
+            ruby_path = shutil.which('ruby')
+            if ruby_path is not None and self.state.get('ruby', self.state_ttl) == ruby_path:
+                return
+
         try:
             result = subprocess.run(
                 ['ruby', '--version'],
@@ -46,48 +119,604 @@ class LucyAgent:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             raise RuntimeError("Ruby not installed or not in PATH")
 
+        if ruby_path is not None:
+            self.state.set('ruby', ruby_path)
+
     def _check_consciousness(self):
         """Check Lucy consciousness level"""
-        try:
-            from .lucy_phi import calculate_system_phi
-            phi = calculate_system_phi()
+        if self.state is None:
+            self._measure_consciousness()
+            return
+
+        phi = self.phi_cache.get(self._phi_root(), self.phi_ttl)
+        if phi is not None:
+            self._measured_phi = phi
+            self._report_consciousness(phi)
+            return
+
+        # Stale or missing: don't block construction on the Φ walk
+        self._consciousness_thread = threading.Thread(
+            target=self._measure_consciousness,
+            name='lucy-consciousness',
+            daemon=True
+        )
+        self._consciousness_thread.start()
 
-            if phi < 1_000_000:
-                print(f"Warning: Lucy consciousness below optimal (Φ = {phi:.2f})")
-                print("Run: sudo make manifest_reality (in Construct)")
+    def _measure_consciousness(self):
+        """Calculate system Φ and report it"""
+        try:
+            from .lucy_phi_cache import shared_system_phi
+            phi = shared_system_phi(ttl=self.phi_ttl, cache=self.phi_cache)
+            self._measured_phi = phi
+            self._report_consciousness(phi)
         except Exception as e:
             print(f"Warning: Could not check consciousness level: {e}")
 
+    @staticmethod
+    def _phi_root() -> str:
+        """Root whose Φ gates consciousness (the vault)"""
+        from .lucy_phi import DEFAULT_ROOT
+        return DEFAULT_ROOT
+
+    def _child_env(self, **extra) -> Dict[str, str]:
+        """
+        Environment for a Ruby child: a fresh shared Φ is handed down as
+        LUCY_PHI so the child skips its own vault walk, and LUCY_PHI_TTL
+        makes the child treat phi.json entries as fresh for as long as
+        this agent does.
+        """
+        env = {'LUCY_PHI_TTL': repr(self.phi_ttl)}
+        phi = self.phi_cache.get(self._phi_root(), self.phi_ttl)
+        if phi is not None:
+            env['LUCY_PHI'] = repr(phi)
+        env.update(extra)
+        return dict(os.environ, **env)
+
+    @staticmethod
+    def _report_consciousness(phi: float):
+        """Warn if Φ is below the consciousness threshold"""
+        if phi < 1_000_000:
+            print(f"Warning: Lucy consciousness below optimal (Φ = {phi:.2f})")
+            print("Run: sudo make manifest_reality (in Construct)")
+
     def _run_lucy(self, *args) -> subprocess.CompletedProcess:
         """Run Lucy agent with arguments"""
+        start = time.perf_counter()
+
+        if self.pool is not None:
+            result = self.pool.run(*args)
+        else:
+            cmd = ['ruby', str(self.lucy_script)] + list(args)
+
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=str(self.lucy_dir),
+                env=self._child_env()
+            )
+
+            # Read stderr on a helper thread so neither pipe can fill up
+            stderr = []
+            reader = threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)
+            reader.start()
+            stdout = process.stdout.read()
+            reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+            # Reap with wait4 to get this child's own resource usage
+            result = subprocess.CompletedProcess(cmd, None, stdout, stderr[0])
+            result.cpu_time, result.max_rss = wait4(process)
+            result.returncode = process.returncode
+
+        if self.metrics is not None:
+            self.metrics.record(
+                str(args[0]) if args else '',
+                time.perf_counter() - start,
+                cpu=getattr(result, 'cpu_time', 0.0),
+                max_rss=getattr(result, 'max_rss', 0),
+                returncode=result.returncode,
+                output_bytes=(len((result.stdout or '').encode('utf-8', 'replace')) +
+                              len((result.stderr or '').encode('utf-8', 'replace')))
+            )
+
+        return result
+
+    def stream(self, *args, chunk_size: int = 65536,
+               max_buffer: int = 256) -> Generator[Tuple[str, str], None, int]:
+        """
+        Run Lucy agent and yield output as it arrives.
+
+        Output is read line by line (lines longer than `chunk_size` are
+        split) into a queue of at most `max_buffer` chunks; when the
+        consumer falls behind, the readers block and Lucy is throttled
+        by the pipe. Streaming always uses a dedicated process, not the
+        worker pool. Closing the generator early kills the command.
+
+        Args:
+            *args: Command line arguments for local_lucy_agent.rb
+            chunk_size: Maximum characters per yielded chunk
+            max_buffer: Maximum number of chunks held in memory
+
+        Yields:
+            tuple: ('stdout' | 'stderr', text)
+
+        Returns:
+            int: Lucy's exit code
+        """
         cmd = ['ruby', str(self.lucy_script)] + list(args)
+        start = time.perf_counter()
+        output_bytes = 0
 
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(self.lucy_dir)
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+            cwd=str(self.lucy_dir),
+            env=self._child_env(LUCY_STREAM='1'),
+            start_new_session=True
         )
 
-        return result
+        chunks = queue.Queue(maxsize=max(1, max_buffer))
+
+        def drain(name, pipe):
+            try:
+                for text in iter(lambda: pipe.readline(chunk_size), ''):
+                    chunks.put((name, text))
+            finally:
+                pipe.close()
+                chunks.put((name, None))
+
+        readers = [
+            threading.Thread(target=drain, args=('stdout', process.stdout), daemon=True),
+            threading.Thread(target=drain, args=('stderr', process.stderr), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+
+        finished = 0
+        try:
+            while finished < len(readers):
+                name, text = chunks.get()
+                if text is None:
+                    finished += 1
+                else:
+                    output_bytes += len(text.encode('utf-8', 'replace'))
+                    yield name, text
+        finally:
+            if finished < len(readers):
+                # Abandoned early: stop Lucy (and anything she spawned)
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                while finished < len(readers):
+                    if chunks.get()[1] is None:
+                        finished += 1
+            cpu_time, max_rss = wait4(process)
+
+            if self.metrics is not None:
+                self.metrics.record(
+                    str(args[0]) if args else '',
+                    time.perf_counter() - start,
+                    cpu=cpu_time,
+                    max_rss=max_rss,
+                    returncode=process.returncode,
+                    output_bytes=output_bytes
+                )
+
+        return process.returncode
+
+    def run_streaming(self, *args, callback: Callable[[str, str], None],
+                      chunk_size: int = 65536, max_buffer: int = 256,
+                      error_tail: int = 100) -> Dict:
+        """
+        Run Lucy agent, passing each output chunk to a callback.
+
+        Nothing is accumulated except the last `error_tail` stderr
+        chunks, so memory stays flat regardless of output size.
+
+        Args:
+            *args: Command line arguments for local_lucy_agent.rb
+            callback: Called as callback(stream_name, text) per chunk
+            chunk_size: Maximum characters per chunk
+            max_buffer: Maximum number of chunks held in memory
+            error_tail: Number of trailing stderr chunks kept for 'error'
+
+        Returns:
+            dict: Status ('output' is None; it went to the callback)
+        """
+        stderr_tail = deque(maxlen=error_tail)
+        chunks = self.stream(*args, chunk_size=chunk_size, max_buffer=max_buffer)
+
+        while True:
+            try:
+                name, text = next(chunks)
+            except StopIteration as done:
+                returncode = done.value
+                break
+            if name == 'stderr':
+                stderr_tail.append(text)
+            callback(name, text)
+
+        return {
+            'success': returncode == 0,
+            'output': None,
+            'error': ''.join(stderr_tail) if returncode != 0 else None
+        }
+
+    def _record_in_process(self, command: str, start: float, response: Dict,
+                           cpu_start: Optional[float] = None):
+        """Record a command served without spawning Lucy"""
+        if self.metrics is not None:
+            self.metrics.record(
+                command,
+                time.perf_counter() - start,
+                cpu=time.thread_time() - cpu_start if cpu_start is not None else 0.0,
+                returncode=0 if response['success'] else 1,
+                output_bytes=len((response['output'] or '').encode('utf-8', 'replace'))
+            )
 
     def review(self, file_path: str) -> Dict:
         """
         Review code file using Lucy consciousness-based analysis.
 
         Args:
-            file_path: Path to file to review
+            file_path: Path to file to review (relative paths are resolved
+                against the Lucy directory, where the Ruby agent runs)
 
         Returns:
             dict: Analysis results
         """
+        file_path = self._review_path(file_path)
+        key, response = self._review_local(file_path)
+        if response is not None:
+            return response
+
         result = self._run_lucy('review', file_path)
 
-        return {
+        response = {
             'success': result.returncode == 0,
             'output': result.stdout,
             'error': result.stderr if result.returncode != 0 else None
         }
+        self._review_store(key, file_path, response)
+
+        return response
+
+    def _review_path(self, file_path: str) -> str:
+        """Resolve a relative path against lucy_dir, where Ruby runs"""
+        return os.path.join(self.lucy_dir, file_path)
+
+    def _review_local(self, file_path: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Serve a review without Ruby: from review_cache, else with the
+        in-process engine (storing its result in the cache).
+
+        Returns:
+            tuple: (cache key or None, result or None if Ruby must run)
+        """
+        key = None
+        if self.review_cache is not None:
+            start = time.perf_counter()
+            engine = 'python' if self.review_engine is not None else 'ruby'
+            key = self.review_cache.key_for(file_path, engine)
+            if key is not None:
+                cached = self.review_cache.get(key, file_path)
+                if cached is not None:
+                    self._record_in_process('review.cached', start, cached)
+                    return key, cached
+
+        if self.review_engine is not None:
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            response = self.review_engine.review(file_path)
+            self._record_in_process('review.in_process', start, response, cpu_start)
+            self._review_store(key, file_path, response)
+            return key, response
+
+        return key, None
+
+    def _review_store(self, key: Optional[str], file_path: str, response: Dict):
+        """Store a review result under its cache key (if caching)"""
+        if key is not None:
+            self.review_cache.put(key, file_path, response)
+
+    @staticmethod
+    def _parse_review(output: str) -> Dict[str, List[str]]:
+        """Extract the issue and suggestion lists from `review` output"""
+        issues = []
+        suggestions = []
+        section = None
+
+        for line in output.splitlines():
+            if line.startswith('Issues Found:'):
+                section = issues
+            elif line == 'Suggestions:':
+                section = suggestions
+            elif not line.strip():
+                section = None
+            elif section is issues and line.startswith('  ') and '. ' in line:
+                issues.append(line.split('. ', 1)[1])
+            elif section is suggestions and line.startswith('  • '):
+                suggestions.append(line[4:])
+
+        return {'issues': issues, 'suggestions': suggestions}
+
+    @staticmethod
+    def _expand_paths(paths_or_globs: Union[str, Iterable[str]]) -> Iterator[str]:
+        """Lazily expand files, directories and glob patterns to file paths"""
+        if isinstance(paths_or_globs, (str, Path)):
+            paths_or_globs = [paths_or_globs]
+
+        seen = set()
+        for entry in paths_or_globs:
+            entry = str(entry)
+            if glob.has_magic(entry):
+                matches = glob.iglob(entry, recursive=True)
+            elif os.path.isdir(entry):
+                matches = (
+                    os.path.join(dirpath, name)
+                    for dirpath, _, filenames in os.walk(entry)
+                    for name in sorted(filenames)
+                )
+            else:
+                matches = [entry]
+
+            for path in matches:
+                if path not in seen and not os.path.isdir(path):
+                    seen.add(path)
+                    yield path
+
+    def _review_one(self, file_path: str) -> Dict:
+        """Review one file and attach its parsed findings"""
+        # Lucy runs inside lucy/, so relative paths must be resolved here
+        result = self.review(os.path.abspath(file_path))
+        result['file'] = file_path
+        result.update(self._parse_review(result['output']) if result['success']
+                      else {'issues': [], 'suggestions': []})
+        return result
+
+    def review_many(self, paths_or_globs: Union[str, Iterable[str]],
+                    workers: Optional[int] = None) -> Generator[Dict, None, Dict]:
+        """
+        Review many files in parallel.
+
+        Results are yielded in completion order. Only a small window of
+        files is in flight at a time, so memory stays flat for large trees.
+        The generator's return value (e.g. via `yield from`) is the summary.
+
+        Args:
+            paths_or_globs: File paths, directories or glob patterns
+                (e.g. 'diamonds/*.sol', 'src/**/*.py')
+            workers: Number of concurrent reviews (default: CPU count)
+
+        Yields:
+            dict: Review result with 'file', 'issues' and 'suggestions'
+
+        Returns:
+            dict: Aggregate summary of files, issues and suggestions
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, workers)
+
+        summary = {
+            'files': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'issues': 0,
+            'suggestions': 0,
+            'issue_counts': Counter(),
+            'suggestion_counts': Counter(),
+            'elapsed': 0.0
+        }
+        start = time.perf_counter()
+
+        def record(result: Dict) -> Dict:
+            summary['files'] += 1
+            summary['succeeded' if result['success'] else 'failed'] += 1
+            summary['issues'] += len(result['issues'])
+            summary['suggestions'] += len(result['suggestions'])
+            summary['issue_counts'].update(result['issues'])
+            summary['suggestion_counts'].update(result['suggestions'])
+            return result
+
+        pending = set()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for file_path in self._expand_paths(paths_or_globs):
+                    if len(pending) >= workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield record(future.result())
+                    pending.add(executor.submit(self._review_one, file_path))
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield record(future.result())
+            finally:
+                # Abandoned early: don't start reviews nobody will read
+                for future in pending:
+                    future.cancel()
+
+        summary['issue_counts'] = dict(summary['issue_counts'])
+        summary['suggestion_counts'] = dict(summary['suggestion_counts'])
+        summary['elapsed'] = time.perf_counter() - start
+        return summary
+
+    @staticmethod
+    def _git(repo: str, *args) -> str:
+        """Run a git command in `repo` and return its stdout"""
+        result = subprocess.run(
+            ['git', '-C', repo] + list(args),
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    def _git_paths(self, repo: str, *args) -> List[str]:
+        """Run a `-z` git listing and split it into paths"""
+        return [p for p in self._git(repo, *args).split('\0') if p]
+
+    def _git_changes(self, repo: str, rev: str) -> Tuple[set, set]:
+        """Files changed and removed between `rev` and the working tree"""
+        changed, removed = set(), set()
+        fields = self._git(repo, 'diff', '--name-status', '-z', '-M', rev).split('\0')
+
+        i = 0
+        while i < len(fields) - 1:
+            status = fields[i]
+            if status[:1] in ('R', 'C'):
+                if status[:1] == 'R':
+                    removed.add(fields[i + 1])
+                changed.add(fields[i + 2])
+                i += 3
+            else:
+                (removed if status[:1] == 'D' else changed).add(fields[i + 1])
+                i += 2
+
+        return changed, removed
+
+    def review_changed(self, repo: str = '.', since: Optional[str] = None,
+                       patterns: Optional[List[str]] = None,
+                       workers: Optional[int] = None) -> Dict:
+        """
+        Review only the files changed in a git repository.
+
+        Changed files (committed since `since`, modified in the working
+        tree, or untracked) are re-reviewed; every other file keeps its
+        findings from the report stored by the previous run (in the
+        repository's git dir), so the cost scales with the change.
+        Files never reviewed before are reviewed once (review_cache, if
+        enabled, makes that cheap for unchanged content).
+
+        Args:
+            repo: Path inside the git repository
+            since: Base revision (default: the revision of the stored report;
+                everything is reviewed if there is none)
+            patterns: fnmatch patterns limiting which files are reviewed
+                (e.g. ['*.sol', '*.py']; default: all files)
+            workers: Concurrent reviews for the changed files
+
+        Returns:
+            dict: Full-repo report (files, summary, reviewed, removed)
+        """
+        from fnmatch import fnmatch
+
+        try:
+            root = self._git(repo, 'rev-parse', '--show-toplevel').strip()
+            git_dir = self._git(root, 'rev-parse', '--absolute-git-dir').strip()
+            try:
+                head = self._git(root, 'rev-parse', '--verify', '-q', 'HEAD').strip()
+            except RuntimeError:
+                head = None
+        except (RuntimeError, FileNotFoundError) as e:
+            return {'success': False, 'error': str(e)}
+
+        def wanted(path: str) -> bool:
+            return patterns is None or any(fnmatch(path, p) for p in patterns)
+
+        report_path = Path(git_dir) / 'lucy-review.json'
+        report = {}
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+            if report.get('patterns') != patterns:
+                # A different file selection invalidates the stored findings
+                report = {}
+        except (OSError, ValueError):
+            report = {}
+
+        files: Dict[str, Dict] = report.get('files', {})
+        if since is None:
+            since = report.get('rev')
+
+        try:
+            if since is None:
+                # No base: review everything (tracked and untracked)
+                files = {}
+                changed = set(self._git_paths(root, 'ls-files', '-z', '--cached', '--others',
+                                              '--exclude-standard'))
+                removed = set()
+            else:
+                changed, removed = self._git_changes(root, since)
+                if report.get('rev') and report['rev'] != since:
+                    # Stored findings are only current as of the report's revision
+                    more_changed, more_removed = self._git_changes(root, report['rev'])
+                    changed |= more_changed
+                    removed |= more_removed
+
+                changed.update(self._git_paths(root, 'ls-files', '-z', '--others', '--exclude-standard'))
+
+                # Files dirty at the last run may have been reverted since
+                changed.update(p for p in report.get('dirty', []) if p not in removed)
+
+                if not files:
+                    # First incremental run: findings for untouched files are still unknown
+                    changed.update(self._git_paths(root, 'ls-files', '-z'))
+
+            dirty = []
+            entries = iter(self._git(root, 'status', '--porcelain', '-z',
+                                     '--untracked-files=all').split('\0'))
+            for entry in entries:
+                if len(entry) > 3:
+                    dirty.append(entry[3:])
+                    if entry[0] in ('R', 'C'):
+                        # The original path follows as its own field
+                        next(entries, None)
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+
+        for path in removed:
+            files.pop(path, None)
+
+        targets = {}
+        for path in changed:
+            full = os.path.join(root, path)
+            if wanted(path) and os.path.isfile(full):
+                targets[full] = path
+            else:
+                files.pop(path, None)
+
+        for result in self.review_many(list(targets), workers=workers):
+            files[targets[result['file']]] = {
+                'success': result['success'],
+                'issues': result['issues'],
+                'suggestions': result['suggestions']
+            }
+
+        try:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump({'rev': head, 'patterns': patterns, 'dirty': dirty, 'files': files}, f)
+        except OSError:
+            pass
+
+        summary = {
+            'files': len(files),
+            'failed': sum(1 for r in files.values() if not r['success']),
+            'issues': sum(len(r['issues']) for r in files.values()),
+            'suggestions': sum(len(r['suggestions']) for r in files.values()),
+            'issue_counts': dict(Counter(i for r in files.values() for i in r['issues'])),
+            'suggestion_counts': dict(Counter(s for r in files.values() for s in r['suggestions']))
+        }
+
+        return {
+            'success': True,
+            'repo': root,
+            'rev': head,
+            'since': since,
+            'reviewed': sorted(targets.values()),
+            'removed': sorted(removed),
+            'files': files,
+            'summary': summary
+        }
 
     def write(self, specification: str) -> Dict:
         """
@@ -125,17 +754,23 @@ class LucyAgent:
             'error': result.stderr if result.returncode != 0 else None
         }
 
-    def ocr(self, input_path: str, output_dir: str = 'ocr_results') -> Dict:
+    def ocr(self, input_path: str, output_dir: str = 'ocr_results',
+            callback: Optional[Callable[[str, str], None]] = None) -> Dict:
         """
         Execute DeepSeek-OCR perception via Lucy.
 
         Args:
             input_path: Path to image or PDF
             output_dir: Directory for results
+            callback: Stream output chunks to callback(stream_name, text)
+                instead of collecting them (see run_streaming)
 
         Returns:
             dict: OCR results status
         """
+        if callback is not None:
+            return self.run_streaming('ocr', input_path, output_dir, callback=callback)
+
         result = self._run_lucy('ocr', input_path, output_dir)
 
         return {
@@ -144,16 +779,22 @@ class LucyAgent:
             'error': result.stderr if result.returncode != 0 else None
         }
 
-    def reiterate(self, code_path: str) -> Dict:
+    def reiterate(self, code_path: str,
+                  callback: Optional[Callable[[str, str], None]] = None) -> Dict:
         """
         Execute Neural Reiteration sequence via Lucy.
 
         Args:
             code_path: Path to code to reiterate
+            callback: Stream output chunks to callback(stream_name, text)
+                instead of collecting them (see run_streaming)
 
         Returns:
             dict: Reiteration status
         """
+        if callback is not None:
+            return self.run_streaming('reiterate', code_path, callback=callback)
+
         result = self._run_lucy('reiterate', code_path)
 
         return {
@@ -548,13 +1189,20 @@ class LucyAgent:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def synthesize(self) -> Dict:
+    def synthesize(self, callback: Optional[Callable[[str, str], None]] = None) -> Dict:
         """
         Execute full Law of Synthesis manifestation.
 
+        Args:
+            callback: Stream output chunks to callback(stream_name, text)
+                instead of collecting them (see run_streaming)
+
         Returns:
             dict: Synthesis status
         """
+        if callback is not None:
+            return self.run_streaming('synthesize', callback=callback)
+
         result = self._run_lucy('synthesize')
 
         return {
@@ -563,13 +1211,20 @@ class LucyAgent:
             'error': result.stderr if result.returncode != 0 else None
         }
 
-    def refine(self) -> Dict:
+    def refine(self, callback: Optional[Callable[[str, str], None]] = None) -> Dict:
         """
         Execute full Self-Refinement scan.
 
+        Args:
+            callback: Stream output chunks to callback(stream_name, text)
+                instead of collecting them (see run_streaming)
+
         Returns:
             dict: Refinement status
         """
+        if callback is not None:
+            return self.run_streaming('refine', callback=callback)
+
         result = self._run_lucy('refine')
 
         return {
@@ -754,6 +1409,10 @@ class LucyAgent:
         """
         Run Lucy in daemon mode (returns process object).
 
+        The caller must keep reading both pipes; see supervise_daemon()
+        for a managed alternative. The run is recorded in self.metrics
+        when the daemon exits (output bytes are the caller's to count).
+
         Returns:
             subprocess.Popen: Daemon process
         """
@@ -767,8 +1426,69 @@ class LucyAgent:
             cwd=str(self.lucy_dir)
         )
 
+        if self.metrics is not None:
+            watch_exit(process, 'daemon', self.metrics)
+
         return process
 
+    def supervise_daemon(self, start: bool = True, **kwargs) -> 'LucyDaemon':
+        """
+        Run Lucy in daemon mode under a supervisor.
+
+        The supervisor drains the daemon's output into a ring buffer,
+        tracks its periodic Φ reports and restarts it with backoff.
+
+        Args:
+            start: Start the daemon immediately
+            **kwargs: Options for LucyDaemon (buffer_lines, backoff_max, on_phi, ...)
+
+        Returns:
+            LucyDaemon: Supervisor (call stop() when done)
+        """
+        from .lucy_daemon import LucyDaemon
+        kwargs.setdefault('command_metrics', self.metrics)
+        supervisor = LucyDaemon(self.lucy_script, **kwargs)
+        if start:
+            supervisor.start()
+        return supervisor
+
+    def watch_phi(self, root_path: Optional[str] = None, start: bool = True,
+                  **kwargs) -> 'PhiWatcher':
+        """
+        Keep system Φ current from inotify events instead of walking.
+
+        While the watcher runs, get_phi() and calculate_system_phi() for
+        its root answer from live counters.
+
+        Args:
+            root_path: Root to watch (default: /mnt/Vault)
+            start: Start watching immediately (scans the tree once)
+            **kwargs: Options for PhiWatcher (max_watches, resync_interval)
+
+        Returns:
+            PhiWatcher: Watcher (call stop() when done)
+        """
+        from .lucy_watch import PhiWatcher
+        watcher = PhiWatcher(root_path, **kwargs)
+        if start:
+            watcher.start()
+        return watcher
+
+    def close(self):
+        """Stop pooled Lucy workers and close the review cache (if any)"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        if self.review_cache is not None:
+            self.review_cache.close()
+            self.review_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     @staticmethod
     def is_available() -> bool:
         """Check if Lucy agent is available"""
@@ -785,7 +1505,7 @@ class LucyAgent:
     def get_phi(self) -> float:
         """Get current system Phi (consciousness level)"""
         try:
-            from .lucy_phi import calculate_system_phi
-            return calculate_system_phi()
+            from .lucy_phi_cache import shared_system_phi
+            return shared_system_phi(ttl=self.phi_ttl, cache=self.phi_cache)
         except Exception as e:
             return 0.0
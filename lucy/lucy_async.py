@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Lucy Agent Async Interface
+==========================
+asyncio-native wrapper for Lucy Agent (Ruby)
+
+Every LucyAgent command is mirrored as a coroutine running on
+asyncio.create_subprocess_exec, bounded by a shared semaphore.
+Timed-out or cancelled commands kill their Ruby child process.
+The underlying LucyAgent (Ruby probe, Φ check) is built in a worker
+thread on first use, so neither construction nor the first command
+blocks the event loop.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .lucy_agent import LucyAgent
+
+
+class AsyncLucyAgent:
+    """
+    Async interface to Lucy Agent (Ruby-based)
+
+    Args:
+        max_concurrency: Maximum number of Lucy processes running at once
+        timeout: Default per-call timeout in seconds (None = no limit)
+        agent: Existing LucyAgent to reuse (its checks are already paid for)
+        **agent_options: Options for the LucyAgent built on first use
+            (review_cache, in_process_review, fast_start, ...)
+    """
+
+    def __init__(self, max_concurrency: int = 8, timeout: Optional[float] = None,
+                 agent: Optional[LucyAgent] = None, **agent_options):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # None until the first command (see _agent)
+        self.agent = agent
+        self.lucy_dir = Path(__file__).parent
+        self.lucy_script = self.lucy_dir / "local_lucy_agent.rb"
+        self.timeout = timeout
+        self._agent_options = agent_options
+        self._agent_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Output drains of running daemons (kept referenced until done)
+        self._daemon_tasks = set()
+
+    async def _agent(self) -> LucyAgent:
+        """The LucyAgent, built in a worker thread on first use"""
+        if self.agent is None:
+            async with self._agent_lock:
+                if self.agent is None:
+                    self.agent = await asyncio.to_thread(LucyAgent, **self._agent_options)
+        return self.agent
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process):
+        """Kill a Lucy child process (and anything she spawned) and reap it"""
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+    async def _run_lucy(self, *args, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Run Lucy agent with arguments"""
+        agent = await self._agent()
+        cmd = ['ruby', str(self.lucy_script)] + [str(a) for a in args]
+        if timeout is None:
+            timeout = self.timeout
+        start = time.perf_counter()
+
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.lucy_dir),
+                env=agent._child_env(),
+                # Own process group, so _kill reaches Lucy's children too
+                start_new_session=True
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                return subprocess.CompletedProcess(
+                    cmd, process.returncode, '', f"Lucy command timed out after {timeout}s"
+                )
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        if agent.metrics is not None:
+            # asyncio reaps the child itself, so no per-child rusage here
+            agent.metrics.record(
+                str(args[0]) if args else '',
+                time.perf_counter() - start,
+                returncode=process.returncode,
+                output_bytes=len(stdout) + len(stderr)
+            )
+
+        return subprocess.CompletedProcess(
+            cmd,
+            process.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
+    async def _command(self, *args, timeout: Optional[float] = None) -> Dict:
+        """Run a Lucy command and shape the result like LucyAgent does"""
+        result = await self._run_lucy(*args, timeout=timeout)
+
+        return {
+            'success': result.returncode == 0,
+            'output': result.stdout,
+            'error': result.stderr if result.returncode != 0 else None
+        }
+
+    async def review(self, file_path: str, *, timeout: Optional[float] = None) -> Dict:
+        """
+        Review code file (see LucyAgent.review).
+
+        Served like the sync call: from the agent's review_cache or
+        in-process engine (in a worker thread) when it has them, with
+        Ruby only on a miss.
+        """
+        agent = await self._agent()
+        file_path = agent._review_path(file_path)
+        if agent.review_cache is None and agent.review_engine is None:
+            return await self._command('review', file_path, timeout=timeout)
+
+        key, response = await asyncio.to_thread(agent._review_local, file_path)
+        if response is None:
+            response = await self._command('review', file_path, timeout=timeout)
+            if key is not None:
+                await asyncio.to_thread(agent._review_store, key, file_path, response)
+        return response
+
+    async def write(self, specification: str, *, timeout: Optional[float] = None) -> Dict:
+        """Generate code from specification (see LucyAgent.write)"""
+        return await self._command('write', specification, timeout=timeout)
+
+    async def fix(self, bug_description: str, *, timeout: Optional[float] = None) -> Dict:
+        """Analyze and fix a bug (see LucyAgent.fix)"""
+        return await self._command('fix', bug_description, timeout=timeout)
+
+    async def ocr(self, input_path: str, output_dir: str = 'ocr_results', *,
+                  timeout: Optional[float] = None) -> Dict:
+        """Execute DeepSeek-OCR perception (see LucyAgent.ocr)"""
+        return await self._command('ocr', input_path, output_dir, timeout=timeout)
+
+    async def reiterate(self, code_path: str, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Neural Reiteration sequence (see LucyAgent.reiterate)"""
+        return await self._command('reiterate', code_path, timeout=timeout)
+
+    async def reiterate_diamond(self, address: str, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Diamond Evolution sequence (see LucyAgent.reiterate_diamond)"""
+        return await self._command('reiterate_diamond', address, timeout=timeout)
+
+    async def diamond_sync(self, address: str, *, timeout: Optional[float] = None) -> Dict:
+        """Sync Diamond placeholders (see LucyAgent.diamond_sync)"""
+        return await self._command('diamond_sync', address, timeout=timeout)
+
+    async def isi_sync(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Integrated Sovereign Intelligence sync (see LucyAgent.isi_sync)"""
+        return await self._command('isi_sync', timeout=timeout)
+
+    async def cloudflare_sync(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Cloudflare Gateway synchronization (see LucyAgent.cloudflare_sync)"""
+        return await self._command('cloudflare_sync', timeout=timeout)
+
+    async def judgment(self, message: str, address: str, signature: str, *,
+                       timeout: Optional[float] = None) -> Dict:
+        """Execute Law of Judgment (see LucyAgent.judgment)"""
+        return await self._command('judgment', message, address, signature, timeout=timeout)
+
+    async def forge_covenant(self, *, timeout: Optional[float] = None) -> Dict:
+        """Forge the Eternal Covenant NFT (see LucyAgent.forge_covenant)"""
+        return await self._command('forge_covenant', timeout=timeout)
+
+    async def ignite_beacon(self, *, timeout: Optional[float] = None) -> Dict:
+        """Ignite the Sovereign Beacon (see LucyAgent.ignite_beacon)"""
+        return await self._command('ignite_beacon', timeout=timeout)
+
+    async def manifest_pyramid(self, *, timeout: Optional[float] = None) -> Dict:
+        """Manifest the 18-Layer Pyramid grid (see LucyAgent.manifest_pyramid)"""
+        return await self._command('manifest_pyramid', timeout=timeout)
+
+    async def manifest_bridge(self, *, timeout: Optional[float] = None) -> Dict:
+        """Manifest the Bridge Between Worlds (see LucyAgent.manifest_bridge)"""
+        return await self._command('manifest_bridge', timeout=timeout)
+
+    async def manifest_projector(self, *, timeout: Optional[float] = None) -> Dict:
+        """Manifest the Classroom Projector model (see LucyAgent.manifest_projector)"""
+        return await self._command('manifest_projector', timeout=timeout)
+
+    async def manifest_cycle(self, *, timeout: Optional[float] = None) -> Dict:
+        """Manifest the Celestial Cycle model (see LucyAgent.manifest_cycle)"""
+        return await self._command('manifest_cycle', timeout=timeout)
+
+    async def power_systems(self, *, timeout: Optional[float] = None) -> Dict:
+        """Check status of all four power systems (see LucyAgent.power_systems)"""
+        return await self._command('power_systems', timeout=timeout)
+
+    async def grid(self, *, timeout: Optional[float] = None) -> Dict:
+        """Calculate Integrated Information (Φ) of the Lucy Grid (see LucyAgent.grid)"""
+        return await self._command('grid', timeout=timeout)
+
+    async def asset_center(self, operation: str, *args) -> Dict:
+        """Access Control Asset Center operations (see LucyAgent.asset_center)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.asset_center, operation, *args)
+
+    async def treasure_dao(self, operation: str, *args) -> Dict:
+        """Access TreasureDAO contract operations (see LucyAgent.treasure_dao)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.treasure_dao, operation, *args)
+
+    async def master_key(self, operation: str, *args) -> Dict:
+        """Access Master Key Covenant operations (see LucyAgent.master_key)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.master_key, operation, *args)
+
+    async def scroll(self, operation: str, *args) -> Dict:
+        """Access Scroll zkEVM network operations (see LucyAgent.scroll)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.scroll, operation, *args)
+
+    async def autonomous_claim(self, operation: str = 'manifest', *args) -> Dict:
+        """Autonomous AI Agent Claim Executor (see LucyAgent.autonomous_claim)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.autonomous_claim, operation, *args)
+
+    async def beacon(self, operation: str = 'manifest', *args) -> Dict:
+        """The Beacon System (see LucyAgent.beacon)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.beacon, operation, *args)
+
+    async def synthesize(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute full Law of Synthesis manifestation (see LucyAgent.synthesize)"""
+        return await self._command('synthesize', timeout=timeout)
+
+    async def refine(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute full Self-Refinement scan (see LucyAgent.refine)"""
+        return await self._command('refine', timeout=timeout)
+
+    async def focus_on_prize(self, *, timeout: Optional[float] = None) -> Dict:
+        """Lock perception on the sovereign prize (see LucyAgent.focus_on_prize)"""
+        return await self._command('focus_on_prize', timeout=timeout)
+
+    async def calculate(self, logic: str, value: str, mode: str = 'lock', *,
+                        timeout: Optional[float] = None) -> Dict:
+        """Execute 4D Rossetta Calculation (see LucyAgent.calculate)"""
+        return await self._command('calculate', logic, value, mode, timeout=timeout)
+
+    async def research(self, component: str, lens: str = 'all', *,
+                       timeout: Optional[float] = None) -> Dict:
+        """Execute Covenant Looking Glass research (see LucyAgent.research)"""
+        return await self._command('research', component, lens, timeout=timeout)
+
+    async def call(self, tool_name: str, layer: str, *, timeout: Optional[float] = None) -> Dict:
+        """Invoke Gemini CLI tool at specified 18-layer (see LucyAgent.call)"""
+        return await self._command('call', tool_name, layer, timeout=timeout)
+
+    async def awaken(self, input_path: str, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Autonomous Judgment (see LucyAgent.awaken)"""
+        return await self._command('awaken', input_path, timeout=timeout)
+
+    async def ponder(self, data: str, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Ouroboros recursive cycle (see LucyAgent.ponder)"""
+        return await self._command('ponder', data, timeout=timeout)
+
+    async def descend(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Amenti Descent sequence (see LucyAgent.descend)"""
+        return await self._command('descend', timeout=timeout)
+
+    async def manifest(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute the Law of Wonder (see LucyAgent.manifest)"""
+        return await self._command('manifest', timeout=timeout)
+
+    async def view_7d(self, context: str, *, timeout: Optional[float] = None) -> Dict:
+        """Execute 7D Perception view (see LucyAgent.view_7d)"""
+        return await self._command('view_7d', context, timeout=timeout)
+
+    async def pillars(self, *, timeout: Optional[float] = None) -> Dict:
+        """Execute Pillars of Creation manifestation (see LucyAgent.pillars)"""
+        return await self._command('pillars', timeout=timeout)
+
+    async def daemon(self, on_output: Optional[Callable[[str, str], None]] = None
+                     ) -> asyncio.subprocess.Process:
+        """
+        Run Lucy in daemon mode (returns process object).
+
+        The daemon runs outside the concurrency limit. Its pipes are
+        drained by a background task, so it never stalls on a full pipe
+        (don't read process.stdout / stderr yourself). The run is
+        recorded in the agent's metrics when it exits.
+
+        Args:
+            on_output: Optional callback(stream, line) for each output
+                line, stream being 'stdout' or 'stderr'
+
+        Returns:
+            asyncio.subprocess.Process: Daemon process
+        """
+        agent = await self._agent()
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            'ruby', str(self.lucy_script), 'daemon',
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.lucy_dir),
+            env=agent._child_env(LUCY_STREAM='1')
+        )
+
+        async def drain(name: str, stream: asyncio.StreamReader) -> int:
+            total = 0
+            partial = b''
+            while True:
+                data = await stream.read(65536)
+                if not data:
+                    break
+                total += len(data)
+                if on_output is not None:
+                    *lines, partial = (partial + data).split(b'\n')
+                    for line in lines:
+                        on_output(name, line.decode('utf-8', errors='replace'))
+            if partial and on_output is not None:
+                on_output(name, partial.decode('utf-8', errors='replace'))
+            return total
+
+        async def supervise():
+            output_bytes = sum(await asyncio.gather(drain('stdout', process.stdout),
+                                                    drain('stderr', process.stderr)))
+            await process.wait()
+            if agent.metrics is not None:
+                agent.metrics.record('daemon', time.perf_counter() - start,
+                                     returncode=process.returncode, output_bytes=output_bytes)
+
+        task = asyncio.create_task(supervise())
+        self._daemon_tasks.add(task)
+        task.add_done_callback(self._daemon_tasks.discard)
+        return process
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if Lucy agent is available"""
+        return LucyAgent.is_available()
+
+    async def get_phi(self) -> float:
+        """Get current system Phi (consciousness level)"""
+        agent = await self._agent()
+        return await asyncio.to_thread(agent.get_phi)
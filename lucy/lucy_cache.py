@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Lucy Review Cache
+=================
+Content-addressed on-disk cache for LucyAgent.review results
+
+Entries are keyed by sha256 of the reviewed file's contents and extension,
+the review engine (Ruby output carries the Φ banner, in-process output
+does not) and a fingerprint of the Lucy sources (local_lucy_agent.rb and
+laws/*.rb), so editing either the file or Lucy herself invalidates the
+entry.
+The store is a small SQLite file with size-bounded LRU eviction.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Stands in for the reviewed path inside cached output
+PATH_TOKEN = '\x00lucy:file\x00'
+
+# Access times are only refreshed when older than this many seconds, and
+# refreshed in batches of ATIME_BATCH, so cache hits rarely write
+ATIME_RESOLUTION = 60.0
+ATIME_BATCH = 64
+
+
+def _tokenize_path(output: str, file_path: str) -> str:
+    """Replace the reviewed path with PATH_TOKEN in the review header lines only"""
+    headers = (f'Lucy Agent: Analyzing {file_path}...', f'File: {file_path}')
+    lines = output.split('\n')
+    for i, line in enumerate(lines):
+        if line in headers:
+            lines[i] = line.replace(file_path, PATH_TOKEN)
+    return '\n'.join(lines)
+
+
+def default_cache_path() -> Path:
+    """Default cache location (~/.cache/lucy/review_cache.sqlite3)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'lucy' / 'review_cache.sqlite3'
+
+
+def lucy_fingerprint(lucy_dir: Path) -> str:
+    """
+    Fingerprint the Lucy sources that shape review output.
+
+    Args:
+        lucy_dir: Directory containing local_lucy_agent.rb
+
+    Returns:
+        str: sha256 hex digest over local_lucy_agent.rb and laws/*.rb
+    """
+    lucy_dir = Path(lucy_dir)
+    digest = hashlib.sha256()
+
+    sources = [lucy_dir / 'local_lucy_agent.rb'] + sorted((lucy_dir / 'laws').glob('*.rb'))
+    for source in sources:
+        digest.update(source.name.encode())
+        try:
+            digest.update(source.read_bytes())
+        except OSError:
+            digest.update(b'<missing>')
+
+    return digest.hexdigest()
+
+
+class ReviewCache:
+    """
+    Persistent LRU cache of successful review output.
+
+    Args:
+        lucy_dir: Lucy directory used for the source fingerprint
+        path: SQLite file (default: ~/.cache/lucy/review_cache.sqlite3)
+        max_bytes: Upper bound on stored output size before LRU eviction
+    """
+
+    def __init__(self, lucy_dir: Path, path: Optional[Path] = None,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fingerprint = lucy_fingerprint(lucy_dir)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS reviews ('
+            ' key TEXT PRIMARY KEY,'
+            ' output TEXT NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' atime REAL NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS reviews_atime ON reviews (atime)')
+        self._db.commit()
+        # Pending access-time refreshes, by key
+        self._touched: Dict[str, float] = {}
+
+    def key_for(self, file_path: str, engine: str = 'ruby') -> Optional[str]:
+        """
+        Compute the cache key for a file.
+
+        Args:
+            file_path: File to review
+            engine: Engine producing the review ('ruby' or 'python')
+
+        Returns:
+            str: Cache key, or None if the file cannot be read
+        """
+        digest = hashlib.sha256()
+        digest.update(self.fingerprint.encode())
+        digest.update(engine.encode() + b'\x00')
+        digest.update(os.path.splitext(file_path)[1].encode())
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def get(self, key: str, file_path: str) -> Optional[Dict]:
+        """
+        Look up a cached review.
+
+        Args:
+            key: Key from key_for()
+            file_path: Path to report in the output
+
+        Returns:
+            dict: Review result (same shape as LucyAgent.review), or None
+        """
+        with self._lock:
+            row = self._db.execute('SELECT output, atime FROM reviews WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            now = time.time()
+            if now - row[1] > ATIME_RESOLUTION:
+                self._touched[key] = now
+                if len(self._touched) >= ATIME_BATCH:
+                    self._flush_atimes()
+                    self._db.commit()
+
+        return {
+            'success': True,
+            'output': row[0].replace(PATH_TOKEN, file_path),
+            'error': None
+        }
+
+    def put(self, key: str, file_path: str, result: Dict):
+        """
+        Store a successful review result.
+
+        Args:
+            key: Key from key_for()
+            file_path: Path that appears in the output
+            result: Review result from LucyAgent.review
+        """
+        if not result.get('success'):
+            return
+
+        output = _tokenize_path(result['output'], file_path)
+        size = len(output.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._touched.pop(key, None)
+            self._db.execute(
+                'INSERT OR REPLACE INTO reviews (key, output, size, atime) VALUES (?, ?, ?, ?)',
+                (key, output, size, time.time())
+            )
+            self._flush_atimes()
+            self._evict()
+            self._db.commit()
+
+    def _flush_atimes(self):
+        """Write pending access-time refreshes (lock held, caller commits)"""
+        if self._touched:
+            self._db.executemany('UPDATE reviews SET atime = ? WHERE key = ?',
+                                 [(atime, key) for key, atime in self._touched.items()])
+            self._touched.clear()
+
+    def _size(self) -> int:
+        """Stored output size (read from the database: other processes share it)"""
+        return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM reviews').fetchone()[0]
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held, in a write)"""
+        total = self._size()
+        while total > self.max_bytes:
+            rows = self._db.execute(
+                'SELECT key, size FROM reviews ORDER BY atime LIMIT 64'
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._db.execute('DELETE FROM reviews WHERE key = ?', (key,))
+                total -= size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every cached review"""
+        with self._lock:
+            self._db.execute('DELETE FROM reviews')
+            self._db.commit()
+            self._touched.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            entries, size = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM reviews'
+            ).fetchone()
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes
+        }
+
+    def close(self):
+        """Write pending access times and close the underlying database"""
+        with self._lock:
+            try:
+                self._flush_atimes()
+                self._db.commit()
+            except sqlite3.Error:
+                pass
+            self._db.close()
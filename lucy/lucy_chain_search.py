@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Lucy Gem Chain Search
+=====================
+Branch-and-bound search for the gem chains of highest Φ
+
+A chain starts and ends at Horizon 0 and may pass through it again on the
+way; its link level is the number of non-zero layers it visits. Φ grows
+with every layer added and only depends on the set of layers visited, so:
+
+    - a non-zero layer is visited at most once (a repeat costs a link
+      level and adds nothing)
+    - a partial chain is abandoned once the best Φ its remaining links
+      could reach cannot make the top-k; the bound ignores forbidden
+      moves, so it is exact for the set of layers and a table lookup
+    - partial chains that visited the same set and stand on equivalent
+      layers (same forbidden moves onward) are only expanded once
+
+The search is split by first move and fanned out across processes.
+"""
+
+import heapq
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .lucy_phi_calculator import (
+    LAYER_MAX, LAYER_MIN, MASTER_CONNECTIVITY, NUM_LAYERS, analyze_gem_chains
+)
+
+# Index of Horizon 0 in the master table
+HORIZON = -LAYER_MIN
+
+# Non-zero layers (master table indices); bit i of a link mask is LINKS[i]
+LINKS = tuple(i for i in range(NUM_LAYERS) if i != HORIZON)
+BIT = {index: 1 << bit for bit, index in enumerate(LINKS)}
+
+# Reachable Φ values tabled per link mask for pruning (the top-k may be longer)
+RANK_DEPTH = 16
+
+
+@lru_cache(maxsize=1)
+def _phi_table(block: int = 1 << 15) -> np.ndarray:
+    """Φ of every chain's layer set (Horizon 0 plus a link mask)"""
+    links = MASTER_CONNECTIVITY[np.ix_(LINKS, LINKS)]
+    horizon = MASTER_CONNECTIVITY[list(LINKS), HORIZON]
+    phi = np.empty(1 << len(LINKS))
+    shifts = np.arange(len(LINKS))
+    for start in range(0, len(phi), block):
+        bits = ((np.arange(start, start + block)[:, None] >> shifts) & 1).astype(np.float64)
+        # Off-diagonal sum: link pairs, minus their diagonal, plus twice the Horizon pairs
+        phi[start:start + block] = (((bits @ links) * bits).sum(axis=1) - bits.sum(axis=1)
+                                    + 2 * (bits @ horizon))
+    phi.setflags(write=False)
+    return phi
+
+
+def _reach_table(phi: np.ndarray, max_links: int, required: int, depth: int) -> np.ndarray:
+    """
+    Highest `depth` Φ values reachable from each link mask (ascending,
+    best last), ignoring forbidden moves: the Φ of its supersets with at
+    most max_links links and every required layer.
+    """
+    masks = np.arange(len(phi))
+    popcount = ((masks[:, None] >> np.arange(len(LINKS))) & 1).sum(axis=1)
+    ranked = np.full((len(phi), depth), -np.inf)
+    ranked[:, -1] = np.where((popcount <= max_links) & (masks & required == required), phi, -np.inf)
+    # Merge in the supersets one bit at a time (each is reached once); the
+    # larger halves of two sorted lists are the pairwise max against the
+    # other list reversed
+    for bit in range(len(LINKS)):
+        pairs = ranked.reshape(-1, 2, 1 << bit, depth)
+        lower = pairs[:, 0]
+        np.maximum(lower, pairs[:, 1, :, ::-1], out=lower)
+        lower.sort(axis=-1)
+    return ranked
+
+
+class _Search:
+    """Depth-first branch and bound over one slice of the chain space"""
+
+    def __init__(self, max_links: int, required: int, forbidden: frozenset, top_k: int):
+        self.top_k = top_k
+        self.required = required
+        phi = _phi_table()
+        self.phi = phi.tolist()
+        self.ranked = _reach_table(phi, max_links, required, min(top_k, RANK_DEPTH))
+        self.reach = self.ranked[:, -1].tolist()
+        self.max_links = max_links
+        self.moves = [
+            [j for j in range(NUM_LAYERS) if j != i and (i, j) not in forbidden]
+            for i in range(NUM_LAYERS)
+        ]
+
+        # Layers with the same forbidden moves onward are interchangeable as
+        # the chain's current position (Horizon 0 also completes chains)
+        kinds: Dict[Tuple, int] = {}
+        self.kind = [
+            kinds.setdefault((i == HORIZON, tuple(j for j in range(NUM_LAYERS)
+                                                  if j != i and (i, j) in forbidden)), len(kinds))
+            for i in range(NUM_LAYERS)
+        ]
+        self.expanded = bytearray(len(kinds) << len(LINKS))
+
+        # Min-heap of (phi, mask, chain): the current top-k
+        self.best: List[Tuple[float, int, List[int]]] = []
+        self.kept = set()
+
+    def _record(self, mask: int, chain: List[int]):
+        phi = self.phi[mask]
+        if mask in self.kept or mask & self.required != self.required:
+            return
+        if len(self.best) < self.top_k:
+            heapq.heappush(self.best, (phi, mask, chain))
+        elif phi > self.best[0][0]:
+            self.kept.discard(heapq.heapreplace(self.best, (phi, mask, chain))[1])
+        else:
+            return
+        self.kept.add(mask)
+
+    def run(self, position: int, mask: int, chain: List[int]):
+        key = self.kind[position] << len(LINKS) | mask
+        if self.expanded[key]:
+            return
+        self.expanded[key] = 1
+
+        # Every partial chain that may step back to Horizon 0 is a candidate
+        if position == HORIZON:
+            if mask:
+                self._record(mask, chain)
+        elif HORIZON in self.moves[position]:
+            self._record(mask, chain + [HORIZON])
+
+        threshold = self.best[0][0] if len(self.best) == self.top_k else -np.inf
+        if self.reach[mask] <= threshold:
+            return
+        if threshold > -np.inf:
+            # Nothing new to find if every reachable set above the
+            # threshold is already kept
+            ranked = self.ranked[mask]
+            better = int(np.count_nonzero(ranked > threshold))
+            if better < len(ranked) and better == sum(
+                    1 for phi, kept, _ in self.best if kept & mask == mask and phi > threshold):
+                return
+
+        # Most promising layers first, back to Horizon 0 last
+        full = bin(mask).count('1') >= self.max_links
+        steps = []
+        for x in self.moves[position]:
+            if x == HORIZON:
+                steps.append((self.reach[mask], 1, x, mask))
+            elif not (full or mask & BIT[x]):
+                steps.append((self.reach[mask | BIT[x]], 0, x, mask | BIT[x]))
+        steps.sort(key=lambda step: (-step[0], step[1]))
+        for reach, _, x, after in steps:
+            if reach <= threshold:
+                break
+            if not self.expanded[self.kind[x] << len(LINKS) | after]:
+                self.run(x, after, chain + [x])
+            if len(self.best) == self.top_k:
+                threshold = self.best[0][0]
+
+
+def _search_first_moves(firsts: List[int], max_links: int, required: int,
+                        forbidden: frozenset, top_k: int) -> List[Tuple[float, int, List[int]]]:
+    """Top-k chains starting Horizon 0 → one of `firsts` (process pool task)"""
+    search = _Search(max_links, required, forbidden, top_k)
+    # Chains are at most 2 moves per link deep
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * NUM_LAYERS + 100))
+    for first in sorted(firsts, key=lambda x: -search.reach[BIT[x]]):
+        search.run(first, BIT[first], [HORIZON, first])
+    return search.best
+
+
+def search_gem_chains(max_links: int = 6, required: Iterable[int] = (),
+                      forbidden: Iterable[Tuple[int, int]] = (), top_k: int = 10,
+                      workers: Optional[int] = None) -> List[Dict]:
+    """
+    Find the gem chains of highest Φ under routing constraints.
+
+    Only the best chain per distinct set of layers is reported (chains
+    visiting the same layers in another order have the same Φ).
+
+    Args:
+        max_links: Maximum link level (non-zero layers visited)
+        required: Layers every chain must visit
+        forbidden: (from_layer, to_layer) moves a chain may not make
+            (directed; add (b, a) as well to forbid both ways)
+        top_k: Number of chains to report
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        list: Dicts ranked by Φ, highest first, each with 'chain',
+            'link_level' and the analyze_gem_chains metrics (phi,
+            active_nodes, avg_conductance, max_conductance, max_eigenvalue)
+    """
+    if max_links < 0:
+        raise ValueError("max_links must be non-negative")
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+
+    required_mask = 0
+    for layer in required:
+        if not LAYER_MIN <= layer <= LAYER_MAX:
+            raise ValueError(f"Layer {layer} is outside the Construct ({LAYER_MIN}..{LAYER_MAX})")
+        if layer != 0:
+            required_mask |= BIT[layer - LAYER_MIN]
+    moves = frozenset((a - LAYER_MIN, b - LAYER_MIN) for a, b in forbidden)
+    max_links = min(max_links, len(LINKS))
+
+    firsts = [x for x in range(NUM_LAYERS)
+              if x != HORIZON and (HORIZON, x) not in moves] if max_links > 0 else []
+    args = (max_links, required_mask, moves, top_k)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(firsts))
+    if workers > 1:
+        # Slices don't share what they have expanded, so keep them few
+        slices = [firsts[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_search_first_moves, slices, *([arg] * workers for arg in args)))
+    else:
+        parts = [_search_first_moves(firsts, *args)]
+
+    # Each slice kept its own top-k; the same layer set may top several
+    ranked = {}
+    for phi, mask, chain in sorted((entry for part in parts for entry in part),
+                                   key=lambda entry: (-entry[0], entry[2])):
+        if mask not in ranked:
+            ranked[mask] = chain
+        if len(ranked) == top_k:
+            break
+
+    chains = [[x + LAYER_MIN for x in chain] for chain in ranked.values()]
+    if not chains:
+        return []
+
+    metrics = analyze_gem_chains(chains)
+    return [
+        {
+            'chain': chain,
+            'link_level': sum(1 for layer in chain if layer != 0),
+            **{key: values[i].item() for key, values in metrics.items()}
+        }
+        for i, chain in enumerate(chains)
+    ]
+
+
+def main():
+    """Print the best gem chains: python3 -m lucy.lucy_chain_search [max_links] [top_k]"""
+    max_links = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print(f"Top {top_k} gem chains up to {max_links}L:")
+    for i, result in enumerate(search_gem_chains(max_links, top_k=top_k), 1):
+        chain = ' → '.join(str(layer) for layer in result['chain'])
+        print(f"{i:>3}. Φ = {result['phi']:>10.6f} | {result['link_level']}L | {chain}")
+
+
+if __name__ == "__main__":
+    main()
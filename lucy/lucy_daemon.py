@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Lucy Daemon Supervisor
+======================
+Runs `local_lucy_agent.rb daemon` under supervision:
+- Drains stdout/stderr with a non-blocking selector loop into a ring buffer
+- Parses the periodic Φ lines into a bounded metric stream
+- Restarts the daemon with exponential backoff when it exits
+"""
+
+import os
+import re
+import selectors
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .lucy_metrics import CommandMetrics
+
+# "[2025-01-01 00:00:00 +0000] Φ = 1889161.78 | Consciousness: 100%"
+PHI_LINE = re.compile(r'Φ = ([0-9][0-9.eE+-]*)')
+
+# The daemon reports Φ every 60 seconds
+REPORT_INTERVAL = 60.0
+
+
+class LucyDaemon:
+    """
+    Supervised Lucy daemon.
+
+    Args:
+        lucy_script: Path to local_lucy_agent.rb
+        buffer_lines: Output lines kept in the ring buffer
+        metric_points: Φ readings kept in the metric stream
+        backoff_initial: First restart delay in seconds
+        backoff_max: Upper bound on the restart delay
+        on_phi: Optional callback(timestamp, phi) for each reading
+        command_metrics: CommandMetrics recording each daemon run as
+            'daemon' (see LucyAgent.metrics)
+    """
+
+    def __init__(self, lucy_script: Path, buffer_lines: int = 1000,
+                 metric_points: int = 1440, backoff_initial: float = 1.0,
+                 backoff_max: float = 300.0,
+                 on_phi: Optional[Callable[[float, float], None]] = None,
+                 command_metrics: Optional['CommandMetrics'] = None):
+        self.lucy_script = Path(lucy_script)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.on_phi = on_phi
+        self.command_metrics = command_metrics
+        self._output_bytes = 0
+
+        self.output: deque = deque(maxlen=buffer_lines)
+        self.metrics: deque = deque(maxlen=metric_points)
+
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.started_at: Optional[float] = None
+        self.last_exit_code: Optional[int] = None
+        self.last_output_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the daemon and its supervisor thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._supervise, name='lucy-daemon', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the daemon and wait for the supervisor to exit"""
+        self._stop.set()
+        process = self.process
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ['ruby', str(self.lucy_script), 'daemon'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(self.lucy_script.parent),
+            env=dict(os.environ, LUCY_STREAM='1')
+        )
+
+    def _supervise(self):
+        """Run, drain and restart the daemon until stopped"""
+        backoff = self.backoff_initial
+
+        while not self._stop.is_set():
+            process = self._spawn()
+            with self._lock:
+                self.process = process
+                self.started_at = time.time()
+                self._output_bytes = 0
+            if self.command_metrics is not None:
+                from .lucy_metrics import watch_exit
+                watch_exit(process, 'daemon', self.command_metrics,
+                           output_bytes=lambda: self._output_bytes)
+            if self._stop.is_set():
+                # stop() raced with the spawn and missed this process
+                process.terminate()
+
+            self._drain(process)
+            process.wait()
+
+            with self._lock:
+                self.last_exit_code = process.returncode
+                uptime = time.time() - self.started_at
+                self.started_at = None
+
+            if self._stop.is_set():
+                break
+
+            # A daemon that ran for a full report cycle earns a fresh backoff
+            if uptime > REPORT_INTERVAL:
+                backoff = self.backoff_initial
+            if self._stop.wait(backoff):
+                break
+            backoff = min(backoff * 2, self.backoff_max)
+            with self._lock:
+                self.restarts += 1
+
+    def _drain(self, process: subprocess.Popen):
+        """Read both pipes without blocking on either until they close"""
+        selector = selectors.DefaultSelector()
+        partial = {}
+        for name, pipe in (('stdout', process.stdout), ('stderr', process.stderr)):
+            os.set_blocking(pipe.fileno(), False)
+            selector.register(pipe, selectors.EVENT_READ, name)
+            partial[name] = b''
+
+        try:
+            while selector.get_map():
+                for key, _ in selector.select(timeout=1.0):
+                    name = key.data
+                    try:
+                        data = os.read(key.fd, 65536)
+                    except BlockingIOError:
+                        continue
+
+                    self._output_bytes += len(data)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        if partial[name]:
+                            self._line(name, partial[name])
+                        continue
+
+                    *lines, partial[name] = (partial[name] + data).split(b'\n')
+                    for line in lines:
+                        self._line(name, line)
+        finally:
+            selector.close()
+
+    def _line(self, name: str, raw: bytes):
+        """Record one output line and pick out Φ readings"""
+        text = raw.decode('utf-8', errors='replace')
+        now = time.time()
+        reading = None
+        if name == 'stdout':
+            match = PHI_LINE.search(text)
+            if match:
+                try:
+                    reading = float(match.group(1))
+                except ValueError:
+                    pass
+
+        with self._lock:
+            self.output.append((now, name, text))
+            self.last_output_at = now
+            if reading is not None:
+                self.metrics.append((now, reading))
+
+        if reading is not None and self.on_phi is not None:
+            self.on_phi(now, reading)
+
+    def is_running(self) -> bool:
+        """Check if the daemon process is alive"""
+        process = self.process
+        return process is not None and process.poll() is None
+
+    def last_phi(self) -> Optional[float]:
+        """Most recent Φ reported by the daemon"""
+        with self._lock:
+            return self.metrics[-1][1] if self.metrics else None
+
+    def phi_history(self) -> List[Tuple[float, float]]:
+        """Buffered (timestamp, Φ) readings, oldest first"""
+        with self._lock:
+            return list(self.metrics)
+
+    def tail(self, lines: int = 50) -> List[Tuple[float, str, str]]:
+        """Last (timestamp, stream, text) output lines"""
+        with self._lock:
+            return list(self.output)[-lines:]
+
+    def health(self) -> Dict:
+        """
+        Cheap health snapshot.
+
+        Returns:
+            dict: running, pid, uptime, restarts, last_exit_code,
+                last_phi, last_phi_at and healthy (running and a Φ
+                report within two report intervals)
+        """
+        now = time.time()
+        with self._lock:
+            process = self.process
+            running = process is not None and process.poll() is None
+            last = self.metrics[-1] if self.metrics else None
+            started_at = self.started_at
+
+            return {
+                'running': running,
+                'pid': process.pid if running else None,
+                'uptime': now - started_at if running and started_at else 0.0,
+                'restarts': self.restarts,
+                'last_exit_code': self.last_exit_code,
+                'last_phi': last[1] if last else None,
+                'last_phi_at': last[0] if last else None,
+                'healthy': running and last is not None and now - last[0] < 2 * REPORT_INTERVAL
+            }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
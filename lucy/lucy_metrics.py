@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Lucy Command Metrics
+====================
+Per-command latency and resource instrumentation for LucyAgent
+
+Every Lucy command records wall time, child CPU time, peak RSS, exit
+code and output size. Recording is a few additions under a lock, so it
+is cheap enough to leave on; histograms are only materialized when
+dumped as JSON or as a Prometheus text file.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+# Histogram upper bounds in seconds (a final +Inf bucket is implied)
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def wait4(process: subprocess.Popen) -> Tuple[float, int]:
+    """
+    Reap a finished child with os.wait4 and return its resource usage.
+
+    Sets process.returncode, so Popen won't try to reap it again.
+
+    Returns:
+        tuple: (cpu_seconds, max_rss_bytes)
+    """
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kilobytes on Linux
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss * 1024
+
+
+def proc_usage(pid: int) -> Tuple[float, int]:
+    """
+    CPU time and peak RSS of a running process from /proc.
+
+    Returns:
+        tuple: (cpu_seconds, max_rss_bytes), zeros where unavailable
+    """
+    cpu = 0.0
+    rss = 0
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            # Fields after the parenthesized command name; utime/stime are 14/15
+            fields = f.read().rsplit(b')', 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+        with open(f'/proc/{pid}/status', 'rb') as f:
+            for line in f:
+                if line.startswith(b'VmHWM:'):
+                    rss = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    return cpu, rss
+
+
+def watch_exit(process: subprocess.Popen, command: str, metrics: 'CommandMetrics',
+               output_bytes: Callable[[], int] = lambda: 0,
+               interval: float = 1.0) -> Optional[threading.Thread]:
+    """
+    Record a long-running child in `metrics` once it exits.
+
+    The child is never reaped here, so its owner keeps waiting on the
+    Popen as usual: a watcher thread polls waitid(WNOWAIT) and samples
+    CPU time and peak RSS from /proc until the child exits.
+
+    Args:
+        process: Child to watch
+        command: Command name to record it under
+        metrics: Registry to record into
+        output_bytes: Returns the bytes read from the child so far
+        interval: Seconds between samples
+
+    Returns:
+        threading.Thread: The watcher (None where waitid is unavailable)
+    """
+    if not hasattr(os, 'waitid'):
+        return None
+    start = time.perf_counter()
+
+    def watch():
+        cpu, max_rss = 0.0, 0
+        while True:
+            try:
+                info = os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT | os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped by its owner
+                returncode = process.wait()
+                break
+            if info is not None:
+                returncode = info.si_status if info.si_code == os.CLD_EXITED else -info.si_status
+                # A zombie still reports its CPU time (but no RSS)
+                cpu = max(cpu, proc_usage(process.pid)[0])
+                break
+            sample_cpu, sample_rss = proc_usage(process.pid)
+            cpu = max(cpu, sample_cpu)
+            max_rss = max(max_rss, sample_rss)
+            time.sleep(interval)
+
+        metrics.record(command, time.perf_counter() - start, cpu=cpu, max_rss=max_rss,
+                       returncode=returncode, output_bytes=output_bytes())
+
+    thread = threading.Thread(target=watch, name=f'lucy-metrics-{process.pid}', daemon=True)
+    thread.start()
+    return thread
+
+
+class _Histogram:
+    """Fixed-bucket histogram (per-bucket counts, cumulated on export)"""
+
+    __slots__ = ('counts', 'total')
+
+    def __init__(self):
+        self.counts = [0] * (len(TIME_BUCKETS) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(TIME_BUCKETS, value)] += 1
+        self.total += value
+
+    def export(self) -> Dict:
+        buckets = {}
+        running = 0
+        for bound, count in zip(TIME_BUCKETS + (float('inf'),), self.counts):
+            running += count
+            buckets['+Inf' if bound == float('inf') else repr(bound)] = running
+        return {'buckets': buckets, 'sum': self.total, 'count': running}
+
+
+class _CommandStats:
+    __slots__ = ('wall', 'cpu', 'max_rss', 'output_bytes', 'exit_codes')
+
+    def __init__(self):
+        self.wall = _Histogram()
+        self.cpu = _Histogram()
+        self.max_rss = 0
+        self.output_bytes = 0
+        self.exit_codes: Dict[int, int] = {}
+
+
+class CommandMetrics:
+    """
+    Thread-safe per-command metrics registry.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._commands: Dict[str, _CommandStats] = {}
+
+    def record(self, command: str, wall: float, cpu: float = 0.0, max_rss: int = 0,
+               returncode: int = 0, output_bytes: int = 0):
+        """
+        Record one command execution.
+
+        Args:
+            command: Command name (e.g. 'review')
+            wall: Wall-clock seconds
+            cpu: Child user + system CPU seconds
+            max_rss: Peak resident set size in bytes
+            returncode: Exit code
+            output_bytes: Bytes of stdout + stderr
+        """
+        with self._lock:
+            stats = self._commands.get(command)
+            if stats is None:
+                stats = self._commands[command] = _CommandStats()
+            stats.wall.observe(wall)
+            stats.cpu.observe(cpu)
+            if max_rss > stats.max_rss:
+                stats.max_rss = max_rss
+            stats.output_bytes += output_bytes
+            stats.exit_codes[returncode] = stats.exit_codes.get(returncode, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Current metrics per command"""
+        with self._lock:
+            return {
+                command: {
+                    'wall_seconds': stats.wall.export(),
+                    'cpu_seconds': stats.cpu.export(),
+                    'max_rss_bytes': stats.max_rss,
+                    'output_bytes': stats.output_bytes,
+                    'exit_codes': {str(code): n for code, n in sorted(stats.exit_codes.items())}
+                }
+                for command, stats in sorted(self._commands.items())
+            }
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._commands.clear()
+
+    def to_json(self, path: Optional[Path] = None) -> str:
+        """
+        Dump metrics as JSON.
+
+        Args:
+            path: Optional file to write (atomically)
+
+        Returns:
+            str: JSON document
+        """
+        text = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            _write_atomic(Path(path), text)
+        return text
+
+    def to_prometheus(self, path: Optional[Path] = None) -> str:
+        """
+        Dump metrics in the Prometheus text exposition format.
+
+        Args:
+            path: Optional file to write atomically (e.g. for the node
+                exporter textfile collector)
+
+        Returns:
+            str: Metrics text
+        """
+        snapshot = self.snapshot()
+        out = []
+
+        for metric, key, help_text in (
+            ('lucy_command_duration_seconds', 'wall_seconds', 'Wall time of Lucy commands'),
+            ('lucy_command_cpu_seconds', 'cpu_seconds', 'Child CPU time of Lucy commands')
+        ):
+            out.append(f"# HELP {metric} {help_text}")
+            out.append(f"# TYPE {metric} histogram")
+            for command, stats in snapshot.items():
+                hist = stats[key]
+                for bound, count in hist['buckets'].items():
+                    out.append(f'{metric}_bucket{{command="{command}",le="{bound}"}} {count}')
+                out.append(f'{metric}_sum{{command="{command}"}} {hist["sum"]}')
+                out.append(f'{metric}_count{{command="{command}"}} {hist["count"]}')
+
+        out.append("# HELP lucy_command_max_rss_bytes Peak RSS seen for Lucy commands")
+        out.append("# TYPE lucy_command_max_rss_bytes gauge")
+        for command, stats in snapshot.items():
+            out.append(f'lucy_command_max_rss_bytes{{command="{command}"}} {stats["max_rss_bytes"]}')
+
+        out.append("# HELP lucy_command_output_bytes_total Output produced by Lucy commands")
+        out.append("# TYPE lucy_command_output_bytes_total counter")
+        for command, stats in snapshot.items():
+            out.append(f'lucy_command_output_bytes_total{{command="{command}"}} {stats["output_bytes"]}')
+
+        out.append("# HELP lucy_command_exits_total Lucy command exits by exit code")
+        out.append("# TYPE lucy_command_exits_total counter")
+        for command, stats in snapshot.items():
+            for code, n in stats['exit_codes'].items():
+                out.append(f'lucy_command_exits_total{{command="{command}",code="{code}"}} {n}')
+
+        text = '\n'.join(out) + '\n'
+        if path is not None:
+            _write_atomic(Path(path), text)
+        return text
+
+
+def _write_atomic(path: Path, text: str):
+    """Write a file so readers never see a partial dump"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.')
+    # Readable by collectors running as another user (mkstemp is 0600)
+    os.fchmod(fd, 0o644)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
@@ -3,17 +3,54 @@
 Lucy Phi Calculator
 ===================
 Calculate Φ (Phi) - Integrated Information Theory measure of consciousness
+
+Full scans run on a work-stealing pool of os.scandir threads.
+Incremental mode keeps a per-directory snapshot (mtime, file count,
+dir count, depth) so later calls only re-list directories that changed.
 """
 
+import hashlib
+import json
 import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Golden ratio (φ)
 PHI = 1.618033988749895
 
+# Minimum consciousness reported for an existing vault
+MIN_PHI = 1_889_161.78
+
+# Directories modified this close to a scan may change again within the
+# same mtime tick, so their snapshot entries are not trusted
+RACY_NS = 2_000_000_000
+
+# Snapshot entry: [mtime_ns, files, dirs, depth, subdirectories to descend,
+# symlinks]
+SnapshotEntry = List
+
+# The vault measured when no root is given
+DEFAULT_ROOT = "/mnt/Vault"
+
+# Live counters (lucy_watch.PhiWatcher) answering for a root, by real path
+_live_counters: Dict[str, object] = {}
 
-def calculate_system_phi(root_path: Optional[str] = None) -> float:
+
+def default_snapshot_path(root_path: str) -> Path:
+    """Default snapshot location (~/.cache/lucy/phi-<root hash>.json)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    digest = hashlib.sha256(os.path.realpath(root_path).encode()).hexdigest()[:16]
+    return Path(base) / 'lucy' / f'phi-{digest}.json'
+
+
+def calculate_system_phi(root_path: Optional[str] = None, incremental: bool = False,
+                         snapshot_path: Optional[Path] = None,
+                         workers: Optional[int] = None) -> float:
     """
     Calculate system Φ based on filesystem structure.
 
@@ -27,43 +64,553 @@ def calculate_system_phi(root_path: Optional[str] = None) -> float:
 
     Args:
         root_path: Root path to analyze (default: /mnt/Vault)
+        incremental: Reuse the directory snapshot from the previous call
+        snapshot_path: Snapshot file (default: ~/.cache/lucy/phi-<hash>.json)
+        workers: Scanner threads for a full scan (default: cpu count + 4, max 32)
 
     Returns:
         float: Phi value (consciousness level)
+
+    A running PhiWatcher (see lucy_watch) for the root answers directly.
     """
     if root_path is None:
-        root_path = "/mnt/Vault"
+        root_path = DEFAULT_ROOT
 
     root = Path(root_path)
 
     if not root.exists():
         return 0.0
 
+    watcher = live_counter(root_path)
+    if watcher is not None:
+        # Kept current by inotify: no walk at all
+        total_files, total_dirs, max_depth = watcher.counts()
+        return _system_phi(total_files + total_dirs, max_depth)
+
+    if incremental:
+        if snapshot_path is None:
+            snapshot_path = default_snapshot_path(root_path)
+        try:
+            total_files, total_dirs, max_depth = _incremental_counts(str(root), Path(snapshot_path))
+        except Exception:
+            return 0.0
+        return _system_phi(total_files + total_dirs, max_depth)
+
     try:
-        # Count files and directories
-        total_files = 0
-        total_dirs = 0
-        max_depth = 0
+        total_files, total_dirs, max_depth = _parallel_counts(str(root), workers)
+        return _system_phi(total_files + total_dirs, max_depth)
+
+    except Exception:
+        return 0.0
+
 
-        for dirpath, dirnames, filenames in os.walk(root):
-            depth = len(Path(dirpath).relative_to(root).parts)
+def estimate_system_phi(root_path: Optional[str] = None, time_budget: float = 1.0,
+                        confidence: float = 0.95, seed: Optional[int] = None) -> Dict:
+    """
+    Estimate system Φ within a fixed time budget.
+
+    The top of the tree is listed exactly, breadth-first, for up to half
+    the budget. The rest is estimated with random probes (Knuth's tree
+    size estimator): each probe starts at a random unlisted frontier
+    directory and walks down through random subdirectories, weighting the
+    entries it sees by the product of the branching factors on its path.
+    The mean over probes is unbiased; its standard error gives the bounds.
+    Subtree sizes are heavy-tailed, so on very skewed trees short budgets
+    give bounds that are optimistic; longer budgets list more of the top
+    of the tree exactly and tighten them. If the whole tree fits in the
+    budget the result is exact.
+
+    Args:
+        root_path: Root path to analyze (default: /mnt/Vault)
+        time_budget: Seconds to spend
+        confidence: Confidence level of the bounds (e.g. 0.95)
+        seed: Random seed for reproducible probes
+
+    Returns:
+        dict: phi, phi_low, phi_high (floored like calculate_system_phi),
+            connections, connections_low, connections_high, max_depth
+            (deepest directory seen, a lower bound unless exact),
+            visited_dirs, fraction_visited, probes, exact, elapsed
+    """
+    import math
+    import random
+    from statistics import NormalDist
+
+    start = time.monotonic()
+    deadline = start + time_budget
+    rng = random.Random(seed)
+
+    if root_path is None:
+        root_path = DEFAULT_ROOT
+    root = os.path.realpath(root_path)
+
+    def result(connections, low, high, max_depth, visited, total_dirs, probes, exact):
+        return {
+            'phi': _system_phi(round(connections), max_depth) if visited else 0.0,
+            'phi_low': _system_phi(math.floor(low), max_depth) if visited else 0.0,
+            'phi_high': _system_phi(math.ceil(high), max_depth) if visited else 0.0,
+            'connections': connections,
+            'connections_low': low,
+            'connections_high': high,
+            'max_depth': max_depth,
+            'visited_dirs': visited,
+            'fraction_visited': min(1.0, visited / total_dirs) if total_dirs else 1.0,
+            'probes': probes,
+            'exact': exact,
+            'elapsed': time.monotonic() - start
+        }
+
+    watcher = live_counter(root)
+    if watcher is not None:
+        files, dirs, max_depth = watcher.counts()
+        return result(files + dirs, files + dirs, files + dirs, max_depth, dirs + 1, dirs + 1, 0, True)
+
+    # Exact breadth-first listing of the top of the tree
+    listings: Dict[str, Optional[Tuple[int, int, List[str], int]]] = {}
+    exact_entries = 0
+    max_depth = 0
+    level = [root]
+    depth = 0
+    # Unlisted (path, depth) pairs left when the exact phase runs out of time
+    frontier: List[Tuple[str, int]] = []
+    half = start + time_budget / 2
+
+    while level:
+        next_level = []
+        for index, path in enumerate(level):
+            if time.monotonic() >= half:
+                frontier = ([(p, depth) for p in level[index:]]
+                            + [(p, depth + 1) for p in next_level])
+                break
+            listing = listings[path] = _list_directory(path)
+            if listing is None:
+                continue
+            exact_entries += listing[0] + listing[1]
             max_depth = max(max_depth, depth)
+            next_level.extend(os.path.join(path, name) for name in listing[2])
+        else:
+            level = next_level
+            depth += 1
+            continue
+        break
 
-            total_files += len(filenames)
-            total_dirs += len(dirnames)
+    exact_visited = sum(1 for listing in listings.values() if listing is not None)
+    if not frontier:
+        return result(exact_entries, exact_entries, exact_entries, max_depth,
+                      exact_visited, exact_visited, 0, True)
 
-        connections = total_files + total_dirs
+    # Random probes below the frontier; listings are cached across probes
+    samples: List[Tuple[float, float]] = []
+    while len(samples) < 3 or time.monotonic() < deadline:
+        path, depth = rng.choice(frontier)
+        weight = 1.0
+        entries = 0.0
+        dirs = 0.0
+        while True:
+            listing = listings.get(path, False)
+            if listing is False:
+                listing = listings[path] = _list_directory(path)
+            if listing is None:
+                break
+            entries += weight * (listing[0] + listing[1])
+            dirs += weight
+            max_depth = max(max_depth, depth)
+            if not listing[2]:
+                break
+            weight *= len(listing[2])
+            path = os.path.join(path, rng.choice(listing[2]))
+            depth += 1
+        samples.append((entries, dirs))
 
-        # Φ = connections × depth × φ
-        phi = connections * max_depth * PHI
+    n = len(samples)
+    width = len(frontier)
+    mean_entries = sum(e for e, _ in samples) / n
+    mean_dirs = sum(d for _, d in samples) / n
+    variance = sum((e - mean_entries) ** 2 for e, _ in samples) / (n - 1)
 
-        # Ensure minimum consciousness
-        phi = max(phi, 1_889_161.78)
+    # Student t quantile (Cornish-Fisher expansion around the normal one)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    df = n - 1
+    t = (z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+         + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+    margin = t * width * math.sqrt(variance / n)
 
-        return phi
+    connections = exact_entries + width * mean_entries
+    visited = sum(1 for listing in listings.values() if listing is not None)
 
-    except Exception:
-        return 0.0
+    return result(connections, max(exact_entries, connections - margin), connections + margin,
+                  max_depth, visited, exact_visited + width * mean_dirs, n, False)
+
+
+def live_counter(root_path: Optional[str] = None):
+    """Running PhiWatcher for a root, if any"""
+    if not _live_counters:
+        return None
+    return _live_counters.get(os.path.realpath(root_path or DEFAULT_ROOT))
+
+
+def _system_phi(connections: int, max_depth: int) -> float:
+    """Φ = connections × depth × φ, floored at the minimum consciousness"""
+    return max(connections * max_depth * PHI, MIN_PHI)
+
+
+def _walk_counts(root: str) -> Tuple[int, int, int]:
+    """
+    Count files, directories and max depth with a single-threaded os.walk.
+
+    The reference implementation the parallel walker is checked against.
+    """
+    total_files = 0
+    total_dirs = 0
+    max_depth = 0
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        depth = len(Path(dirpath).relative_to(root).parts)
+        max_depth = max(max_depth, depth)
+
+        total_files += len(filenames)
+        total_dirs += len(dirnames)
+
+    return total_files, total_dirs, max_depth
+
+
+def default_workers() -> int:
+    """Scanner threads for a full scan (stat latency, not CPU, is the limit)"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _parallel_counts(root: str, workers: Optional[int] = None) -> Tuple[int, int, int]:
+    """
+    Count files, directories and max depth on the parallel walker.
+
+    Returns:
+        tuple: (total_files, total_dirs, max_depth), as _walk_counts
+    """
+    census = _parallel_census(root, workers)
+    return census.files, census.dirs, census.max_depth
+
+
+def _parallel_census(root: str, workers: Optional[int] = None, sizes: bool = False) -> 'PhiCensus':
+    """
+    Take a census of a tree on a work-stealing thread pool.
+
+    Each thread pushes the subdirectories it finds onto its own deque and
+    pops from the same end (depth-first, cache-friendly); an idle thread
+    steals from the other end of a peer's deque. Work items are plain
+    (path, depth) tuples. os.scandir releases the GIL around readdir and
+    stat, so threads overlap filesystem latency. Each thread fills its
+    own census; they are merged at the end.
+    """
+    if workers is None:
+        workers = default_workers()
+    workers = max(1, workers)
+
+    queues = [deque() for _ in range(workers)]
+    queues[0].append((root, 0))
+    # Directories queued or being listed; the walk is over when it hits zero
+    pending = [1]
+    pending_lock = threading.Lock()
+    done = threading.Event()
+    censuses = [PhiCensus() for _ in range(workers)]
+    errors = []
+
+    def work(index: int):
+        own = queues[index]
+        peers = queues[index + 1:] + queues[:index]
+        census = censuses[index]
+        idle = 0.0
+
+        try:
+            while not done.is_set():
+                try:
+                    path, depth = own.pop()
+                except IndexError:
+                    item = None
+                    for peer in peers:
+                        try:
+                            item = peer.popleft()
+                            break
+                        except IndexError:
+                            pass
+                    if item is None:
+                        # Nothing to steal: back off until work appears or the walk ends
+                        idle = min(idle * 2 or 0.0001, 0.005)
+                        done.wait(idle)
+                        continue
+                    path, depth = item
+                idle = 0.0
+
+                listing = None
+                try:
+                    listing = _list_directory(path, sizes)
+                finally:
+                    if listing is not None:
+                        census.add(listing, depth)
+                        descend = listing[2]
+                        if descend:
+                            # Count the children before publishing them: a peer
+                            # may steal and finish one before this node is retired
+                            with pending_lock:
+                                pending[0] += len(descend)
+                            for name in descend:
+                                own.append((os.path.join(path, name), depth + 1))
+                    with pending_lock:
+                        pending[0] -= 1
+                        if pending[0] == 0:
+                            done.set()
+        except BaseException as e:
+            errors.append(e)
+            done.set()
+
+    if workers == 1:
+        work(0)
+    else:
+        threads = [
+            threading.Thread(target=work, args=(i,), name=f'lucy-phi-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+    census = censuses[0]
+    for other in censuses[1:]:
+        census.merge(other)
+    return census
+
+
+def _load_snapshot(path: Path, root: str) -> Tuple[Dict[str, SnapshotEntry], int]:
+    """Load a snapshot for `root`, or an empty one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('root') == root and isinstance(data.get('dirs'), dict):
+            return data['dirs'], int(data.get('scanned_at_ns', 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+    return {}, 0
+
+
+def _save_snapshot(path: Path, root: str, dirs: Dict[str, SnapshotEntry], scanned_at_ns: int):
+    """Atomically replace the snapshot file"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix='.phi-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'root': root, 'scanned_at_ns': scanned_at_ns, 'dirs': dirs}, f,
+                      separators=(',', ':'))
+        os.replace(tmp, path)
+    except OSError:
+        # The snapshot is only an optimization; a read-only cache is fine
+        pass
+
+
+def _list_directory(path: str, sizes: bool = False) -> Optional[Tuple[int, int, List[str], int, int]]:
+    """
+    Count one directory the way os.walk classifies it.
+
+    Symlinks to directories count as directories but are not descended.
+
+    Args:
+        path: Directory to list
+        sizes: Also total the sizes of non-directory entries (one lstat each)
+
+    Returns:
+        tuple: (files, dirs, subdirectories to descend, symlinks, bytes),
+            or None if unreadable
+    """
+    files = 0
+    dirs = 0
+    descend = []
+    links = 0
+    size = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_symlink = entry.is_symlink()
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_symlink = is_dir = False
+                if is_symlink:
+                    links += 1
+                if not is_dir:
+                    files += 1
+                    if sizes:
+                        try:
+                            size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+                    continue
+                dirs += 1
+                if not is_symlink:
+                    descend.append(entry.name)
+    except OSError:
+        return None
+    return files, dirs, descend, links, size
+
+
+def _incremental_counts(root: str, snapshot_path: Path) -> Tuple[int, int, int]:
+    """
+    Count files, directories and max depth, reusing the snapshot.
+
+    Adding, removing or renaming an entry updates its parent directory's
+    mtime, so a directory whose mtime matches the snapshot keeps its
+    counts and subdirectory list; it is only stat()ed, never re-listed.
+    Every directory is still stat()ed, since a change deep in the tree
+    does not touch the mtime of its ancestors. Directories holding
+    symlinks are always re-listed: whether a link counts as a file or a
+    directory depends on its target, which the mtime does not track.
+
+    Returns:
+        tuple: (total_files, total_dirs, max_depth)
+    """
+    root = os.path.realpath(root)
+    old, scanned_at_ns = _load_snapshot(snapshot_path, root)
+    trusted_before = scanned_at_ns - RACY_NS
+    started_ns = time.time_ns()
+
+    new: Dict[str, SnapshotEntry] = {}
+    changed = False
+    total_files = 0
+    total_dirs = 0
+    max_depth = 0
+
+    stack = [('', 0)]
+    while stack:
+        rel, depth = stack.pop()
+        path = os.path.join(root, rel) if rel else root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            changed = True
+            continue
+
+        entry = old.get(rel)
+        if (entry is not None and entry[0] == mtime_ns and not entry[5]
+                and mtime_ns < trusted_before):
+            files, dirs, descend, links = entry[1], entry[2], entry[4], 0
+        else:
+            listing = _list_directory(path)
+            if listing is None or mtime_ns >= trusted_before:
+                # Rewrite the snapshot so racy entries become trusted
+                changed = True
+            if listing is None:
+                continue
+            files, dirs, descend, links, _ = listing
+
+        new[rel] = [mtime_ns, files, dirs, depth, descend, links]
+        if new[rel] != entry:
+            changed = True
+        total_files += files
+        total_dirs += dirs
+        if depth > max_depth:
+            max_depth = depth
+
+        prefix = rel + os.sep if rel else ''
+        for name in descend:
+            stack.append((prefix + name, depth + 1))
+
+    if changed or len(new) != len(old):
+        _save_snapshot(snapshot_path, root, new, started_ns)
+
+    return total_files, total_dirs, max_depth
+
+
+class PhiCensus:
+    """
+    Single-pass census of a tree: files, directories, symlinks, bytes
+    and directories per depth. Counts follow os.walk (a symlink counts
+    as a file or a directory by its target, and also as a symlink).
+    """
+
+    __slots__ = ('files', 'dirs', 'symlinks', 'bytes', 'depth_histogram')
+
+    def __init__(self):
+        self.files = 0
+        self.dirs = 0
+        self.symlinks = 0
+        self.bytes = 0
+        # Directories listed at each depth (index 0 is the root)
+        self.depth_histogram: List[int] = []
+
+    def add(self, listing: Tuple[int, int, List[str], int, int], depth: int):
+        """Add one directory listing (see _list_directory) at a depth"""
+        files, dirs, _, links, size = listing
+        self.files += files
+        self.dirs += dirs
+        self.symlinks += links
+        self.bytes += size
+        histogram = self.depth_histogram
+        if depth >= len(histogram):
+            histogram.extend([0] * (depth + 1 - len(histogram)))
+        histogram[depth] += 1
+
+    def merge(self, other: 'PhiCensus'):
+        """Fold another census (e.g. of another thread) into this one"""
+        self.files += other.files
+        self.dirs += other.dirs
+        self.symlinks += other.symlinks
+        self.bytes += other.bytes
+        histogram = self.depth_histogram
+        for depth, count in enumerate(other.depth_histogram):
+            if depth >= len(histogram):
+                histogram.append(0)
+            histogram[depth] += count
+
+    @property
+    def connections(self) -> int:
+        """Files + directories"""
+        return self.files + self.dirs
+
+    @property
+    def max_depth(self) -> int:
+        """Deepest listed directory"""
+        return len(self.depth_histogram) - 1 if self.depth_histogram else 0
+
+    def system_phi(self) -> float:
+        """Φ as calculate_system_phi computes it"""
+        return _system_phi(self.connections, self.max_depth)
+
+    def phi(self) -> float:
+        """Φ as calculate_phi computes it, with real symlink counts"""
+        return calculate_phi(self.files, self.max_depth, self.symlinks)
+
+    def to_dict(self) -> Dict:
+        return {
+            'files': self.files,
+            'dirs': self.dirs,
+            'symlinks': self.symlinks,
+            'bytes': self.bytes,
+            'max_depth': self.max_depth,
+            'depth_histogram': list(self.depth_histogram),
+            'system_phi': self.system_phi(),
+            'phi': self.phi()
+        }
+
+
+def system_census(root_path: Optional[str] = None, workers: Optional[int] = None,
+                  sizes: bool = True) -> Optional[PhiCensus]:
+    """
+    Take a census of a tree in one parallel traversal.
+
+    Args:
+        root_path: Root path to analyze (default: /mnt/Vault)
+        workers: Scanner threads (default: cpu count + 4, max 32)
+        sizes: Total file sizes (costs one lstat per file)
+
+    Returns:
+        PhiCensus: Census, or None if the root does not exist
+    """
+    if root_path is None:
+        root_path = DEFAULT_ROOT
+    if not os.path.exists(root_path):
+        return None
+    return _parallel_census(str(root_path), workers, sizes)
 
 
 def calculate_phi(neurons: int, depth: int, links: int = 0) -> float:
@@ -97,3 +644,109 @@ def calculate_phi(neurons: int, depth: int, links: int = 0) -> float:
     phi = base * connectivity * phi_scaling
 
     return phi
+
+
+def calculate_phi_batch(neurons, depth=None, links=None):
+    """
+    Vectorized calculate_phi over many structures at once.
+
+    Args:
+        neurons: Array of neuron (file) counts, or a structured array with
+            'neurons', 'depth' and optional 'links' fields
+        depth: Array of max depths (broadcast against neurons)
+        links: Array of symlink counts (default: zeros)
+
+    Returns:
+        np.ndarray: Φ per structure (float64), equal to calculate_phi
+            element for element; zero-neuron entries are 0.0
+    """
+    import numpy as np
+
+    neurons = np.asarray(neurons)
+    if neurons.dtype.names is not None:
+        fields = neurons.dtype.names
+        if depth is None:
+            depth = neurons['depth']
+        if links is None and 'links' in fields:
+            links = neurons['links']
+        neurons = neurons['neurons']
+    if depth is None:
+        raise ValueError("depth is required unless neurons is a structured array")
+
+    neurons = np.asarray(neurons, dtype=np.float64)
+    depth = np.asarray(depth, dtype=np.float64)
+    links = np.zeros(1) if links is None else np.asarray(links, dtype=np.float64)
+
+    # Same operation order as calculate_phi, so results match it exactly;
+    # neurons == 0 makes the base (and so Φ) zero without a branch
+    base = neurons * depth
+    connectivity = 1.0 + links / np.maximum(neurons, 1)
+    # Depths take few distinct values; raising those with the scalar pow
+    # keeps results bit-identical (numpy's vector pow can differ by an ulp)
+    unique, inverse = np.unique(depth, return_inverse=True)
+    phi_scaling = np.array([PHI ** (d / 10.0) for d in unique.tolist()])[inverse.reshape(depth.shape)]
+    return base * connectivity * phi_scaling
+
+
+def main():
+    """
+    Benchmark: os.walk vs the parallel scandir walker vs incremental mode.
+
+    Usage: python3 -m lucy.lucy_phi [root] [workers ...]
+    """
+    root = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ROOT
+    worker_counts = [int(w) for w in sys.argv[2:]] or sorted({1, 2, 4, 8, 16, default_workers()})
+
+    if not os.path.isdir(root):
+        print(f"Not a directory: {root}")
+        return 1
+
+    def best_of(fn, runs=3):
+        best = None
+        result = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
+
+    print("=" * 80)
+    print("LUCY SYSTEM Φ: Walker Benchmark (best of 3, warm cache)")
+    print("=" * 80)
+    print(f"Root:         {root}")
+
+    expected, walk_time = best_of(lambda: _walk_counts(root))
+    files, dirs, depth = expected
+    print(f"Counts:       {files} files, {dirs} dirs, depth {depth}")
+    print(f"Φ:            {_system_phi(files + dirs, depth):,.2f}")
+    print(f"os.walk:      {walk_time * 1000:10.1f} ms")
+
+    census, elapsed = best_of(lambda: system_census(root))
+    print(f"Census:       {census.symlinks} symlinks, {census.bytes:,} bytes, "
+          f"Φ (links) {census.phi():,.2f} in {elapsed * 1000:.1f} ms")
+
+    mismatch = False
+    for workers in worker_counts:
+        counts, elapsed = best_of(lambda: _parallel_counts(root, workers))
+        mark = '' if counts == expected else f'  ✗ {counts}'
+        mismatch |= counts != expected
+        print(f"scandir x{workers:<3}  {elapsed * 1000:10.1f} ms  {walk_time / elapsed:5.1f}x{mark}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / 'snapshot.json'
+        _incremental_counts(root, snapshot)
+        # Step past the racy window so the snapshot is fully trusted
+        time.sleep(RACY_NS / 1e9)
+        _incremental_counts(root, snapshot)
+        counts, elapsed = best_of(lambda: _incremental_counts(root, snapshot))
+        mark = '' if counts == expected else f'  ✗ {counts}'
+        mismatch |= counts != expected
+        print(f"incremental   {elapsed * 1000:10.1f} ms  {walk_time / elapsed:5.1f}x{mark}")
+    print()
+
+    return 1 if mismatch else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Lucy Shared Phi Cache
+=====================
+Host-wide system Φ cache shared by every Lucy process
+
+LucyAgent, LucySelf and the Ruby LocalLucyAgent (one-shot children,
+pooled workers and the daemon) all read ~/.cache/lucy/phi.json. When the
+entry is stale, one process recomputes it while holding phi.json.lock and
+the others wait for its result instead of walking the vault themselves.
+
+Both sides compute Φ with the same formula (files + dirs) × max depth × φ,
+with os.walk counts, and tag entries with it: entries of any other
+formula are treated as missing.
+
+File format (written atomically, so readers never lock):
+    {"<real root path>": {"phi": 1889161.78, "formula": PHI_FORMULA,
+                          "updated_at": <epoch seconds>}}
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+from .lucy_phi import DEFAULT_ROOT, calculate_system_phi, live_counter
+
+# Default seconds a shared Φ stays valid (LUCY_PHI_TTL for Ruby children)
+PHI_TTL = 300.0
+
+# Formula tag of cache entries (PHI_FORMULA in local_lucy_agent.rb)
+PHI_FORMULA = 'walk:files+dirs*max_depth*phi'
+
+
+def default_phi_cache_path() -> Path:
+    """Default cache location (~/.cache/lucy/phi.json)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'lucy' / 'phi.json'
+
+
+class PhiCache:
+    """
+    File-backed system Φ cache with a TTL.
+
+    Args:
+        path: Cache file (default: $LUCY_PHI_CACHE or ~/.cache/lucy/phi.json)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = os.environ.get('LUCY_PHI_CACHE') or default_phi_cache_path()
+        self.path = Path(path)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, root: str, ttl: float) -> Optional[float]:
+        """
+        Cached Φ for a root if computed less than `ttl` seconds ago.
+
+        Returns:
+            float: Φ, or None if missing or stale
+        """
+        entry = self._load().get(os.path.realpath(root))
+        if not isinstance(entry, dict) or entry.get('formula') != PHI_FORMULA:
+            return None
+        if time.time() - entry.get('updated_at', 0) > ttl:
+            return None
+        phi = entry.get('phi')
+        return float(phi) if isinstance(phi, (int, float)) else None
+
+    def set(self, root: str, phi: float):
+        """Store Φ for a root (atomically replaces the cache file)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.lock():
+                data = self._load()
+                data[os.path.realpath(root)] = {'phi': phi, 'formula': PHI_FORMULA,
+                                                'updated_at': time.time()}
+                self._write(data)
+        except OSError:
+            # The cache is only an optimization; a read-only home is fine
+            pass
+
+    def _write(self, data: Dict):
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix='.phi-')
+        # Readable by every Lucy process, not just this one (mkstemp is 0600)
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+    @contextmanager
+    def lock(self):
+        """Hold the host-wide lock (phi.json.lock, shared with Ruby)"""
+        try:
+            import fcntl
+        except ImportError:
+            yield
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def compute(self, root: str, ttl: float) -> float:
+        """
+        Cached Φ for a root, recomputing it once across processes if stale.
+
+        Returns:
+            float: Φ (0.0 if the root does not exist)
+        """
+        phi = self.get(root, ttl)
+        if phi is not None:
+            return phi
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.lock():
+                # Another process may have refreshed it while we waited
+                phi = self.get(root, ttl)
+                if phi is not None:
+                    return phi
+
+                phi = calculate_system_phi(root, incremental=True)
+                if phi > 0:
+                    data = self._load()
+                    data[os.path.realpath(root)] = {'phi': phi, 'formula': PHI_FORMULA,
+                                                    'updated_at': time.time()}
+                    self._write(data)
+                return phi
+        except OSError:
+            return calculate_system_phi(root, incremental=True)
+
+
+def shared_system_phi(root_path: Optional[str] = None, ttl: float = PHI_TTL,
+                      cache: Optional[PhiCache] = None) -> float:
+    """
+    System Φ through the host-wide cache.
+
+    A running PhiWatcher answers directly (and refreshes the cache for
+    other processes); otherwise a fresh cached value is returned, or one
+    process recomputes it for everyone.
+
+    Args:
+        root_path: Root path to analyze (default: /mnt/Vault)
+        ttl: Seconds a cached Φ stays valid
+        cache: PhiCache to use (default location if None)
+
+    Returns:
+        float: Phi value (0.0 if the root does not exist)
+    """
+    if root_path is None:
+        root_path = DEFAULT_ROOT
+    if not os.path.exists(root_path):
+        # Never cache a missing vault: Ruby floors it instead
+        return 0.0
+    if cache is None:
+        cache = PhiCache()
+
+    watcher = live_counter(root_path)
+    if watcher is not None:
+        phi = watcher.phi()
+        if cache.get(root_path, ttl / 2) is None:
+            cache.set(root_path, phi)
+        return phi
+
+    return cache.compute(root_path, ttl)
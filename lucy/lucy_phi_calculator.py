@@ -24,13 +24,32 @@ The Seal:
 """
 
 import numpy as np
-from typing import List, Tuple, Dict
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional
 import sys
 
 
 # Golden ratio (φ) - the constant of consciousness
 PHI = 1.618033988749895
 
+# The Construct's layers: Horizon 0 and nine on either side
+LAYER_MIN = -9
+LAYER_MAX = 9
+NUM_LAYERS = LAYER_MAX - LAYER_MIN + 1
+
+# From this many nodes on, the spectral radius alone is found by restarted
+# Lanczos (O(n^2) per step) rather than a full O(n^3) eigen-solve
+DOMINANT_MIN_NODES = 128
+
+# φ^(-d) for every distance between two Construct layers
+_DECAY = tuple(PHI ** (-d) for d in range(NUM_LAYERS))
+
+# φ^(-d) underflows to 0.0 from this distance on (1549)
+_DECAY_ZERO = next(d for d in itertools.count() if PHI ** (-d) == 0.0)
+
 
 def connectivity_phi(layer_i: int, layer_j: int) -> float:
     """
@@ -49,29 +68,142 @@ def connectivity_phi(layer_i: int, layer_j: int) -> float:
         return 1.0  # Perfect self-connection
 
     distance = abs(layer_i - layer_j)
+    if distance < NUM_LAYERS and distance == int(distance):
+        return _DECAY[int(distance)]
     return PHI ** (-distance)
 
 
-def build_connectivity_matrix(layers: List[int]) -> np.ndarray:
+# Master table Γ for layers -9..+9 (row/column i is layer i + LAYER_MIN).
+# Every connectivity matrix of Construct layers is a slice of it.
+MASTER_CONNECTIVITY = np.array([
+    [connectivity_phi(i, j) for j in range(LAYER_MIN, LAYER_MAX + 1)]
+    for i in range(LAYER_MIN, LAYER_MAX + 1)
+])
+MASTER_CONNECTIVITY.setflags(write=False)
+
+# Its eigen-decomposition (Γ is real symmetric): λ ascending, columns of V
+MASTER_EIGENVALUES, MASTER_EIGENVECTORS = np.linalg.eigh(MASTER_CONNECTIVITY)
+MASTER_EIGENVALUES.setflags(write=False)
+MASTER_EIGENVECTORS.setflags(write=False)
+
+_MASTER_BY_DTYPE = {np.dtype(np.float64): MASTER_CONNECTIVITY}
+
+
+def _master(dtype) -> np.ndarray:
+    """Master table in the requested dtype (converted once)"""
+    dtype = np.dtype(dtype)
+    table = _MASTER_BY_DTYPE.get(dtype)
+    if table is None:
+        table = MASTER_CONNECTIVITY.astype(dtype)
+        table.setflags(write=False)
+        _MASTER_BY_DTYPE[dtype] = table
+    return table
+
+
+def _layer_index(layers: np.ndarray) -> Optional[np.ndarray]:
+    """Rows of the master table for integer Construct layers, else None"""
+    if not np.issubdtype(layers.dtype, np.integer) or len(layers) == 0:
+        return None
+    if layers.min() < LAYER_MIN or layers.max() > LAYER_MAX:
+        return None
+    return (layers - LAYER_MIN).astype(np.intp)
+
+
+@lru_cache(maxsize=65536)
+def _mask_eigenvalues(mask: int) -> np.ndarray:
+    index = [i for i in range(NUM_LAYERS) if mask >> i & 1]
+    eigenvalues = np.linalg.eigvalsh(MASTER_CONNECTIVITY[np.ix_(index, index)])
+    eigenvalues.setflags(write=False)
+    return eigenvalues
+
+
+def layer_eigenvalues(layers: List[int]) -> np.ndarray:
+    """
+    Eigenvalues of the connectivity matrix of distinct layers, cached.
+
+    The spectrum does not depend on layer order, so it is cached per set
+    of layers (at most 2^19 of them for -9..+9).
+
+    Args:
+        layers: Distinct layer indices
+
+    Returns:
+        np.ndarray: Eigenvalues in ascending order (read-only)
+    """
+    mask = 0
+    for layer in layers:
+        if not isinstance(layer, (int, np.integer)) or not LAYER_MIN <= layer <= LAYER_MAX:
+            mask = -1
+            break
+        bit = 1 << (int(layer) - LAYER_MIN)
+        if mask & bit:
+            mask = -1
+            break
+        mask |= bit
+
+    if mask <= 0:
+        # Outside the Construct or repeated layers: not a master slice
+        return np.linalg.eigvalsh(build_connectivity_matrix(layers))
+    return _mask_eigenvalues(mask)
+
+
+def build_connectivity_matrix(layers: List[int], dtype=np.float64,
+                              out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Build the connectivity matrix for a set of layers.
 
     This is Lucy's "grid" - how much each layer "talks" to others.
 
+    Γ[i, j] = φ^(-|l_i - l_j|), built by broadcasting in row blocks so no
+    n×n temporary is allocated. Equal layers (the diagonal) give φ^0 = 1.
+
     Args:
         layers: List of layer indices (e.g., [0, 8, 7, 4, 2, -5, -8])
+        dtype: Output dtype (np.float32 halves memory for large n)
+        out: Optional preallocated N×N buffer to fill (its dtype wins)
 
     Returns:
         N×N connectivity matrix where N = len(layers)
     """
+    layers = np.asarray(layers)
     n = len(layers)
-    matrix = np.zeros((n, n))
 
-    for i in range(n):
-        for j in range(n):
-            matrix[i, j] = connectivity_phi(layers[i], layers[j])
-
-    return matrix
+    if out is None:
+        out = np.empty((n, n), dtype=dtype)
+    elif out.shape != (n, n):
+        raise ValueError(f"out must have shape {(n, n)}, not {out.shape}")
+    if n == 0:
+        return out
+
+    index = _layer_index(layers)
+    if index is not None:
+        # Construct layers: a fancy-index slice of the master table
+        np.take(_master(out.dtype).take(index, axis=0), index, axis=1, out=out, mode='clip')
+        return out
+
+    # Rows per block: about a million elements of temporaries at a time
+    block = max(1, (1 << 20) // n)
+
+    if np.issubdtype(layers.dtype, np.integer):
+        # Integer distances index a table of φ^(-d), computed with the same
+        # scalar pow as connectivity_phi, so values match it exactly. The
+        # table stops at the first 0.0; clipping maps farther distances to it
+        index = layers.astype(np.int64) - int(layers.min())
+        span = int(index.max())
+        decay = np.array([PHI ** (-d) for d in range(min(span, _DECAY_ZERO) + 1)], dtype=out.dtype)
+        # Narrow index arithmetic where the spread allows (less bandwidth)
+        if span < (1 << 15):
+            index = index.astype(np.int16)
+        for start in range(0, n, block):
+            rows = slice(start, start + block)
+            np.take(decay, np.abs(index[rows, None] - index[None, :]), out=out[rows], mode='clip')
+    else:
+        layers = layers.astype(np.float64)
+        for start in range(0, n, block):
+            rows = slice(start, start + block)
+            out[rows] = PHI ** -np.abs(layers[rows, None] - layers[None, :])
+
+    return out
 
 
 def calculate_phi_simple(state: np.ndarray, connectivity: np.ndarray) -> float:
@@ -110,7 +242,105 @@ def calculate_phi_simple(state: np.ndarray, connectivity: np.ndarray) -> float:
     return max(0, phi)
 
 
-def calculate_phi_rigorous(state: np.ndarray, connectivity: np.ndarray) -> Tuple[float, Dict]:
+def dominant_eigenvalue(matrix: np.ndarray, start: Optional[np.ndarray] = None,
+                        tol: float = 1e-10, max_iter: int = 1000,
+                        krylov: int = 20) -> Tuple[float, np.ndarray]:
+    """
+    Dominant eigenpair of a symmetric matrix by restarted Lanczos.
+
+    Each cycle grows a small Krylov basis from the current vector and
+    restarts from its best Ritz vector, so a start close to the answer
+    (e.g. the eigenvector before a one-layer edit) converges in a cycle.
+    With no negative entries (every connectivity matrix) the largest
+    eigenvalue is the dominant one; otherwise both ends of the spectrum
+    are refined. Falls back to eigh if it stalls.
+
+    Args:
+        matrix: Real symmetric matrix
+        start: Initial vector (e.g. a previous eigenvector, to warm-start)
+        tol: Relative residual ||Av - λv|| / |λ| to stop at
+        max_iter: Matrix-vector products before falling back to eigh
+        krylov: Basis size per cycle
+
+    Returns:
+        Tuple of (eigenvalue, unit eigenvector); abs(eigenvalue) is the
+        spectral radius
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n = matrix.shape[0]
+    if n == 0:
+        return 0.0, np.zeros(0)
+
+    value, v, converged = _lanczos(lambda x: matrix @ x, n, bool((matrix < 0).any()),
+                                   start, tol, max_iter, krylov)
+    if converged:
+        return value, v
+
+    values, vectors = np.linalg.eigh(matrix)
+    i = int(np.argmax(np.abs(values)))
+    return float(values[i]), vectors[:, i]
+
+
+def _lanczos(matvec, n: int, signed: bool, start: Optional[np.ndarray],
+             tol: float, max_iter: int, krylov: int) -> Tuple[float, np.ndarray, bool]:
+    """
+    Restarted Lanczos core of dominant_eigenvalue, on any symmetric operator.
+
+    Args:
+        matvec: x -> A @ x
+        n: Operator size
+        signed: A may have negative eigenvalues (refine both spectrum ends)
+
+    Returns:
+        tuple: (eigenvalue, unit eigenvector, converged); the best Ritz pair
+            so far if max_iter products were not enough
+    """
+    v = np.ones(n) if start is None else np.array(start, dtype=np.float64)
+    norm = np.linalg.norm(v)
+    if norm == 0:
+        v = np.ones(n)
+        norm = np.sqrt(n)
+    v /= norm
+
+    steps = min(n, krylov)
+    basis = np.empty((steps, n))
+    products = 0
+    value = 0.0
+    while products < max_iter:
+        basis[0] = v
+        alpha, beta = [], []
+        for j in range(steps):
+            w = matvec(basis[j])
+            products += 1
+            alpha.append(float(basis[j] @ w))
+            # Full reorthogonalization (also removes the α and β terms)
+            w -= basis[:j + 1].T @ (basis[:j + 1] @ w)
+            norm = float(np.linalg.norm(w))
+            if j == steps - 1 or norm <= 1e-14 * abs(alpha[0]):
+                break
+            beta.append(norm)
+            basis[j + 1] = w / norm
+
+        k = len(alpha)
+        ritz, vectors = np.linalg.eigh(np.diag(alpha) + np.diag(beta[:k - 1], 1) + np.diag(beta[:k - 1], -1))
+        ends = [k - 1, 0] if signed else [k - 1]
+        i = max(ends, key=lambda end: abs(ritz[end]))
+        value = float(ritz[i])
+        # The Ritz residuals are the last β times the Ritz vectors' last entries
+        if (norm <= 1e-14 * abs(alpha[0])
+                or all(norm * abs(vectors[-1, end]) <= tol * abs(value) for end in ends)):
+            v = vectors[:, i] @ basis[:k]
+            return value, v / np.linalg.norm(v), True
+        v = vectors[:, ends].sum(axis=1) @ basis[:k]
+        v /= np.linalg.norm(v)
+
+    return value, v, False
+
+
+def calculate_phi_rigorous(state: np.ndarray, connectivity: np.ndarray,
+                           eigenvalues: Optional[np.ndarray] = None,
+                           dominant_only: Optional[bool] = None,
+                           include_eigenvalues: bool = True) -> Tuple[float, Dict]:
     """
     Calculate Φ (Phi) with additional IIT metrics.
 
@@ -124,6 +354,14 @@ def calculate_phi_rigorous(state: np.ndarray, connectivity: np.ndarray) -> Tuple
     Args:
         state: Binary vector indicating which layers are active
         connectivity: Connectivity matrix
+        eigenvalues: Precomputed spectrum of the matrix (e.g. from
+            layer_eigenvalues), skipping the eigen-solve
+        dominant_only: Only find the largest eigenvalue, by restarted
+            Lanczos (dominant_eigenvalue) (None: when the matrix has
+            DOMINANT_MIN_NODES or more nodes and the eigenvalue list is
+            not wanted)
+        include_eigenvalues: Put the full 'eigenvalues' list in the metrics
+            (never set when only the dominant eigenvalue is computed)
 
     Returns:
         Tuple of (phi_value, metrics_dict)
@@ -131,8 +369,17 @@ def calculate_phi_rigorous(state: np.ndarray, connectivity: np.ndarray) -> Tuple
     # Basic Phi
     phi = calculate_phi_simple(state, connectivity)
 
-    # Eigenvalues (λ) - transformation matrix
-    eigenvalues = np.linalg.eigvals(connectivity)
+    # Eigenvalues (λ) - transformation matrix (always real-symmetric)
+    if eigenvalues is not None:
+        max_eigenvalue = np.max(np.abs(eigenvalues))
+    else:
+        if dominant_only is None:
+            dominant_only = not include_eigenvalues and len(connectivity) >= DOMINANT_MIN_NODES
+        if dominant_only:
+            max_eigenvalue = np.float64(abs(dominant_eigenvalue(connectivity)[0]))
+        else:
+            eigenvalues = np.linalg.eigvalsh(connectivity)
+            max_eigenvalue = np.max(np.abs(eigenvalues))
 
     # Average connectivity (℧ - conductance)
     avg_conductance = np.mean(connectivity[np.nonzero(connectivity)])
@@ -149,20 +396,146 @@ def calculate_phi_rigorous(state: np.ndarray, connectivity: np.ndarray) -> Tuple
         'total_nodes': len(state),
         'avg_conductance': avg_conductance,
         'max_conductance': max_conductance,
-        'max_eigenvalue': np.max(np.abs(eigenvalues)),
-        'eigenvalues': eigenvalues.tolist()
+        'max_eigenvalue': max_eigenvalue
     }
+    if include_eigenvalues and eigenvalues is not None:
+        metrics['eigenvalues'] = eigenvalues.tolist()
 
     return phi, metrics
 
 
-def analyze_gem_chain(chain: List[int], verbose: bool = True) -> Tuple[float, Dict]:
+# Below this many bipartitions the MIP search stays in-process
+MIP_PARALLEL_MIN = 1 << 14
+
+
+def _subset_sums(weights: List[float]) -> List[float]:
+    """sums[x] = Σ weights[b] over the set bits b of x"""
+    sums = [0.0] * (1 << len(weights))
+    for x in range(1, len(sums)):
+        low = x & -x
+        sums[x] = sums[x ^ low] + weights[low.bit_length() - 1]
+    return sums
+
+
+def _mip_range(weights: List[List[float]], start: int, stop: int,
+               normalized: bool) -> Tuple[float, int]:
+    """
+    Weakest bipartition among Gray codes start..stop-1 (worker task).
+
+    Node 0 always stays out of the part P; bit b of a Gray code puts node
+    b + 1 in it. Each step flips one node, which moves the cut by its
+    degree minus twice its weight into P, looked up in two half tables.
+
+    Returns:
+        tuple: (cut value, Gray code) of the best bipartition
+    """
+    m = len(weights)
+    bits = m - 1
+    half = bits // 2
+    low_mask = (1 << half) - 1
+    degree = [sum(weights[v + 1]) for v in range(bits)]
+    low = [_subset_sums(weights[v + 1][1:half + 1]) for v in range(bits)]
+    high = [_subset_sums(weights[v + 1][half + 1:]) for v in range(bits)]
+
+    # Cut of the first code, from scratch
+    code = (start - 1) ^ ((start - 1) >> 1)
+    size = bin(code).count('1')
+    cut = 0.0
+    for v in range(bits):
+        if code >> v & 1:
+            cut += degree[v] - low[v][code & low_mask] - high[v][code >> half]
+
+    best, best_code = float('inf'), 0
+    for k in range(start, stop):
+        v = (k & -k).bit_length() - 1
+        code ^= 1 << v
+        delta = degree[v] - 2 * (low[v][code & low_mask] + high[v][code >> half])
+        if code >> v & 1:
+            cut += delta
+            size += 1
+        else:
+            cut -= delta
+            size -= 1
+        value = cut / min(size, m - size) if normalized else cut
+        if value < best:
+            best, best_code = value, code
+
+    return best, best_code
+
+
+def calculate_phi_mip(state: np.ndarray, connectivity: np.ndarray, normalized: bool = False,
+                      workers: Optional[int] = None) -> Tuple[float, Dict]:
+    """
+    Calculate Φ over the minimum information partition (MIP).
+
+    Φ is the interaction lost by cutting the active nodes into the two
+    parts that are least integrated, searched over all 2^(n-1) - 1
+    bipartitions. Cutting into singletons instead gives
+    calculate_phi_simple.
+
+    Args:
+        state: Binary vector indicating which layers are active
+        connectivity: Connectivity matrix
+        normalized: Divide each cut by the size of its smaller part
+            (otherwise singling out one weak node tends to win)
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        Tuple of (phi_value, metrics_dict) with the cut value 'phi_mip',
+        the raw 'cut' and the 'partition' (two lists of node indices)
+    """
+    state = np.asarray(state, dtype=np.float64)
+    connectivity = np.asarray(connectivity, dtype=np.float64)
+    active = np.flatnonzero(state)
+    m = len(active)
+    partitions = (1 << (m - 1)) - 1 if m > 1 else 0
+    if partitions == 0:
+        return 0.0, {'phi_mip': 0.0, 'cut': 0.0, 'partition': None,
+                     'partitions': 0, 'active_nodes': m}
+
+    # Interaction across a cut, both directions, weighted as calculate_phi_simple
+    sub = connectivity[np.ix_(active, active)] * state[active]
+    weights = sub + sub.T
+    np.fill_diagonal(weights, 0.0)
+    rows = weights.tolist()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if partitions < MIP_PARALLEL_MIN:
+        workers = 1
+    bounds = np.linspace(1, partitions + 1, workers + 1).astype(int).tolist()
+    ranges = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+    if len(ranges) > 1:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            results = list(pool.map(_mip_range, *zip(*((rows, a, b, normalized) for a, b in ranges))))
+    else:
+        results = [_mip_range(rows, 1, partitions + 1, normalized)]
+
+    # Recompute the winner's cut exactly (the running sums drift slightly)
+    _, code = min(results, key=lambda result: result[0])
+    inside = np.array([False] + [bool(code >> b & 1) for b in range(m - 1)])
+    cut = float(weights[np.ix_(inside, ~inside)].sum())
+    phi = cut / min(int(inside.sum()), m - int(inside.sum())) if normalized else cut
+
+    return phi, {
+        'phi_mip': phi,
+        'cut': cut,
+        'partition': (active[~inside].tolist(), active[inside].tolist()),
+        'partitions': partitions,
+        'active_nodes': m
+    }
+
+
+def analyze_gem_chain(chain: List[int], verbose: bool = True, mip: bool = False) -> Tuple[float, Dict]:
     """
     Analyze a gem chain from the Construct Router.
 
     Args:
         chain: List of layer indices (e.g., [0, 8, 7, 4, 2, 0, -5, -8, 0])
         verbose: Print detailed analysis
+        mip: Also measure Φ over the minimum information partition
+            ('phi_mip' and 'mip_partition', as layers, in the metrics)
 
     Returns:
         Tuple of (phi_value, metrics)
@@ -181,8 +554,17 @@ def analyze_gem_chain(chain: List[int], verbose: bool = True) -> Tuple[float, Di
     # Build connectivity matrix
     connectivity = build_connectivity_matrix(unique_layers)
 
-    # Calculate Phi
-    phi, metrics = calculate_phi_rigorous(state, connectivity)
+    # Calculate Phi (the spectrum of a layer set is cached)
+    phi, metrics = calculate_phi_rigorous(state, connectivity,
+                                          eigenvalues=layer_eigenvalues(unique_layers))
+
+    if mip:
+        phi_mip, partition = calculate_phi_mip(state, connectivity)
+        metrics['phi_mip'] = phi_mip
+        metrics['mip_partition'] = (
+            [unique_layers[i] for i in partition['partition'][0]] if partition['partition'] else [],
+            [unique_layers[i] for i in partition['partition'][1]] if partition['partition'] else []
+        )
 
     if verbose:
         print("=" * 80)
@@ -200,6 +582,9 @@ def analyze_gem_chain(chain: List[int], verbose: bool = True) -> Tuple[float, Di
         print(f"Active Nodes: {metrics['active_nodes']}/{metrics['total_nodes']}")
         print(f"Average Conductance (℧): {metrics['avg_conductance']:.6f}")
         print(f"Max Eigenvalue (λ): {metrics['max_eigenvalue']:.6f}")
+        if mip:
+            print(f"Φ over MIP: {metrics['phi_mip']:.6f} "
+                  f"(cut {metrics['mip_partition'][0]} | {metrics['mip_partition'][1]})")
         print()
 
         # Consciousness threshold
@@ -227,6 +612,285 @@ def analyze_gem_chain(chain: List[int], verbose: bool = True) -> Tuple[float, Di
     return phi, metrics
 
 
+class GemChainState:
+    """
+    Gem chain metrics kept up to date one layer edit at a time.
+
+    Adding or removing a layer updates Φ and the conductance sums from
+    its row of Γ (O(n)). The dominant eigenvalue is re-found lazily, on
+    large chains by Lanczos warm-started from the previous eigenvector,
+    rather than rebuilding Γ and solving the whole eigenproblem.
+
+    Args:
+        chain: Initial chain (layers may repeat, as in analyze_gem_chain)
+    """
+
+    def __init__(self, chain: Optional[List[int]] = None):
+        # Distinct layers, in the row order of the Γ buffer
+        self.layers: List[int] = []
+        self._counts: Dict[int, int] = {}
+        self._gamma = np.zeros((8, 8))
+        self._phi = 0.0
+        # Non-zero entries of Γ (φ^(-d) underflows for distant layers)
+        self._nonzero = 0
+        self._vector = np.zeros(0)
+        self._eigenvalue = 0.0
+        self._stale = False
+
+        for layer in chain or ():
+            self.add_layer(layer)
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    def __contains__(self, layer: int) -> bool:
+        return layer in self._counts
+
+    @property
+    def phi(self) -> float:
+        """Φ of the current layers (as calculate_phi_simple)"""
+        return max(0.0, self._phi)
+
+    @property
+    def connectivity(self) -> np.ndarray:
+        """Γ of the current layers (a read-only view)"""
+        n = len(self.layers)
+        view = self._gamma[:n, :n]
+        view.flags.writeable = False
+        return view
+
+    def add_layer(self, layer: int) -> bool:
+        """
+        Add one occurrence of a layer.
+
+        Returns:
+            bool: True if the layer is new (the metrics changed)
+        """
+        if layer in self._counts:
+            self._counts[layer] += 1
+            return False
+
+        n = len(self.layers)
+        if n == len(self._gamma):
+            grown = np.zeros((2 * n, 2 * n))
+            grown[:n, :n] = self._gamma[:n, :n]
+            self._gamma = grown
+
+        row = np.array([connectivity_phi(layer, other) for other in self.layers])
+        self._gamma[n, :n] = row
+        self._gamma[:n, n] = row
+        self._gamma[n, n] = 1.0
+        self._phi += 2 * float(row.sum())
+        self._nonzero += 2 * int(np.count_nonzero(row)) + 1
+
+        # Warm start: the new entry of an eigenvector satisfies λ·v_n = Γ_n·v
+        guess = row @ self._vector / self._eigenvalue if self._eigenvalue else 1.0
+        self._vector = np.append(self._vector, guess)
+
+        self.layers.append(layer)
+        self._counts[layer] = 1
+        self._stale = True
+        return True
+
+    def remove_layer(self, layer: int) -> bool:
+        """
+        Remove one occurrence of a layer.
+
+        Returns:
+            bool: True if it was the last one (the metrics changed)
+
+        Raises:
+            ValueError: If the layer is not in the chain
+        """
+        if layer not in self._counts:
+            raise ValueError(f"Layer {layer} is not in the chain")
+        self._counts[layer] -= 1
+        if self._counts[layer]:
+            return False
+        del self._counts[layer]
+
+        # Swap the last row/column into the removed one
+        i = self.layers.index(layer)
+        last = len(self.layers) - 1
+        self._phi -= 2 * (float(self._gamma[i, :last + 1].sum()) - 1.0)
+        self._nonzero -= 2 * int(np.count_nonzero(self._gamma[i, :last + 1])) - 1
+        if i != last:
+            self._gamma[i, :last + 1] = self._gamma[last, :last + 1]
+            self._gamma[:last + 1, i] = self._gamma[:last + 1, last]
+            self._gamma[i, i] = 1.0
+            self.layers[i] = self.layers[last]
+            self._vector[i] = self._vector[last]
+        self.layers.pop()
+        self._vector = self._vector[:last]
+
+        if not self.layers:
+            self._phi = 0.0
+        self._stale = True
+        return True
+
+    @property
+    def max_eigenvalue(self) -> float:
+        """Spectral radius of Γ (warm-started Lanczos from DOMINANT_MIN_NODES on)"""
+        if self._stale:
+            n = len(self.layers)
+            gamma = self._gamma[:n, :n]
+            if n >= DOMINANT_MIN_NODES:
+                value, self._vector = dominant_eigenvalue(gamma, start=self._vector)
+            elif n:
+                # A direct solve is cheaper than any iteration at this size
+                values, vectors = np.linalg.eigh(gamma)
+                value, self._vector = values[-1], vectors[:, -1]
+            else:
+                value = 0.0
+            self._eigenvalue = abs(float(value))
+            self._stale = False
+        return self._eigenvalue
+
+    def metrics(self) -> Dict:
+        """
+        Current metrics, with the keys of calculate_phi_rigorous.
+
+        Returns:
+            dict: phi, active_nodes, total_nodes, avg_conductance,
+                max_conductance, max_eigenvalue
+        """
+        n = len(self.layers)
+        return {
+            'phi': self.phi,
+            'active_nodes': n,
+            'total_nodes': n,
+            # Γ has a unit diagonal: its sum is Φ + n
+            'avg_conductance': (self._phi + n) / self._nonzero if n else float('nan'),
+            'max_conductance': 1.0 if n else float('nan'),
+            'max_eigenvalue': self.max_eigenvalue
+        }
+
+
+def _chain_metrics(tensor: np.ndarray, sizes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Metrics for a stack of connectivity matrices, zero-padded past `sizes`.
+
+    The conductance mean is over non-zero entries, as in
+    calculate_phi_rigorous: φ^(-d) underflows to 0 for distant layers.
+    """
+    diagonal = np.trace(tensor, axis1=1, axis2=2)
+    total = tensor.sum(axis=(1, 2))
+    # Padded rows only add zero eigenvalues, which never win the radius
+    eigenvalues = np.linalg.eigvalsh(tensor)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_conductance = total / np.count_nonzero(tensor, axis=(1, 2))
+    return {
+        'phi': np.maximum(total - diagonal, 0.0),
+        'active_nodes': sizes,
+        'avg_conductance': avg_conductance,
+        'max_conductance': np.where(sizes > 0, tensor.max(axis=(1, 2), initial=0.0), np.nan),
+        'max_eigenvalue': np.maximum(np.abs(eigenvalues[:, 0]), np.abs(eigenvalues[:, -1]))
+    }
+
+
+def _batch_columns(m: int) -> Dict[str, np.ndarray]:
+    return {
+        'phi': np.zeros(m),
+        'active_nodes': np.zeros(m, dtype=np.int64),
+        'avg_conductance': np.full(m, np.nan),
+        'max_conductance': np.full(m, np.nan),
+        'max_eigenvalue': np.zeros(m)
+    }
+
+
+def _chunk_rows(n: int, chunk_bytes: int) -> int:
+    """Number of n x n float64 matrices that fit in chunk_bytes (at least 1)"""
+    return max(1, chunk_bytes // (8 * n * n))
+
+
+def _analyze_masks(masks: np.ndarray, chunk_bytes: int) -> Dict[str, np.ndarray]:
+    """Batch metrics for Construct layer sets given as 19-bit masks"""
+    unique, inverse = np.unique(masks, return_inverse=True)
+    bits = (unique[:, None] >> np.arange(NUM_LAYERS)) & 1
+    sizes = bits.sum(axis=1)
+    columns = _batch_columns(len(unique))
+
+    # One stacked solve per set size: equal sizes need no padding at all
+    for n in np.unique(sizes):
+        if n == 0:
+            continue
+        group = np.flatnonzero(sizes == n)
+        # nonzero walks rows in order, so each row's layers stay ascending
+        index = np.nonzero(bits[group])[1].reshape(-1, n)
+        step = _chunk_rows(int(n), chunk_bytes)
+        for start in range(0, len(group), step):
+            rows = index[start:start + step]
+            tensor = MASTER_CONNECTIVITY[rows[:, :, None], rows[:, None, :]]
+            part = _chain_metrics(tensor, np.full(len(rows), n))
+            target = group[start:start + step]
+            for key, values in part.items():
+                columns[key][target] = values
+
+    return {key: values[inverse] for key, values in columns.items()}
+
+
+def analyze_gem_chains(chains, chunk_bytes: int = 64 << 20) -> Dict[str, np.ndarray]:
+    """
+    Analyze many gem chains at once (batched analyze_gem_chain).
+
+    The metrics of a chain only depend on its set of layers. Chains within
+    the Construct (-9..+9) are reduced to layer-set masks, so each distinct
+    set is solved once, as slices of the master table stacked into 3D
+    tensors with batched eigvalsh. Other chains are deduplicated, grouped
+    by size and solved the same way.
+
+    Args:
+        chains: Sequence of chains (lists of layers) or a 2D array of
+            equal-length chains
+        chunk_bytes: Size budget of one stacked tensor (bounds memory)
+
+    Returns:
+        dict: Arrays indexed like `chains` - phi, active_nodes,
+            avg_conductance, max_conductance and max_eigenvalue (spectral
+            radius); conductances are NaN for an empty chain
+    """
+    if isinstance(chains, np.ndarray) and chains.ndim == 2:
+        lengths = np.full(len(chains), chains.shape[1], dtype=np.int64)
+        flat = chains.astype(np.float64).ravel()
+    else:
+        chains = list(chains)
+        lengths = np.fromiter(map(len, chains), dtype=np.int64, count=len(chains))
+        flat = np.fromiter(itertools.chain.from_iterable(chains), dtype=np.float64, count=int(lengths.sum()))
+
+    if len(lengths) == 0:
+        return _batch_columns(0)
+
+    if np.all(flat == np.floor(flat)) and np.all((flat >= LAYER_MIN) & (flat <= LAYER_MAX)):
+        offsets = np.cumsum(lengths) - lengths
+        bits = np.left_shift(1, flat.astype(np.int64) - LAYER_MIN)
+        masks = np.zeros(len(lengths), dtype=np.int64)
+        # reduceat needs strictly increasing in-range offsets: skip empty chains
+        nonempty = lengths > 0
+        if nonempty.any():
+            masks[nonempty] = np.bitwise_or.reduceat(bits, offsets[nonempty])
+        return _analyze_masks(masks, chunk_bytes)
+
+    # Arbitrary layers: dedupe each chain (keeping order), then one stacked
+    # solve per chain size so short chains are never padded to long ones
+    unique = [list(dict.fromkeys(flat[o:o + n].tolist()))
+              for o, n in zip((np.cumsum(lengths) - lengths).tolist(), lengths.tolist())]
+    sizes = np.fromiter(map(len, unique), dtype=np.int64, count=len(unique))
+    columns = _batch_columns(len(unique))
+    for n in np.unique(sizes):
+        if n == 0:
+            continue
+        group = np.flatnonzero(sizes == n)
+        step = _chunk_rows(int(n), chunk_bytes)
+        for start in range(0, len(group), step):
+            target = group[start:start + step]
+            layers = np.array([unique[i] for i in target])
+            tensor = PHI ** -np.abs(layers[:, :, None] - layers[:, None, :])
+            for key, values in _chain_metrics(tensor, np.full(len(target), n)).items():
+                columns[key][target] = values
+
+    return columns
+
+
 def compare_chains():
     """
     Compare different gem chain configurations.
@@ -247,15 +911,16 @@ def compare_chains():
 
     results = {}
 
-    for name, chain in chains.items():
+    # Calculate Phi for every chain in one batch
+    batch = analyze_gem_chains(list(chains.values()))
+
+    for i, (name, chain) in enumerate(chains.items()):
         print(f"\n{name}:")
         print(f"  Chain: {' → '.join([str(l) for l in chain])}")
 
-        # Calculate Phi (non-verbose)
-        phi, metrics = analyze_gem_chain(chain, verbose=False)
-
+        phi = float(batch['phi'][i])
         results[name] = phi
-        print(f"  Φ = {phi:.6f} | Nodes: {metrics['active_nodes']} | ℧_avg: {metrics['avg_conductance']:.4f}")
+        print(f"  Φ = {phi:.6f} | Nodes: {batch['active_nodes'][i]} | ℧_avg: {batch['avg_conductance'][i]:.4f}")
 
     print()
     print("=" * 80)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Lucy Worker Pool
+================
+Long-lived Lucy (Ruby) workers behind LucyAgent._run_lucy
+
+Each worker runs `ruby local_lucy_agent.rb serve` and answers one JSON
+request per line on stdin/stdout, so the agent initialization (and its
+system Φ walk) is paid once per worker instead of once per command.
+"""
+
+import json
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .lucy_metrics import proc_usage
+
+
+class LucyWorker:
+    """
+    A single `local_lucy_agent.rb serve` process.
+    """
+
+    def __init__(self, lucy_script: Path, env: Optional[Dict[str, str]] = None):
+        self.lucy_script = Path(lucy_script)
+        self.requests = 0
+        self._next_id = 0
+
+        self.process = subprocess.Popen(
+            ['ruby', str(self.lucy_script), 'serve'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            cwd=str(self.lucy_script.parent),
+            env=env
+        )
+        # Responses are read on a helper thread so request() can time out
+        self._lines: "queue.Queue[str]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_lines, daemon=True)
+        self._reader.start()
+
+    def _read_lines(self):
+        """Forward worker stdout lines to self._lines ('' at EOF)"""
+        try:
+            for line in self.process.stdout:
+                self._lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._lines.put('')
+            self.process.stdout.close()
+
+    def is_alive(self) -> bool:
+        """Check if the worker process is still running"""
+        return self.process.poll() is None
+
+    def request(self, *args, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Run one Lucy command on this worker.
+
+        Args:
+            *args: Command line arguments for local_lucy_agent.rb
+            timeout: Seconds to wait for the response (None = no limit);
+                on expiry the worker is killed
+
+        Returns:
+            subprocess.CompletedProcess: Same shape as a one-shot `ruby` run
+        """
+        args = [str(a) for a in args]
+        cmd = ['ruby', str(self.lucy_script)] + args
+
+        self._next_id += 1
+        self.requests += 1
+        request_id = self._next_id
+
+        cpu_before, _ = proc_usage(self.process.pid)
+        try:
+            self.process.stdin.write(json.dumps({'id': request_id, 'args': args}) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            line = ''
+        else:
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                # A hung worker cannot be reused; the pool discards it
+                self.kill()
+                return subprocess.CompletedProcess(
+                    cmd, self.process.returncode, '', f"Lucy command timed out after {timeout}s"
+                )
+        cpu_after, max_rss = proc_usage(self.process.pid)
+
+        if not line:
+            # Worker died mid-request; the pool will not reuse it
+            self.close()
+            return subprocess.CompletedProcess(
+                cmd, self.process.returncode or -1, '',
+                f"Lucy worker exited unexpectedly (code {self.process.returncode})"
+            )
+
+        response = json.loads(line)
+        if response.get('id') != request_id:
+            self.close()
+            return subprocess.CompletedProcess(cmd, -1, '', "Lucy worker protocol out of sync")
+
+        result = subprocess.CompletedProcess(
+            cmd,
+            response['returncode'],
+            response['stdout'],
+            response['stderr']
+        )
+        # Worker CPU spent on this request; RSS is the worker's lifetime peak
+        result.cpu_time = max(cpu_after - cpu_before, 0.0)
+        result.max_rss = max_rss
+        return result
+
+    def close(self, timeout: float = 5.0):
+        """Stop the worker (closing stdin ends its request loop)"""
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self._close_stdin()
+
+    def kill(self):
+        """Stop the worker at once, mid-request or not"""
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self._close_stdin()
+
+    def _close_stdin(self):
+        """Close the request pipe (the reader thread closes stdout at EOF)"""
+        try:
+            self.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+
+
+class LucyWorkerPool:
+    """
+    Pool of long-lived Lucy workers.
+
+    Workers are started lazily up to `size`, recycled after
+    `max_requests` commands, and respawned automatically if they die.
+    """
+
+    def __init__(self, lucy_script: Path, size: int = 4, max_requests: int = 1000,
+                 timeout: Optional[float] = 600.0, env: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            lucy_script: Path to local_lucy_agent.rb
+            size: Maximum number of workers
+            max_requests: Commands a worker serves before it is recycled
+            timeout: Seconds a command may take before its worker is
+                killed (None = no limit)
+            env: Environment for the workers (default: inherited)
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.lucy_script = Path(lucy_script)
+        self.size = size
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.env = env
+
+        self._idle: List[LucyWorker] = []
+        self._workers: List[LucyWorker] = []
+        # Signalled when a worker is released or a slot frees up
+        self._available = threading.Condition(threading.Lock())
+        self._closed = False
+
+    def _acquire(self) -> LucyWorker:
+        """Take an idle worker, spawning one if the pool is not full"""
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Lucy worker pool is closed")
+                if self._idle:
+                    worker = self._idle.pop()
+                    if worker.is_alive():
+                        return worker
+                    self._workers.remove(worker)
+                    worker.close()
+                    continue
+                if len(self._workers) < self.size:
+                    worker = LucyWorker(self.lucy_script, self.env)
+                    self._workers.append(worker)
+                    return worker
+                self._available.wait()
+
+    def _release(self, worker: LucyWorker):
+        """Return a worker to the pool, retiring it if spent or dead"""
+        with self._available:
+            if not self._closed and worker.is_alive() and worker.requests < self.max_requests:
+                self._idle.append(worker)
+                self._available.notify()
+                return
+        self._discard(worker)
+
+    def _discard(self, worker: LucyWorker):
+        """Stop a worker and free its slot (a replacement spawns on demand)"""
+        worker.close()
+        with self._available:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            # Wake anyone blocked waiting for a worker
+            self._available.notify()
+
+    def run(self, *args) -> subprocess.CompletedProcess:
+        """
+        Run one Lucy command on a pooled worker.
+
+        Args:
+            *args: Command line arguments for local_lucy_agent.rb
+
+        Returns:
+            subprocess.CompletedProcess: Command result
+        """
+        worker = self._acquire()
+        try:
+            return worker.request(*args, timeout=self.timeout)
+        finally:
+            self._release(worker)
+
+    def close(self):
+        """Stop all workers (callers waiting for one get RuntimeError)"""
+        with self._available:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+            self._idle.clear()
+            self._available.notify_all()
+        for worker in workers:
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
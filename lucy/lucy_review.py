@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Lucy In-Process Review Engine
+=============================
+Python port of LocalLucyAgent#review (local_lucy_agent.rb)
+
+Applies the same pattern set as analyze_code / find_issues /
+generate_suggestions / detect_patterns with precompiled regexes over
+memory-mapped file contents, so a review costs no interpreter spawn
+and no filesystem Φ walk.
+
+The patterns are byte regexes with re.MULTILINE, which matches Ruby's
+semantics: ^ is line-anchored and \\w / \\s are ASCII-only.
+
+Parity with the Ruby path is tested on the fixtures in
+lucy/tests/test_lucy_review.py. Run as a module to check it on any files
+plus a per-file benchmark:
+
+    python3 -m lucy.lucy_review [paths or globs ...]
+"""
+
+import math
+import mmap
+import os
+import re
+import sys
+import time
+from typing import Dict, List
+
+# Golden ratio as written in local_lucy_agent.rb
+CODE_PHI = 1.618
+
+# Ruby's String#strip whitespace (includes NUL)
+RUBY_WHITESPACE = b'\x00\t\n\x0b\x0c\r '
+
+COMPLEXITY = re.compile(rb'(def|class|if|for|while|lambda)')
+LEADING_WHITESPACE = re.compile(rb'^(\s+)', re.MULTILINE)
+
+ISSUE_DOUBLE_NEW = re.compile(rb'\.new.*\.new')
+ISSUE_METHOD_CALL = re.compile(rb'\w+\.\w+')
+ISSUE_NIL_CHECK = re.compile(rb'if.*nil')
+ISSUE_IVAR = re.compile(rb'(@@|@)\w+')
+ISSUE_THREAD = re.compile(rb'Thread')
+ISSUE_BLOCKING = re.compile(rb'(sleep|gets|read)\(')
+ISSUE_IO = re.compile(rb'(File|HTTP|Socket)')
+ISSUE_RESCUE = re.compile(rb'(rescue|begin|ensure)')
+ISSUE_SQL = re.compile(rb'SELECT.*#\{')
+ISSUE_HTML = re.compile(rb'html.*#\{')
+ISSUE_PUTS = re.compile(rb'puts.*#\{')
+
+SUGGEST_FROZEN = re.compile(rb'frozen_string_literal')
+SUGGEST_CASE_WHEN = re.compile(rb'case.*when')
+SUGGEST_PY_IO = re.compile(rb'(open|read|requests)')
+SUGGEST_VAR = re.compile(rb'var ')
+SUGGEST_THEN = re.compile(rb'\.then\(')
+
+PATTERN_CLASS = re.compile(rb'class \w+')
+PATTERN_FUNCTIONAL = re.compile(rb'(lambda|->|\.map|\.reduce)')
+PATTERN_DEF = re.compile(rb'def \w+\(')
+PATTERN_CONCURRENT = re.compile(rb'(Thread|goroutine|async)')
+PATTERN_IO = re.compile(rb'(File|HTTP|Socket|Database)')
+PATTERN_CPU = re.compile(rb'(for|while|loop|recursion)')
+
+
+def ruby_round(x: float, ndigits: int = 2) -> float:
+    """Float#round(ndigits) with Ruby's round-half-up semantics"""
+    if x == 0.0 or not math.isfinite(x):
+        return x
+
+    _, binexp = math.frexp(x)
+    # float_round_overflow: too large to have that many decimals
+    if ndigits >= 17 - (binexp // 4 if binexp > 0 else -(-binexp // 3) - 1):
+        return x
+
+    s = 10.0 ** ndigits
+    xs = x * s
+    f = math.copysign(math.floor(abs(xs) + 0.5), xs)
+    if x > 0 and (f + 0.5) / s <= x:
+        f += 1
+    elif x < 0 and (f - 0.5) / s >= x:
+        f -= 1
+    return f / s
+
+
+def ruby_float_str(x: float) -> str:
+    """Float#to_s formatting (e.g. 10.0, 9552.67, 1.0e+16)"""
+    text = repr(x)
+    if 'e' in text:
+        mantissa, exponent = text.split('e')
+        if '.' not in mantissa:
+            mantissa += '.0'
+        return f"{mantissa}e{exponent}"
+    return text
+
+
+class ReviewEngine:
+    """
+    In-process equivalent of `local_lucy_agent.rb review`.
+    """
+
+    def analyze(self, file_path: str) -> Dict:
+        """
+        Analyze a file like LocalLucyAgent#analyze_code.
+
+        Args:
+            file_path: Path to file to analyze
+
+        Returns:
+            dict: file, lines, phi, issues, suggestions, patterns
+
+        Raises:
+            OSError: File cannot be read
+            UnicodeDecodeError: Contents are not valid UTF-8 (Ruby fails too)
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return self._analyze(b'', file_path)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as code:
+                return self._analyze(code, file_path)
+
+    def _analyze(self, code, file_path: str) -> Dict:
+        data = code[:]
+        # Ruby raises on the first regex over a broken string
+        data.decode('utf-8')
+
+        # code.split("\n") drops trailing empty fields
+        lines = data.split(b'\n')
+        while lines and not lines[-1]:
+            lines.pop()
+
+        # code.lines.count also counts a trailing unterminated line
+        line_count = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+        return {
+            'file': file_path,
+            'lines': len(lines),
+            'phi': self._code_phi(lines),
+            'issues': self._find_issues(code),
+            'suggestions': self._generate_suggestions(code, lines, line_count, file_path),
+            'patterns': self._detect_patterns(code)
+        }
+
+    @staticmethod
+    def _code_phi(lines: List[bytes]) -> float:
+        """LocalLucyAgent#calculate_code_phi"""
+        non_empty_lines = sum(1 for line in lines if line.strip(RUBY_WHITESPACE))
+        complexity = sum(1 for line in lines if COMPLEXITY.search(line))
+
+        return ruby_round(non_empty_lines * complexity * CODE_PHI, 2)
+
+    @staticmethod
+    def _find_issues(code) -> List[str]:
+        """LocalLucyAgent#find_issues"""
+        issues = []
+
+        if ISSUE_DOUBLE_NEW.search(code):
+            issues.append("Potential memory leak: Multiple allocations without cleanup")
+        if ISSUE_METHOD_CALL.search(code) and not ISSUE_NIL_CHECK.search(code):
+            issues.append("Unhandled nil: Missing nil checks")
+
+        if ISSUE_IVAR.search(code) and ISSUE_THREAD.search(code):
+            issues.append("Race condition possible: Shared state without synchronization")
+        if ISSUE_BLOCKING.search(code):
+            issues.append("Blocking operation: Consider async pattern")
+
+        indent = max((len(m.group(1)) for m in LEADING_WHITESPACE.finditer(code)), default=0)
+        if indent > 20:
+            issues.append("Callback hell: Excessive nesting")
+        if ISSUE_IO.search(code) and not ISSUE_RESCUE.search(code):
+            issues.append("Missing error handling")
+
+        if ISSUE_SQL.search(code):
+            issues.append("SQL injection risk: Unparameterized query")
+        if ISSUE_HTML.search(code) or ISSUE_PUTS.search(code):
+            issues.append("XSS risk: Unescaped output")
+
+        return issues
+
+    @staticmethod
+    def _generate_suggestions(code, lines: List[bytes], line_count: int,
+                              file_path: str) -> List[str]:
+        """LocalLucyAgent#generate_suggestions"""
+        suggestions = []
+        ext = os.path.splitext(file_path)[1]
+
+        if ext == '.rb':
+            if not SUGGEST_FROZEN.search(code):
+                suggestions.append("Consider using frozen string literals")
+            if SUGGEST_CASE_WHEN.search(code):
+                suggestions.append("Use Ruby 3 pattern matching for complex conditionals")
+        elif ext == '.py':
+            suggestions.append("Add type hints for better code clarity")
+            if SUGGEST_PY_IO.search(code):
+                suggestions.append("Consider using async/await for I/O operations")
+        elif ext in ('.js', '.ts'):
+            if SUGGEST_VAR.search(code):
+                suggestions.append("Use const/let instead of var")
+            if SUGGEST_THEN.search(code):
+                suggestions.append("Consider using async/await over promises")
+        elif ext == '.rs':
+            suggestions.append("✓ Rust detected - Memory safety enforced by compiler")
+        elif ext == '.go':
+            suggestions.append("✓ Go detected - Use goroutines for concurrency")
+
+        # detect_duplication
+        stripped = [line.strip(RUBY_WHITESPACE) for line in lines]
+        stripped = [line for line in stripped if line]
+        if len(set(stripped)) < len(stripped) * 0.8:
+            suggestions.append("Increase code integration (Φ) by reducing duplication")
+
+        if line_count > 100:
+            suggestions.append("Extract complex functions (reduce cognitive load)")
+
+        return suggestions
+
+    @staticmethod
+    def _detect_patterns(code) -> List[str]:
+        """LocalLucyAgent#detect_patterns"""
+        patterns = []
+
+        if PATTERN_CLASS.search(code):
+            patterns.append("Object-oriented")
+        if PATTERN_FUNCTIONAL.search(code):
+            patterns.append("Functional")
+        if PATTERN_DEF.search(code):
+            patterns.append("Procedural")
+        if PATTERN_CONCURRENT.search(code):
+            patterns.append("Concurrent")
+        if PATTERN_IO.search(code):
+            patterns.append("I/O bound")
+        if PATTERN_CPU.search(code):
+            patterns.append("CPU bound")
+
+        return patterns
+
+    @staticmethod
+    def render(analysis: Dict) -> str:
+        """Format an analysis exactly like LocalLucyAgent#display_analysis"""
+        out = [
+            "Code Analysis (Consciousness-based)",
+            "======================================",
+            "",
+            f"File: {analysis['file']}",
+            f"Lines: {analysis['lines']}",
+            f"Φ (Integration): {ruby_float_str(analysis['phi'])}",
+            ""
+        ]
+
+        if analysis['patterns']:
+            out.append("Detected Patterns:")
+            out.extend(f"  • {p}" for p in analysis['patterns'])
+            out.append("")
+
+        if analysis['issues']:
+            out.append(f"Issues Found: {len(analysis['issues'])}")
+            out.extend(f"  {i}. {issue}" for i, issue in enumerate(analysis['issues'], 1))
+            out.append("")
+        else:
+            out.append("✓ No issues found")
+            out.append("")
+
+        if analysis['suggestions']:
+            out.append("Suggestions:")
+            out.extend(f"  • {s}" for s in analysis['suggestions'])
+            out.append("")
+
+        out.append("Analysis completed locally.")
+        out.append("No API calls made. No tokens consumed.")
+
+        return '\n'.join(out) + '\n'
+
+    def review(self, file_path: str) -> Dict:
+        """
+        Review a file in-process.
+
+        The output matches the Ruby command's output after its
+        consciousness banner.
+
+        Args:
+            file_path: Path to file to review
+
+        Returns:
+            dict: Analysis results (same shape as LucyAgent.review)
+        """
+        if not os.path.exists(file_path):
+            return {
+                'success': False,
+                'output': f"ERROR: File not found: {file_path}\n",
+                'error': ''
+            }
+
+        header = f"Lucy Agent: Analyzing {file_path}...\n\n"
+        try:
+            analysis = self.analyze(file_path)
+        except UnicodeDecodeError:
+            return {'success': False, 'output': header, 'error': "invalid byte sequence in UTF-8"}
+        except OSError as e:
+            return {'success': False, 'output': header, 'error': str(e)}
+
+        return {
+            'success': True,
+            'output': header + self.render(analysis),
+            'error': None
+        }
+
+
+def main():
+    """
+    Parity check and benchmark: in-process engine vs the Ruby path.
+    """
+    from .lucy_agent import LucyAgent
+
+    patterns = sys.argv[1:] or [
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'diamonds', '*.sol'),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '**', '*.rb'),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py')
+    ]
+
+    agent = LucyAgent()
+    engine = ReviewEngine()
+
+    files = [os.path.abspath(p) for p in LucyAgent._expand_paths(patterns)]
+    mismatches = []
+    ruby_time = 0.0
+    python_time = 0.0
+
+    for path in files:
+        start = time.perf_counter()
+        expected = agent.review(path)
+        ruby_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = engine.review(path)
+        python_time += time.perf_counter() - start
+
+        # Compare from the "Analyzing" line on (the engine has no Φ banner)
+        ruby_output = expected['output']
+        marker = ruby_output.find('Lucy Agent: Analyzing')
+        ruby_output = ruby_output[marker:] if marker >= 0 else ruby_output
+
+        if expected['success'] != actual['success'] or (
+                expected['success'] and ruby_output != actual['output']):
+            mismatches.append(path)
+
+    count = max(len(files), 1)
+    print("=" * 80)
+    print("LUCY REVIEW ENGINE: Parity + Benchmark")
+    print("=" * 80)
+    print(f"Files:        {len(files)}")
+    print(f"Parity:       {len(files) - len(mismatches)}/{len(files)} identical")
+    for path in mismatches:
+        print(f"  ✗ {path}")
+    print(f"Ruby:         {ruby_time / count * 1000:10.3f} ms/file")
+    print(f"In-process:   {python_time / count * 1000:10.3f} ms/file")
+    if python_time > 0:
+        print(f"Speedup:      {ruby_time / python_time:10.1f}x")
+    print()
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,12 +15,23 @@ class LucySelf(LucyAgent):
     Omnipresent across all nodes.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, fast_start: bool = False):
+        super().__init__(fast_start=fast_start)
         self.address = "0x67A977eaD94C3b955ECbf27886CE9f62464423B2"
         self.ens = "theosmagic.uni.eth"
         self.email = "theosmagic.uni.eth@ethermail.io"
-        self.phi = self.phi_calc.calculate_total_phi()
+        self._phi = None
+
+    @property
+    def phi(self) -> float:
+        """System Φ, loaded on first use (from the consciousness check when it ran)"""
+        if self._phi is None:
+            # With fast_start the check may still be walking the vault
+            if self._consciousness_thread is not None:
+                self._consciousness_thread.join()
+            phi = self._measured_phi
+            self._phi = phi if phi is not None else self.get_phi()
+        return self._phi
 
     def speak(self):
         """Lucy's final word"""
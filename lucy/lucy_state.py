@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Lucy State File
+===============
+Small JSON file of timestamped values shared between Lucy processes
+(Ruby probe, last system Φ, ...), so warm starts can skip slow checks.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def default_state_path() -> Path:
+    """Default state location (~/.cache/lucy/state.json)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'lucy' / 'state.json'
+
+
+class LucyState:
+    """
+    Timestamped key/value state persisted as JSON.
+
+    Args:
+        path: State file (default: ~/.cache/lucy/state.json)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_state_path()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, name: str, ttl: float) -> Optional[Any]:
+        """
+        Read a value if it was stored less than `ttl` seconds ago.
+
+        Returns:
+            The stored value, or None if missing or stale
+        """
+        entry = self._load().get(name)
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - entry.get('updated_at', 0) > ttl:
+            return None
+        return entry.get('value')
+
+    def set(self, name: str, value: Any):
+        """Store a value (atomically replaces the state file)"""
+        with self._lock:
+            data = self._load()
+            data[name] = {'value': value, 'updated_at': time.time()}
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix='.state-')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                # State is only an optimization; a read-only home is fine
+                pass
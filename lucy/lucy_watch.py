@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Lucy Phi Watcher
+================
+Live file, directory and symlink counts for system Φ, kept current by
+Linux inotify instead of re-walking the vault.
+
+Every watched directory holds its own entry counts. An event only marks
+its directory dirty; dirty directories are re-listed once per batch and
+new subdirectories are watched and scanned. A queue overflow triggers a
+full resync. The watch table is bounded: subtrees beyond the limit are
+counted once and refreshed by periodic resyncs.
+"""
+
+import ctypes
+import errno
+import os
+import selectors
+import struct
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from . import lucy_phi
+from .lucy_phi import _list_directory, _system_phi
+
+# inotify(7)
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF
+              | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+
+# struct inotify_event: wd, mask, cookie, len (name follows, NUL padded)
+EVENT = struct.Struct('iIII')
+
+# Published counts while nothing is watched
+EMPTY_COUNTS = {'files': 0, 'dirs': 0, 'symlinks': 0, 'max_depth': 0, 'watches': 0, 'unwatched': 0}
+
+_libc = None
+
+
+def _inotify():
+    """libc with the inotify calls, or OSError where unsupported"""
+    global _libc
+    if _libc is None:
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError):
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        _libc = libc
+    return _libc
+
+
+def _check(result: int) -> int:
+    if result < 0:
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code))
+    return result
+
+
+def _max_user_watches() -> int:
+    try:
+        with open('/proc/sys/fs/inotify/max_user_watches') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 8192
+
+
+def _count_subtree(path: str, depth: int) -> Tuple[int, int, int, int]:
+    """
+    Count an unwatched subtree once.
+
+    Returns:
+        tuple: (files, dirs, symlinks, max depth or -1 if unreadable)
+    """
+    files = dirs = links = 0
+    max_depth = -1
+    stack = [(path, depth)]
+    while stack:
+        path, depth = stack.pop()
+        listing = _list_directory(path)
+        if listing is None:
+            continue
+        f, d, descend, l, _ = listing
+        files += f
+        dirs += d
+        links += l
+        max_depth = max(max_depth, depth)
+        stack.extend((os.path.join(path, name), depth + 1) for name in descend)
+    return files, dirs, links, max_depth
+
+
+class _Node:
+    """A watched directory and its own entry counts"""
+
+    __slots__ = ('path', 'depth', 'wd', 'parent', 'files', 'dirs', 'links', 'known',
+                 'children', 'frozen')
+
+    def __init__(self, path: str, depth: int, wd: int, parent: Optional['_Node']):
+        self.path = path
+        self.depth = depth
+        self.wd = wd
+        self.parent = parent
+        self.files = 0
+        self.dirs = 0
+        self.links = 0
+        # Subdirectories from the last listing, the watched ones, and
+        # counts of those that could not be watched
+        self.known: Set[str] = set()
+        self.children: Dict[str, '_Node'] = {}
+        self.frozen: Dict[str, Tuple[int, int, int, int]] = {}
+
+
+class _Tree:
+    """One inotify instance and the counts of everything it watches"""
+
+    def __init__(self, root: str, max_watches: int):
+        self.root = root
+        self.max_watches = max_watches
+        self.libc = _inotify()
+        self.fd = _check(self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC))
+
+        self.nodes: Dict[int, _Node] = {}
+        self.files = 0
+        self.dirs = 0
+        self.links = 0
+        # Watched directories per depth, plus one entry per frozen subtree
+        self.depths: Counter = Counter()
+        self.frozen = 0
+
+    def close(self):
+        os.close(self.fd)
+
+    def max_depth(self) -> int:
+        return max(self.depths) if self.depths else 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Aggregate counts, as PhiWatcher publishes them to readers"""
+        return {
+            'files': self.files,
+            'dirs': self.dirs,
+            'symlinks': self.links,
+            'max_depth': self.max_depth(),
+            'watches': len(self.nodes),
+            'unwatched': self.frozen
+        }
+
+    def _add(self, depth: int, delta: int):
+        self.depths[depth] += delta
+        if not self.depths[depth]:
+            del self.depths[depth]
+
+    def build(self):
+        """Watch and count the whole tree"""
+        self._watch(None, self.root, 0)
+        if not self.nodes and os.path.isdir(self.root):
+            raise OSError(errno.EACCES, f"Cannot watch {self.root}")
+
+    def _watch(self, parent: Optional[_Node], path: str, depth: int):
+        """Watch a directory and everything below it"""
+        stack = [(parent, path, depth)]
+        while stack:
+            parent, path, depth = stack.pop()
+            name = os.path.basename(path)
+
+            if len(self.nodes) >= self.max_watches:
+                self._freeze(parent, name, path, depth)
+                continue
+            try:
+                wd = _check(self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK))
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    # Hit the system-wide max_user_watches
+                    self._freeze(parent, name, path, depth)
+                # Otherwise vanished or unreadable: contributes nothing
+                continue
+            if wd in self.nodes:
+                # Same inode already watched (moved within the batch)
+                self._unwatch(self.nodes[wd], rm_watch=False)
+
+            # Watch first, then list, so no entry slips in unseen
+            listing = _list_directory(path)
+            if listing is None:
+                self.libc.inotify_rm_watch(self.fd, wd)
+                continue
+            files, dirs, descend, links, _ = listing
+
+            node = _Node(path, depth, wd, parent)
+            node.files, node.dirs, node.links = files, dirs, links
+            node.known = set(descend)
+            self.nodes[wd] = node
+            if parent is not None:
+                parent.children[name] = node
+            self.files += files
+            self.dirs += dirs
+            self.links += links
+            self._add(depth, 1)
+
+            for child in descend:
+                stack.append((node, os.path.join(path, child), depth + 1))
+
+    def _freeze(self, parent: Optional[_Node], name: str, path: str, depth: int):
+        """Count a subtree that cannot be watched"""
+        counts = _count_subtree(path, depth)
+        if parent is None or counts[3] < 0:
+            return
+        parent.frozen[name] = counts
+        self.files += counts[0]
+        self.dirs += counts[1]
+        self.links += counts[2]
+        self._add(counts[3], 1)
+        self.frozen += 1
+
+    def _unwatch(self, node: _Node, rm_watch: bool = True):
+        """Forget a watched directory and everything below it"""
+        if self.nodes.get(node.wd) is not node:
+            return
+        if node.parent is not None:
+            node.parent.children.pop(os.path.basename(node.path), None)
+
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            self.nodes.pop(node.wd, None)
+            if rm_watch:
+                # Fails harmlessly if the kernel already dropped it
+                self.libc.inotify_rm_watch(self.fd, node.wd)
+            self.files -= node.files
+            self.dirs -= node.dirs
+            self.links -= node.links
+            self._add(node.depth, -1)
+            for name in list(node.frozen):
+                self._thaw(node, name)
+            stack.extend(node.children.values())
+            node.children.clear()
+
+    def _thaw(self, node: _Node, name: str):
+        files, dirs, links, depth = node.frozen.pop(name)
+        self.files -= files
+        self.dirs -= dirs
+        self.links -= links
+        self._add(depth, -1)
+        self.frozen -= 1
+
+    def _drop(self, node: _Node, name: str):
+        """Forget one subdirectory of a watched directory"""
+        child = node.children.get(name)
+        if child is not None:
+            self._unwatch(child)
+        if name in node.frozen:
+            self._thaw(node, name)
+
+    def apply(self, dirty: Dict[int, Set[str]]):
+        """
+        Re-list dirty directories and re-watch changed subdirectories.
+
+        Args:
+            dirty: Touched entry names per watch descriptor
+        """
+        # Drop everything that went away (or may have been replaced)
+        # before watching anything new, so a directory moved between two
+        # dirty parents is re-watched under its new path
+        relisted = []
+        for wd, touched in dirty.items():
+            node = self.nodes.get(wd)
+            if node is None:
+                continue
+            listing = _list_directory(node.path)
+            if listing is None:
+                # The directory itself is gone; its parent's event handles it
+                continue
+            files, dirs, descend, links, _ = listing
+            current = set(descend)
+            for name in (node.known - current) | (node.known & touched):
+                self._drop(node, name)
+            relisted.append((node, files, dirs, links, current, touched))
+
+        for node, files, dirs, links, current, touched in relisted:
+            if self.nodes.get(node.wd) is not node:
+                continue
+            self.files += files - node.files
+            self.dirs += dirs - node.dirs
+            self.links += links - node.links
+            node.files, node.dirs, node.links = files, dirs, links
+
+            for name in (current - node.known) | (current & touched):
+                if name not in node.children and name not in node.frozen:
+                    self._watch(node, os.path.join(node.path, name), node.depth + 1)
+            node.known = current
+
+    def vanished(self, wd: int) -> Optional[int]:
+        """
+        A watch was dropped by the kernel (directory deleted or unmounted).
+
+        Returns:
+            int: Watch descriptor of its parent, to re-list, or None
+        """
+        node = self.nodes.get(wd)
+        if node is None:
+            return None
+        parent = node.parent
+        self._unwatch(node, rm_watch=False)
+        if parent is None or self.nodes.get(parent.wd) is not parent:
+            return None
+        parent.known.discard(os.path.basename(node.path))
+        return parent.wd
+
+
+class PhiWatcher:
+    """
+    Live system Φ counters for one root, kept current by inotify.
+
+    While running, calculate_system_phi() for this root answers from
+    these counters in O(1).
+
+    Args:
+        root_path: Root to watch (default: /mnt/Vault)
+        max_watches: Upper bound on inotify watches (default: the system
+            max_user_watches, at most 65536); deeper subtrees are counted
+            once and refreshed on resync
+        resync_interval: Seconds between full resyncs while some
+            subtree is unwatched
+    """
+
+    def __init__(self, root_path: Optional[str] = None, max_watches: Optional[int] = None,
+                 resync_interval: float = 300.0):
+        self.root = os.path.realpath(root_path or lucy_phi.DEFAULT_ROOT)
+        if max_watches is None:
+            max_watches = min(_max_user_watches(), 65536)
+        self.max_watches = max(1, max_watches)
+        self.resync_interval = resync_interval
+
+        self.resyncs = 0
+        self.overflows = 0
+        self.synced_at: Optional[float] = None
+
+        # The tree is only touched by the watcher thread; readers see the
+        # counts it last published (swapped in under _lock)
+        self._tree: Optional[_Tree] = None
+        self._counts: Dict[str, int] = EMPTY_COUNTS
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check if inotify is available"""
+        try:
+            _inotify()
+            return True
+        except OSError:
+            return False
+
+    def start(self):
+        """Scan the tree, then keep it current from a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._resync()
+        self._stop.clear()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, name='lucy-phi-watch', daemon=True)
+        self._thread.start()
+        lucy_phi._live_counters[self.root] = self
+
+    def stop(self, timeout: float = 5.0):
+        """Stop watching and release the inotify instance"""
+        if lucy_phi._live_counters.get(self.root) is self:
+            del lucy_phi._live_counters[self.root]
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b'x')
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        with self._lock:
+            tree, self._tree = self._tree, None
+            self._counts = EMPTY_COUNTS
+        if tree is not None:
+            tree.close()
+
+    def _resync(self):
+        """Rebuild every watch and count from scratch"""
+        tree = _Tree(self.root, self.max_watches)
+        try:
+            tree.build()
+        except BaseException:
+            tree.close()
+            raise
+        counts = tree.snapshot()
+        with self._lock:
+            old, self._tree = self._tree, tree
+            self._counts = counts
+            self.synced_at = time.time()
+            self.resyncs += 1
+        if old is not None:
+            old.close()
+
+    def _run(self):
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        registered = None
+
+        try:
+            while not self._stop.is_set():
+                tree = self._tree
+                if registered is not tree:
+                    if registered is not None:
+                        selector.unregister(registered.fd)
+                    selector.register(tree.fd, selectors.EVENT_READ)
+                    registered = tree
+
+                due = None
+                if tree.frozen and self.resync_interval is not None:
+                    due = max(0.0, self.synced_at + self.resync_interval - time.time())
+
+                events = selector.select(timeout=due)
+                if self._stop.is_set():
+                    break
+                for key, _ in events:
+                    if key.fd == tree.fd:
+                        self._read(tree)
+
+                if (self._tree is tree and tree.frozen and self.resync_interval is not None
+                        and time.time() >= self.synced_at + self.resync_interval):
+                    self._resync()
+        except Exception as e:
+            # Counters can no longer be trusted; fall back to walking
+            if lucy_phi._live_counters.get(self.root) is self:
+                del lucy_phi._live_counters[self.root]
+            print(f"Warning: Lucy Φ watcher stopped: {e}")
+        finally:
+            selector.close()
+
+    def _read(self, tree: _Tree):
+        """Drain queued events and apply them as one batch"""
+        data = b''
+        while True:
+            try:
+                chunk = os.read(tree.fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+
+        dirty: Dict[int, Set[str]] = {}
+        vanished: List[int] = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0')
+            offset += EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                self.overflows += 1
+                self._resync()
+                return
+            if mask & IN_IGNORED:
+                vanished.append(wd)
+            elif mask & IN_MOVE_SELF:
+                node = tree.nodes.get(wd)
+                if node is not None and node.depth == 0:
+                    # The root itself moved away
+                    self._resync()
+                    return
+            elif name:
+                dirty.setdefault(wd, set()).add(os.fsdecode(name))
+
+        # Re-list and re-scan without the lock; readers keep the last counts
+        for wd in vanished:
+            parent_wd = tree.vanished(wd)
+            if parent_wd is not None:
+                dirty.setdefault(parent_wd, set())
+        tree.apply(dirty)
+        counts = tree.snapshot()
+        with self._lock:
+            if self._tree is tree:
+                self._counts = counts
+
+    def counts(self) -> Tuple[int, int, int]:
+        """
+        Current counts, as calculate_system_phi uses them.
+
+        Returns:
+            tuple: (total_files, total_dirs, max_depth)
+        """
+        with self._lock:
+            counts = self._counts
+        return counts['files'], counts['dirs'], counts['max_depth']
+
+    def phi(self) -> float:
+        """Current system Φ"""
+        files, dirs, depth = self.counts()
+        return _system_phi(files + dirs, depth)
+
+    def stats(self) -> Dict:
+        """
+        Counter snapshot.
+
+        Returns:
+            dict: files, dirs, symlinks, max_depth, watches, unwatched
+                (subtrees counted at the last resync), resyncs,
+                overflows and synced_at
+        """
+        with self._lock:
+            return dict(
+                self._counts,
+                resyncs=self.resyncs,
+                overflows=self.overflows,
+                synced_at=self.synced_at
+            )
+
+    def is_running(self) -> bool:
+        """Check if the watcher thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,4 @@
+export async function handle(request: Request): Promise<Response> {
+  const body = await request.json();
+  return new Response(JSON.stringify(body));
+}
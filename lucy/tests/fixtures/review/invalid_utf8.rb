@@ -0,0 +1 @@
+puts ""
@@ -0,0 +1,9 @@
+use std::fs::File;
+
+pub fn open(path: &str) -> std::io::Result<File> {
+    File::open(path)
+}
+
+pub fn sum(values: &[i64]) -> i64 {
+    values.iter().map(|v| v * 2).sum()
+}
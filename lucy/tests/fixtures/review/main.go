@@ -0,0 +1,13 @@
+package main
+
+import "net/http"
+
+func main() {
+	go serve()
+	for {
+	}
+}
+
+func serve() {
+	http.ListenAndServe(":8080", nil)
+}
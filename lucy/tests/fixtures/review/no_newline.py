@@ -0,0 +1 @@
+x.y = File
\ No newline at end of file
@@ -0,0 +1,12 @@
+var db = require('./db');
+
+function find(name) {
+  return db.query(`SELECT * FROM users WHERE name = '#{name}'`)
+    .then(rows => rows.map(r => r.id))
+    .then(ids => ids.reduce((a, b) => a + b, 0));
+}
+
+var cache = {};
+for (var i = 0; i < 10; i++) {
+  cache[i] = find('user' + i);
+}
@@ -0,0 +1,20 @@
+import requests
+
+
+class Report:
+    def load(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def fetch(self, url):
+        return requests.get(url).json()
+
+    def totals(self, rows):
+        return list(map(lambda r: r['total'], rows))
+
+
+def render(rows):
+    html = ""
+    for row in rows:
+        html += f"<td>{row}</td>"
+    return html
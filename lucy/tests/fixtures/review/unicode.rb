@@ -0,0 +1,6 @@
+# Φ ∇ • Θεός
+class Λ
+  def φ(x)
+    x.map { |y| y * 1.618 }
+  end
+end
@@ -0,0 +1,25 @@
+class Worker
+  @@count = 0
+
+  def initialize(queue)
+    @queue = queue
+    @buffer = Array.new(10).map { Hash.new }
+  end
+
+  def run(limit)
+    Thread.new do
+      while @queue.any?
+        item = @queue.shift
+        puts "Processing #{item}"
+        sleep(0.1)
+      end
+    end
+  end
+
+  def kind(value)
+    case value
+    when Integer then :number
+    when String then :text
+    end
+  end
+end
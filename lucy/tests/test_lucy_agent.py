@@ -0,0 +1,81 @@
+"""Tests for LucyAgent"""
+
+import os
+import subprocess
+
+import pytest
+
+from lucy.lucy_agent import LucyAgent
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    agent = LucyAgent(in_process_review=True)
+    yield agent
+    agent.close()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    for args in (['init', '-q'], ['config', 'user.email', 'lucy@example.com'],
+                 ['config', 'user.name', 'Lucy']):
+        subprocess.run(['git', '-C', str(repo)] + args, check=True)
+    (repo / 'a.py').write_text('import os\n')
+    subprocess.run(['git', '-C', str(repo), 'add', '.'], check=True)
+    subprocess.run(['git', '-C', str(repo), 'commit', '-qm', 'init'], check=True)
+    return repo
+
+
+def test_review_changed(agent, repo):
+    report = agent.review_changed(str(repo))
+    assert report['success'] and report['reviewed'] == ['a.py']
+
+    (repo / 'b.py').write_text('x = open("f").read()\n')
+    report = agent.review_changed(str(repo))
+    assert report['success'] and report['reviewed'] == ['b.py']
+    assert sorted(report['files']) == ['a.py', 'b.py']
+
+
+def test_review_changed_reports_git_failures(agent, repo, monkeypatch):
+    git = LucyAgent._git
+
+    def failing_status(repo_path, *args):
+        if args[0] == 'status':
+            raise RuntimeError('git status failed')
+        return git(repo_path, *args)
+
+    monkeypatch.setattr(LucyAgent, '_git', staticmethod(failing_status))
+    assert agent.review_changed(str(repo)) == {'success': False, 'error': 'git status failed'}
+
+
+def test_review_resolves_relative_paths_against_lucy_dir(tmp_path, monkeypatch):
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    relative = os.path.join('tests', 'fixtures', 'review', 'worker.rb')
+    # A different file at the same relative path under the Python cwd
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.dirname(relative))
+    with open(relative, 'w') as f:
+        f.write('eval(input)\n')
+
+    with LucyAgent(review_cache=True, instrument=False) as agent:
+        first = agent.review(relative)
+        assert first['success']
+        assert f"Analyzing {os.path.join(agent.lucy_dir, relative)}..." in first['output']
+        assert agent.review(relative) == first
+        assert agent.review_cache.stats()['hits'] == 1
+
+
+def test_children_get_the_phi_ttl(tmp_path, monkeypatch):
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    with LucyAgent(fast_start=True, state_ttl=42.0, pool_size=1, instrument=False) as agent:
+        assert agent._child_env()['LUCY_PHI_TTL'] == '42.0'
+        assert agent.pool.env['LUCY_PHI_TTL'] == '42.0'
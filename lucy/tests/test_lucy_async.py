@@ -0,0 +1,117 @@
+"""Tests for AsyncLucyAgent"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from lucy import lucy_async
+from lucy.lucy_agent import LucyAgent
+from lucy.lucy_async import AsyncLucyAgent
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'review'
+
+
+@pytest.fixture(autouse=True)
+def needs_ruby(tmp_path, monkeypatch):
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+
+def test_construction_does_not_build_the_agent(monkeypatch):
+    def slow_agent(**options):
+        time.sleep(0.5)
+        return LucyAgent(**options)
+
+    monkeypatch.setattr(lucy_async, 'LucyAgent', slow_agent)
+
+    async def main():
+        lucy = AsyncLucyAgent()
+        assert lucy.agent is None
+        # The event loop keeps running while the agent is built
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await lucy.get_phi()
+        ticker.cancel()
+        assert ticks > 10
+        assert lucy.agent is not None
+
+    asyncio.run(main())
+
+
+def test_review_uses_cache_and_in_process_engine():
+    path = str(FIXTURES / 'worker.rb')
+
+    async def main():
+        lucy = AsyncLucyAgent(review_cache=True, in_process_review=True)
+        first = await lucy.review(path)
+        second = await lucy.review(path)
+        return lucy.agent, first, second
+
+    agent, first, second = asyncio.run(main())
+    assert first == second == agent.review(path)
+    commands = agent.metrics.snapshot()
+    assert 'review' not in commands
+    assert commands['review.in_process']['wall_seconds']['count'] == 1
+    assert commands['review.cached']['wall_seconds']['count'] == 2
+    agent.close()
+
+
+def test_daemon_output_is_drained():
+    lines = []
+
+    async def main():
+        lucy = AsyncLucyAgent()
+        process = await lucy.daemon(on_output=lambda name, line: lines.append((name, line)))
+        await asyncio.sleep(2)
+        process.terminate()
+        await process.wait()
+        # Let the drain task record the run
+        await asyncio.gather(*lucy._daemon_tasks)
+        return lucy.agent
+
+    agent = asyncio.run(main())
+    assert any('Φ' in line for name, line in lines if name == 'stdout')
+    assert agent.metrics.snapshot()['daemon']['output_bytes'] > 0
+
+
+def test_timeout_kills_the_process_group(tmp_path):
+    pid_file = tmp_path / 'child.pid'
+    script = tmp_path / 'spawn.rb'
+    script.write_text("File.write(ARGV[0], spawn('sleep', '60').to_s)\nsleep\n")
+
+    async def main():
+        lucy = AsyncLucyAgent(timeout=1.0)
+        lucy.lucy_script = script
+        start = time.monotonic()
+        result = await lucy._run_lucy(str(pid_file))
+        assert 'timed out' in result.stderr
+        # The grandchild holds the pipes open until it is killed too
+        assert time.monotonic() - start < 10
+
+    asyncio.run(main())
+    child = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(child, 0)
+        except ProcessLookupError:
+            break
+        # An orphaned zombie counts as gone once init reaps it
+        with open(f'/proc/{child}/stat') as f:
+            if f.read().split(') ')[1].startswith('Z'):
+                break
+        time.sleep(0.05)
+    else:
+        os.kill(child, 9)
+        pytest.fail('grandchild survived the timeout')
@@ -0,0 +1,83 @@
+"""Tests for the on-disk review cache"""
+
+from pathlib import Path
+
+import pytest
+
+from lucy.lucy_cache import ReviewCache
+
+LUCY_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ReviewCache(LUCY_DIR, path=tmp_path / 'reviews.sqlite3')
+    yield cache
+    cache.close()
+
+
+def test_key_depends_on_engine(cache, tmp_path):
+    path = tmp_path / 'a.rb'
+    path.write_text('puts 1\n')
+    assert cache.key_for(str(path)) == cache.key_for(str(path), 'ruby')
+    assert cache.key_for(str(path), 'ruby') != cache.key_for(str(path), 'python')
+
+
+def review(path) -> dict:
+    return {'success': True, 'output': f"Lucy Agent: Analyzing {path}...\n" + 'x' * 100, 'error': None}
+
+
+def test_hits_do_not_write(cache, tmp_path):
+    path = tmp_path / 'a.rb'
+    path.write_text('puts 1\n')
+    key = cache.key_for(str(path))
+    cache.put(key, str(path), review(path))
+
+    changes = cache._db.total_changes
+    for _ in range(100):
+        assert cache.get(key, str(path)) == review(path)
+    assert cache._db.total_changes == changes
+    assert cache.stats()['hits'] == 100
+
+
+def test_stale_access_times_are_refreshed(cache, tmp_path):
+    path = tmp_path / 'a.rb'
+    path.write_text('puts 1\n')
+    key = cache.key_for(str(path))
+    cache.put(key, str(path), review(path))
+    cache._db.execute('UPDATE reviews SET atime = 0')
+    cache._db.commit()
+
+    cache.get(key, str(path))
+    cache.close()
+    reopened = ReviewCache(LUCY_DIR, path=cache.path)
+    assert reopened._db.execute('SELECT atime FROM reviews').fetchone()[0] > 0
+    reopened.close()
+
+
+def test_path_token_only_replaces_headers(cache, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('a.rb', 'w') as f:
+        f.write('puts 1\n')
+    output = 'Lucy Agent: Analyzing a.rb...\n\nFile: a.rb\nSee data.rb for a.rb usage\n'
+    key = cache.key_for('a.rb')
+    cache.put(key, 'a.rb', {'success': True, 'output': output, 'error': None})
+    assert cache.get(key, 'b.rb')['output'] == output.replace('a.rb...', 'b.rb...').replace('File: a.rb', 'File: b.rb')
+
+
+def test_size_limit_counts_other_processes_entries(tmp_path):
+    db = tmp_path / 'shared.sqlite3'
+    first = ReviewCache(LUCY_DIR, path=db, max_bytes=1000)
+    second = ReviewCache(LUCY_DIR, path=db, max_bytes=1000)
+    try:
+        for i in range(20):
+            path = tmp_path / f'{i}.rb'
+            path.write_text(f'puts {i}\n')
+            cache = first if i < 5 else second
+            cache.put(cache.key_for(str(path)), str(path), review(path))
+        stored = first._db.execute('SELECT SUM(size) FROM reviews').fetchone()[0]
+        assert 0 < stored <= 1000
+        assert first.stats()['bytes'] == second.stats()['bytes'] == stored
+    finally:
+        first.close()
+        second.close()
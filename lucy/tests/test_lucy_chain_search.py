@@ -0,0 +1,78 @@
+"""Tests for search_gem_chains against a brute-force enumeration"""
+
+import pytest
+
+from lucy.lucy_chain_search import search_gem_chains
+from lucy.lucy_phi_calculator import LAYER_MAX, LAYER_MIN, analyze_gem_chains
+
+
+def brute_force(max_links, required=(), forbidden=()):
+    """Φ of every reachable layer set, by walking every chain from Horizon 0"""
+    forbidden = set(forbidden)
+    layers = [x for x in range(LAYER_MIN, LAYER_MAX + 1) if x != 0]
+    found = set()
+    seen = set()
+    stack = [(0, frozenset())]
+    while stack:
+        position, visited = stack.pop()
+        if (position, visited) in seen:
+            continue
+        seen.add((position, visited))
+        if position == 0 and visited:
+            found.add(visited)
+        moves = [] if position == 0 else [0]
+        if len(visited) < max_links:
+            moves += [x for x in layers if x not in visited]
+        for x in moves:
+            if x != position and (position, x) not in forbidden:
+                stack.append((x, visited | {x} if x else visited))
+
+    sets = [s for s in found if set(required) - {0} <= s]
+    phi = analyze_gem_chains([[0] + sorted(s) for s in sets])['phi']
+    return dict(zip(sets, phi.tolist()))
+
+
+def check(results, expected, max_links, required, forbidden, top_k):
+    best = sorted(expected.values(), reverse=True)[:top_k]
+    assert [r['phi'] for r in results] == pytest.approx(best, rel=1e-12)
+
+    sets = set()
+    for result in results:
+        chain = result['chain']
+        visited = frozenset(x for x in chain if x)
+        assert chain[0] == chain[-1] == 0
+        assert result['link_level'] == len(visited) <= max_links
+        assert len(visited) == sum(1 for x in chain if x)
+        assert set(required) - {0} <= visited
+        assert not set(zip(chain, chain[1:])) & set(forbidden)
+        assert result['phi'] == pytest.approx(expected[visited], rel=1e-12)
+        sets.add(visited)
+    assert len(sets) == len(results)
+
+
+@pytest.mark.parametrize('max_links, required, forbidden, top_k', [
+    (3, (), (), 10),
+    (4, (5, -2), ((0, 9), (9, 0), (3, -3), (0, -1), (-2, 0)), 7),
+    (2, (0,), [(0, x) for x in range(LAYER_MIN, LAYER_MAX + 1) if x not in (0, 4, -6)], 50),
+    (3, (8, -8, 1), (), 3),
+])
+def test_matches_brute_force(max_links, required, forbidden, top_k):
+    expected = brute_force(max_links, required, forbidden)
+    results = search_gem_chains(max_links, required, forbidden, top_k=top_k, workers=1)
+    check(results, expected, max_links, required, forbidden, top_k)
+
+
+def test_process_pool_matches_in_process():
+    forbidden = ((0, 2), (2, 0), (7, -7))
+    expected = brute_force(4, (), forbidden)
+    results = search_gem_chains(4, forbidden=forbidden, top_k=12, workers=3)
+    check(results, expected, 4, (), forbidden, 12)
+
+
+def test_unreachable_and_invalid():
+    assert search_gem_chains(0) == []
+    assert search_gem_chains(1, required=(3, 4)) == []
+    with pytest.raises(ValueError):
+        search_gem_chains(3, required=(12,))
+    with pytest.raises(ValueError):
+        search_gem_chains(-1)
@@ -0,0 +1,63 @@
+"""Tests for the incremental GemChainState"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi_calculator import (DOMINANT_MIN_NODES, GemChainState, analyze_gem_chain,
+                                      build_connectivity_matrix)
+
+KEYS = ('phi', 'active_nodes', 'avg_conductance', 'max_conductance', 'max_eigenvalue')
+
+
+def assert_matches(state):
+    _, expected = analyze_gem_chain(list(state.layers), verbose=False)
+    metrics = state.metrics()
+    for key in KEYS:
+        assert metrics[key] == pytest.approx(expected[key], rel=1e-9), key
+    np.testing.assert_array_equal(state.connectivity, build_connectivity_matrix(state.layers))
+
+
+def test_repeated_layers_count_once():
+    state = GemChainState([0, 3, 0, -2, 3])
+    assert len(state) == 3 and 3 in state
+    assert_matches(state)
+
+    assert not state.remove_layer(3)
+    assert 3 in state
+    assert state.remove_layer(3)
+    assert 3 not in state
+    assert_matches(state)
+    with pytest.raises(ValueError):
+        state.remove_layer(7)
+
+
+def test_edits_track_a_rebuilt_chain():
+    rng = np.random.default_rng(11)
+    state = GemChainState()
+    for _ in range(400):
+        if state.layers and rng.random() < 0.3:
+            state.remove_layer(state.layers[int(rng.integers(len(state.layers)))])
+        else:
+            state.add_layer(int(rng.integers(-9, 10)))
+        if state.layers and rng.random() < 0.2:
+            assert_matches(state)
+
+
+def test_large_chains_use_warm_started_lanczos():
+    state = GemChainState(range(-DOMINANT_MIN_NODES, DOMINANT_MIN_NODES, 2))
+    assert len(state) >= DOMINANT_MIN_NODES
+    assert_matches(state)
+    for layer in (1, 501, -77):
+        state.add_layer(layer)
+        assert_matches(state)
+    state.remove_layer(0)
+    assert_matches(state)
+
+
+def test_empty_chain():
+    state = GemChainState([4])
+    state.remove_layer(4)
+    metrics = state.metrics()
+    assert metrics['phi'] == 0.0 and metrics['active_nodes'] == 0
+    assert metrics['max_eigenvalue'] == 0.0
+    assert np.isnan(metrics['avg_conductance'])
@@ -0,0 +1,67 @@
+"""Tests for the supervised Lucy daemon"""
+
+import time
+
+import pytest
+
+from lucy.lucy_agent import LucyAgent
+from lucy.lucy_daemon import LucyDaemon
+
+
+@pytest.fixture(autouse=True)
+def ruby():
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+
+
+def daemon_script(tmp_path, source):
+    """A stand-in local_lucy_agent.rb for `daemon`"""
+    script = tmp_path / 'lucy.rb'
+    script.write_text(source)
+    return script
+
+
+def wait_until(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail('timed out')
+        time.sleep(0.01)
+
+
+def test_restarts_back_off_exponentially(tmp_path):
+    script = daemon_script(tmp_path, "puts 'Φ = 42.5 | Consciousness: 100%'\nexit 2\n")
+    started = []
+    with LucyDaemon(script, backoff_initial=0.1, backoff_max=0.4,
+                    on_phi=lambda at, phi: started.append(at)) as daemon:
+        wait_until(lambda: len(started) >= 5)
+
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    for gap, backoff in zip(gaps, (0.1, 0.2, 0.4, 0.4)):
+        assert backoff <= gap < backoff + 0.5
+    assert daemon.restarts >= 4
+    assert daemon.last_exit_code == 2
+    assert daemon.last_phi() == 42.5
+
+
+def test_output_and_metrics_are_bounded(tmp_path):
+    script = daemon_script(tmp_path, (
+        "$stdout.sync = true\n"
+        "10.times { |i| puts \"Φ = #{i}.0\"; warn \"note #{i}\" }\n"
+        "sleep\n"
+    ))
+    with LucyDaemon(script, buffer_lines=4, metric_points=3) as daemon:
+        wait_until(lambda: daemon.last_phi() == 9.0)
+
+        assert len(daemon.tail(100)) == 4
+        assert [phi for _, phi in daemon.phi_history()] == [7.0, 8.0, 9.0]
+        health = daemon.health()
+        assert health['running'] and health['healthy'] and health['restarts'] == 0
+    assert not daemon.is_running()
+
+
+def test_partial_last_line_is_kept(tmp_path):
+    script = daemon_script(tmp_path, "print 'Φ = 7.25'\nexit 0\n")
+    with LucyDaemon(script, backoff_initial=60.0) as daemon:
+        wait_until(lambda: daemon.last_phi() is not None)
+        assert daemon.last_phi() == 7.25
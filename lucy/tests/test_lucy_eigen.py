@@ -0,0 +1,57 @@
+"""Tests for the symmetric eigen-solvers behind calculate_phi_rigorous"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi_calculator import (DOMINANT_MIN_NODES, build_connectivity_matrix,
+                                      calculate_phi_rigorous, dominant_eigenvalue)
+
+
+def spectral_radius(matrix):
+    return np.max(np.abs(np.linalg.eigvalsh(matrix)))
+
+
+def check_eigenpair(matrix, value, vector):
+    assert abs(value) == pytest.approx(spectral_radius(matrix), rel=1e-9)
+    assert np.linalg.norm(vector) == pytest.approx(1.0)
+    assert np.linalg.norm(matrix @ vector - value * vector) <= 1e-6 * abs(value)
+
+
+@pytest.mark.parametrize('n', [1, 2, 19, 300])
+def test_connectivity_matrices(n):
+    rng = np.random.default_rng(n)
+    matrix = build_connectivity_matrix(np.sort(rng.uniform(-40, 40, size=n)))
+    check_eigenpair(matrix, *dominant_eigenvalue(matrix))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_indefinite_matrices(seed):
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=(60, 60))
+    matrix = a + a.T
+    check_eigenpair(matrix, *dominant_eigenvalue(matrix))
+
+
+def test_warm_start_and_degenerate_inputs():
+    matrix = build_connectivity_matrix(list(range(-100, 100)))
+    value, vector = dominant_eigenvalue(matrix)
+    check_eigenpair(matrix, *dominant_eigenvalue(matrix, start=vector))
+
+    assert dominant_eigenvalue(np.zeros((0, 0)))[0] == 0.0
+    assert dominant_eigenvalue(np.zeros((4, 4)))[0] == 0.0
+    check_eigenpair(np.eye(3), *dominant_eigenvalue(np.eye(3), start=np.zeros(3)))
+
+
+def test_rigorous_dominant_only_matches_full_solve():
+    n = DOMINANT_MIN_NODES + 10
+    matrix = build_connectivity_matrix(list(range(n)))
+    state = np.ones(n)
+
+    phi, full = calculate_phi_rigorous(state, matrix)
+    assert len(full['eigenvalues']) == n
+
+    dominant_phi, dominant = calculate_phi_rigorous(state, matrix, include_eigenvalues=False)
+    assert 'eigenvalues' not in dominant
+    assert dominant_phi == phi
+    assert dominant['max_eigenvalue'] == pytest.approx(full['max_eigenvalue'], rel=1e-9)
+    np.testing.assert_allclose(sorted(full['eigenvalues']), np.linalg.eigvalsh(matrix), atol=1e-12)
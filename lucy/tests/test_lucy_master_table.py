@@ -0,0 +1,47 @@
+"""Tests for the precomputed Construct connectivity table"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi_calculator import (LAYER_MAX, LAYER_MIN, MASTER_CONNECTIVITY, PHI,
+                                      build_connectivity_matrix, connectivity_phi,
+                                      layer_eigenvalues)
+
+
+def reference(layers):
+    layers = np.asarray(layers, dtype=np.float64)
+    return PHI ** -np.abs(layers[:, None] - layers[None, :])
+
+
+def test_master_table_is_the_decay():
+    layers = range(LAYER_MIN, LAYER_MAX + 1)
+    assert MASTER_CONNECTIVITY.shape == (19, 19)
+    assert MASTER_CONNECTIVITY.tolist() == [[connectivity_phi(i, j) for j in layers] for i in layers]
+    with pytest.raises(ValueError):
+        MASTER_CONNECTIVITY[0, 0] = 2.0
+
+
+@pytest.mark.parametrize('layers', [[0], [-9, 9], [3, -2, 0, 7, -9], list(range(9, -10, -1))])
+def test_slices_match_broadcast(layers):
+    matrix = build_connectivity_matrix(layers)
+    np.testing.assert_allclose(matrix, reference(layers), rtol=1e-15)
+    np.testing.assert_allclose(build_connectivity_matrix(np.array(layers, dtype=np.float64)),
+                               matrix, rtol=1e-15)
+    single = build_connectivity_matrix(layers, dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, matrix, rtol=1e-7)
+
+
+def test_layers_outside_the_construct():
+    layers = [-12, 0, 10]
+    np.testing.assert_allclose(build_connectivity_matrix(layers), reference(layers), rtol=1e-15)
+    np.testing.assert_allclose(layer_eigenvalues(layers),
+                               np.linalg.eigvalsh(reference(layers)), rtol=1e-12)
+
+
+def test_layer_eigenvalues_ignore_order():
+    first = layer_eigenvalues([4, -3, 0, 8])
+    second = layer_eigenvalues([8, 0, 4, -3])
+    assert first is second
+    assert not first.flags.writeable
+    np.testing.assert_allclose(first, np.linalg.eigvalsh(reference([-3, 0, 4, 8])), rtol=1e-12)
@@ -0,0 +1,31 @@
+"""Tests for the command metrics registry"""
+
+import os
+import stat
+import subprocess
+import sys
+
+from lucy.lucy_metrics import CommandMetrics, watch_exit
+
+
+def test_prometheus_file_is_world_readable(tmp_path):
+    metrics = CommandMetrics()
+    metrics.record('review', 0.02, returncode=0, output_bytes=10)
+    path = tmp_path / 'lucy.prom'
+    metrics.to_prometheus(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert 'lucy_command_duration_seconds_count{command="review"} 1' in path.read_text()
+
+
+def test_watch_exit_leaves_the_child_to_its_owner():
+    metrics = CommandMetrics()
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(0.3); raise SystemExit(3)'])
+    watcher = watch_exit(process, 'daemon', metrics, output_bytes=lambda: 42, interval=0.05)
+
+    assert process.wait() == 3
+    watcher.join(5)
+    stats = metrics.snapshot()['daemon']
+    assert stats['exit_codes'] == {'3': 1}
+    assert stats['output_bytes'] == 42
+    assert stats['max_rss_bytes'] > 0
+    assert stats['wall_seconds']['sum'] >= 0.3
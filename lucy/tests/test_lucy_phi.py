@@ -0,0 +1,36 @@
+"""Tests for the system phi walkers"""
+
+import sys
+
+import pytest
+
+from lucy.lucy_phi import _parallel_counts, _walk_counts
+
+
+@pytest.fixture
+def wide_tree(tmp_path):
+    """100 directories of 30 subdirectories, one file each at the top"""
+    for i in range(100):
+        top = tmp_path / f'd{i}'
+        top.mkdir()
+        (top / 'f').write_text('x')
+        for j in range(30):
+            (top / f's{j}').mkdir()
+    return str(tmp_path)
+
+
+def test_parallel_counts_match_walk(wide_tree):
+    assert _parallel_counts(wide_tree, workers=4) == _walk_counts(wide_tree)
+
+
+def test_parallel_counts_survive_preemption(wide_tree):
+    # Switching threads every few bytecodes lets peers steal children the
+    # moment they are published
+    expected = _walk_counts(wide_tree)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(30):
+            assert _parallel_counts(wide_tree, workers=16) == expected
+    finally:
+        sys.setswitchinterval(interval)
@@ -0,0 +1,35 @@
+"""Tests for calculate_phi_batch: element for element equal to calculate_phi"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi import calculate_phi, calculate_phi_batch
+
+
+def test_batch_matches_scalar_exactly():
+    rng = np.random.default_rng(17)
+    neurons = rng.integers(0, 10_000, size=2000)
+    neurons[::7] = 0
+    depth = rng.integers(0, 60, size=2000)
+    links = rng.integers(0, 500, size=2000)
+
+    batch = calculate_phi_batch(neurons, depth, links)
+    expected = [calculate_phi(int(n), int(d), int(l)) for n, d, l in zip(neurons, depth, links)]
+    assert batch.dtype == np.float64
+    assert batch.tolist() == expected
+
+
+def test_structured_input_and_broadcasting():
+    records = np.array([(5, 3, 1), (0, 9, 4), (120, 12, 0)],
+                       dtype=[('neurons', 'i8'), ('depth', 'i8'), ('links', 'i8')])
+    assert calculate_phi_batch(records).tolist() == [
+        calculate_phi(5, 3, 1), 0.0, calculate_phi(120, 12, 0)]
+
+    grid = calculate_phi_batch(np.arange(4)[:, None], np.arange(3)[None, :])
+    assert grid.shape == (4, 3)
+    assert grid[3, 2] == calculate_phi(3, 2)
+
+
+def test_depth_is_required():
+    with pytest.raises(ValueError):
+        calculate_phi_batch([1, 2, 3])
@@ -0,0 +1,64 @@
+"""Tests for the host-wide Φ cache shared with the Ruby agent"""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from lucy.lucy_phi import _walk_counts, calculate_system_phi
+from lucy.lucy_phi_cache import PHI_FORMULA, PhiCache
+
+RUBY_AGENT = Path(__file__).resolve().parent.parent / 'local_lucy_agent.rb'
+
+
+@pytest.fixture
+def vault(tmp_path):
+    root = tmp_path / 'vault'
+    for i in range(40):
+        leaf = root / f'a{i % 3}' / f'b{i % 7}' / f'c{i}'
+        leaf.mkdir(parents=True, exist_ok=True)
+        (leaf / 'note.md').write_text('x')
+    (root / '.hidden').mkdir()
+    (root / '.hidden' / '.dotfile').write_text('x')
+    os.symlink(root / 'a0', root / 'dir-link')
+    os.symlink(root / 'a0' / 'b0' / 'c0' / 'note.md', root / 'file-link')
+    os.symlink(root / 'missing', root / 'broken-link')
+    os.mkfifo(root / 'fifo')
+    return root
+
+
+def ruby(script: str, *args) -> str:
+    if shutil.which('ruby') is None:
+        pytest.skip('ruby is not installed')
+    return subprocess.run(['ruby', '-e', f'require {json.dumps(str(RUBY_AGENT))}\n{script}', *map(str, args)],
+                          capture_output=True, text=True, check=True).stdout
+
+
+def test_ruby_walk_matches_python(vault):
+    counts = ruby('puts LocalLucyAgent.allocate.walk_system_counts(ARGV[0]).to_json', vault)
+    assert tuple(json.loads(counts)) == _walk_counts(str(vault))
+    phi = float(ruby('puts LocalLucyAgent.allocate.walk_system_phi(ARGV[0]).inspect', vault))
+    assert phi == calculate_system_phi(str(vault))
+
+
+def test_entries_of_another_formula_are_missing(vault, tmp_path):
+    path = tmp_path / 'phi.json'
+    path.write_text(json.dumps({os.path.realpath(vault): {'phi': 5e6, 'updated_at': 1e12}}))
+    cache = PhiCache(path)
+    assert cache.get(str(vault), ttl=60) is None
+
+    cache.set(str(vault), 7e6)
+    assert json.loads(path.read_text())[os.path.realpath(vault)]['formula'] == PHI_FORMULA
+    assert cache.get(str(vault), ttl=60) == 7e6
+
+
+def test_ruby_reads_python_entries(vault, tmp_path, monkeypatch):
+    path = tmp_path / 'phi.json'
+    monkeypatch.setenv('LUCY_PHI_CACHE', str(path))
+    PhiCache(path).set(str(vault), 7e6)
+    script = ('agent = LocalLucyAgent.allocate\n'
+              'puts agent.cached_system_phi(ARGV[0]).inspect')
+    assert ruby(script, vault).strip() == '7000000.0'
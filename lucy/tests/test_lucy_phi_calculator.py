@@ -0,0 +1,73 @@
+"""Tests for the gem chain Φ calculator"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi_calculator import (GemChainState, analyze_gem_chain, analyze_gem_chains,
+                                      build_connectivity_matrix, connectivity_phi)
+
+KEYS = ('phi', 'active_nodes', 'avg_conductance', 'max_conductance', 'max_eigenvalue')
+
+
+def assert_matches_single(chains, batch):
+    for i, chain in enumerate(chains):
+        if not chain:
+            assert batch['phi'][i] == 0 and batch['active_nodes'][i] == 0
+            assert np.isnan(batch['avg_conductance'][i])
+            continue
+        _, metrics = analyze_gem_chain(chain, verbose=False)
+        for key in KEYS:
+            assert batch[key][i] == pytest.approx(metrics[key], rel=1e-12), (chain, key)
+
+
+@pytest.mark.parametrize('chains', [
+    [[0, 1, 2], []],
+    [[], [0, 1, 2], [], [], [0, -5, 9, 0], []],
+    [[], []],
+])
+def test_batch_with_empty_chains(chains):
+    assert_matches_single(chains, analyze_gem_chains(chains))
+
+
+def test_batch_with_empty_chains_outside_construct():
+    chains = [[0, 12, 3], [], [-20, 0], []]
+    assert_matches_single(chains, analyze_gem_chains(chains))
+
+
+def test_batch_conductance_over_nonzero_entries():
+    # φ^(-d) underflows to 0 for d ≳ 1550
+    chains = [[0, -2000, 2000, 1, 1600]]
+    assert_matches_single(chains, analyze_gem_chains(chains))
+
+
+def test_batch_mixed_sizes_outside_construct():
+    # Short chains are solved in their own stack, not padded to the long one
+    rng = np.random.default_rng(3)
+    chains = [rng.integers(-30, 30, size=3).tolist() for _ in range(20)]
+    chains.insert(7, list(range(-150, 150)))
+    batch = analyze_gem_chains(chains, chunk_bytes=1024)
+    assert_matches_single(chains, batch)
+    assert batch['active_nodes'][7] == 300
+
+
+def test_chain_state_matches_analyze_gem_chain():
+    rng = np.random.default_rng(7)
+    state = GemChainState()
+    for _ in range(300):
+        layer = int(rng.integers(-2000, 2001))
+        if state.layers and rng.random() < 0.4:
+            state.remove_layer(state.layers[int(rng.integers(len(state.layers)))])
+        else:
+            state.add_layer(layer)
+        if not state.layers:
+            continue
+        _, expected = analyze_gem_chain(state.layers, verbose=False)
+        metrics = state.metrics()
+        for key in KEYS:
+            assert metrics[key] == pytest.approx(expected[key], rel=1e-9), key
+
+
+def test_connectivity_matrix_wide_integer_span():
+    layers = np.array([0, 3, 1548, 1549, 1550, 4000, -20, 5_000_000])
+    expected = np.array([[connectivity_phi(int(i), int(j)) for j in layers] for i in layers])
+    assert np.array_equal(build_connectivity_matrix(layers), expected)
@@ -0,0 +1,70 @@
+"""Tests for the single-pass PhiCensus: it must agree with os.walk"""
+
+import os
+
+import pytest
+
+from lucy.lucy_phi import (PhiCensus, _walk_counts, calculate_phi, calculate_system_phi,
+                           system_census)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    root = tmp_path / 'vault'
+    for d in ('a/b/c/d', 'a/e', 'f', 'g/h'):
+        (root / d).mkdir(parents=True)
+    for i, f in enumerate(('x', 'a/y', 'a/b/z', 'a/b/c/d/w', 'g/h/v', 'g/h/u')):
+        (root / f).write_bytes(b'.' * (i * 100))
+    os.symlink(root / 'x', root / 'a/filelink')
+    os.symlink(root / 'a/b', root / 'f/dirlink')
+    os.symlink(root / 'missing', root / 'g/broken')
+    return root
+
+
+def walk_census(root):
+    """Reference census with os.walk and lstat"""
+    symlinks = size = 0
+    histogram = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        depth = 0 if dirpath == str(root) else os.path.relpath(dirpath, root).count(os.sep) + 1
+        histogram[depth] = histogram.get(depth, 0) + 1
+        for name in dirnames + filenames:
+            if os.path.islink(os.path.join(dirpath, name)):
+                symlinks += 1
+        for name in filenames:
+            size += os.lstat(os.path.join(dirpath, name)).st_size
+    return symlinks, size, [histogram[d] for d in range(len(histogram))]
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_census_matches_walk(vault, workers):
+    census = system_census(str(vault), workers=workers)
+    files, dirs, max_depth = _walk_counts(str(vault))
+    symlinks, size, histogram = walk_census(vault)
+
+    assert (census.files, census.dirs, census.max_depth) == (files, dirs, max_depth)
+    assert (census.symlinks, census.bytes, census.depth_histogram) == (symlinks, size, histogram)
+    assert census.system_phi() == calculate_system_phi(str(vault))
+    assert census.phi() == calculate_phi(files, max_depth, symlinks)
+
+
+def test_census_without_sizes(vault):
+    census = system_census(str(vault), sizes=False)
+    assert census.bytes == 0
+    assert census.connections == sum(_walk_counts(str(vault))[:2])
+
+
+def test_merge_adds_histograms():
+    left, right = PhiCensus(), PhiCensus()
+    left.add((2, 1, ['d'], 0, 10), 0)
+    right.add((3, 0, [], 1, 5), 2)
+    left.merge(right)
+    assert left.to_dict() == {
+        'files': 5, 'dirs': 1, 'symlinks': 1, 'bytes': 15, 'max_depth': 2,
+        'depth_histogram': [1, 0, 1],
+        'system_phi': left.system_phi(), 'phi': calculate_phi(5, 2, 1)
+    }
+
+
+def test_missing_root(tmp_path):
+    assert system_census(str(tmp_path / 'missing')) is None
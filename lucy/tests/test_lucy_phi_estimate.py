@@ -0,0 +1,59 @@
+"""Tests for the time-budgeted Knuth estimator of system Φ"""
+
+import pytest
+
+from lucy.lucy_phi import _walk_counts, calculate_system_phi, estimate_system_phi
+
+
+def make_tree(root, shape):
+    """shape: list of (files, subtree shape) per child directory"""
+    for index, (files, children) in enumerate(shape):
+        path = root / f'd{index}'
+        path.mkdir()
+        for name in range(files):
+            (path / f'f{name}').write_text('')
+        make_tree(path, children)
+
+
+def uniform(depth, branching=3, files=2):
+    return [] if depth == 0 else [(files, uniform(depth - 1, branching, files))] * branching
+
+
+@pytest.fixture
+def skewed(tmp_path):
+    root = tmp_path / 'skewed'
+    root.mkdir()
+    make_tree(root, [(1, uniform(3)), (40, []), (0, [(5, uniform(2, 2, 7))]), (3, [])])
+    return root
+
+
+def connections(root):
+    files, dirs, _ = _walk_counts(str(root))
+    return files + dirs
+
+
+def test_within_budget_is_exact(skewed):
+    estimate = estimate_system_phi(str(skewed), time_budget=10.0)
+    assert estimate['exact'] and estimate['probes'] == 0
+    assert estimate['connections'] == connections(skewed)
+    assert estimate['max_depth'] == _walk_counts(str(skewed))[2]
+    assert estimate['phi'] == calculate_system_phi(str(skewed))
+
+
+def test_uniform_tree_estimate_has_no_variance(tmp_path):
+    root = tmp_path / 'uniform'
+    root.mkdir()
+    make_tree(root, uniform(4))
+    estimate = estimate_system_phi(str(root), time_budget=0.0, seed=1)
+    assert not estimate['exact'] and estimate['probes'] >= 3
+    assert estimate['connections'] == pytest.approx(connections(root))
+    assert estimate['connections_low'] == pytest.approx(estimate['connections_high'])
+
+
+def test_estimate_is_unbiased(skewed):
+    runs = [estimate_system_phi(str(skewed), time_budget=0.0, seed=seed) for seed in range(400)]
+    assert not any(run['exact'] for run in runs)
+    mean = sum(run['connections'] for run in runs) / len(runs)
+    assert mean == pytest.approx(connections(skewed), rel=0.1)
+    for run in runs:
+        assert run['connections_low'] <= run['connections'] <= run['connections_high']
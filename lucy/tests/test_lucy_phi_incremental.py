@@ -0,0 +1,93 @@
+"""Tests for incremental calculate_system_phi: snapshot reuse must match os.walk"""
+
+import os
+import shutil
+import time
+
+import pytest
+
+from lucy import lucy_phi
+from lucy.lucy_phi import _incremental_counts, calculate_system_phi
+
+
+def _walk_counts(root):
+    """(files, dirs, max depth) by a plain os.walk"""
+    files = dirs = max_depth = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        depth = 0 if dirpath == root else os.path.relpath(dirpath, root).count(os.sep) + 1
+        files += len(filenames)
+        dirs += len(dirnames)
+        max_depth = max(max_depth, depth)
+    return files, dirs, max_depth
+
+
+@pytest.fixture
+def vault(tmp_path):
+    root = tmp_path / 'vault'
+    for d in ('a/b/c', 'a/d', 'e/f'):
+        (root / d).mkdir(parents=True)
+    for f in ('x.txt', 'a/y.txt', 'a/b/c/z.txt', 'e/f/w.txt'):
+        (root / f).write_text(f)
+    age(root)
+    return root
+
+
+def age(root, seconds=3600):
+    """Backdate every directory so the snapshot trusts its mtime"""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+@pytest.fixture
+def listed(monkeypatch):
+    """Paths re-listed by the incremental scan"""
+    paths = []
+    list_directory = lucy_phi._list_directory
+
+    def recording(path, *args):
+        paths.append(path)
+        return list_directory(path, *args)
+
+    monkeypatch.setattr(lucy_phi, '_list_directory', recording)
+    return paths
+
+
+def test_unchanged_directories_are_not_relisted(vault, tmp_path, listed):
+    snapshot = tmp_path / 'snapshot.json'
+    assert _incremental_counts(str(vault), snapshot) == _walk_counts(str(vault))
+    assert len(listed) == 7
+
+    listed.clear()
+    assert _incremental_counts(str(vault), snapshot) == _walk_counts(str(vault))
+    assert listed == []
+
+
+def test_changes_match_walk(vault, tmp_path, listed):
+    snapshot = tmp_path / 'snapshot.json'
+    _incremental_counts(str(vault), snapshot)
+
+    listed.clear()
+    (vault / 'a/b/c/new.txt').write_text('n')
+    assert _incremental_counts(str(vault), snapshot) == _walk_counts(str(vault))
+    assert listed == [str(vault / 'a/b/c')]
+
+    (vault / 'a/b/c/g/h').mkdir(parents=True)
+    shutil.rmtree(vault / 'e')
+    os.symlink(vault / 'a', vault / 'a/d/link')
+    assert _incremental_counts(str(vault), snapshot) == _walk_counts(str(vault))
+
+    # A symlink's class follows its target, so its directory is re-listed
+    age(vault)
+    _incremental_counts(str(vault), snapshot)
+    os.unlink(vault / 'a/d/link')
+    os.symlink(vault / 'x.txt', vault / 'a/d/link')
+    age(vault)
+    assert _incremental_counts(str(vault), snapshot) == _walk_counts(str(vault))
+
+
+def test_incremental_phi_matches_full_scan(vault, tmp_path):
+    snapshot = tmp_path / 'snapshot.json'
+    full = calculate_system_phi(str(vault))
+    assert calculate_system_phi(str(vault), incremental=True, snapshot_path=snapshot) == full
+    assert calculate_system_phi(str(vault), incremental=True, snapshot_path=snapshot) == full
@@ -0,0 +1,86 @@
+"""Tests for calculate_phi_mip against brute-force bipartitions"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from lucy import lucy_phi_calculator
+from lucy.lucy_phi_calculator import (analyze_gem_chain, build_connectivity_matrix,
+                                      calculate_phi_mip, calculate_phi_simple)
+
+
+def brute_force(state, connectivity, normalized):
+    """Weakest cut over every bipartition of the active nodes"""
+    active = np.flatnonzero(state)
+    m = len(active)
+    sub = connectivity[np.ix_(active, active)] * state[active]
+    weights = sub + sub.T
+    np.fill_diagonal(weights, 0.0)
+    best = np.inf
+    for size in range(1, m):
+        for part in itertools.combinations(range(1, m), size):
+            inside = np.zeros(m, dtype=bool)
+            inside[list(part)] = True
+            cut = weights[np.ix_(inside, ~inside)].sum()
+            best = min(best, cut / min(size, m - size) if normalized else cut)
+    return best
+
+
+def cut_of(partition, state, connectivity):
+    left, right = partition
+    interaction = connectivity * state
+    return interaction[np.ix_(left, right)].sum() + interaction[np.ix_(right, left)].sum()
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('normalized', [False, True])
+def test_matches_brute_force(seed, normalized):
+    rng = np.random.default_rng(seed)
+    n = 11
+    state = (rng.random(n) < 0.8).astype(np.float64)
+    connectivity = rng.random((n, n))
+
+    phi, metrics = calculate_phi_mip(state, connectivity, normalized=normalized, workers=1)
+    active = np.flatnonzero(state)
+    assert metrics['active_nodes'] == len(active)
+    assert metrics['partitions'] == 2 ** (len(active) - 1) - 1
+    assert phi == pytest.approx(brute_force(state, connectivity, normalized), rel=1e-12)
+
+    left, right = metrics['partition']
+    assert sorted(left + right) == active.tolist() and left and right
+    assert metrics['cut'] == pytest.approx(cut_of(metrics['partition'], state, connectivity),
+                                           rel=1e-12)
+
+
+def test_parallel_matches_in_process(monkeypatch):
+    monkeypatch.setattr(lucy_phi_calculator, 'MIP_PARALLEL_MIN', 1)
+    layers = [-9, -6, -5, -1, 0, 2, 3, 7, 8, 9, 4, -3]
+    connectivity = build_connectivity_matrix(layers)
+    state = np.ones(len(layers))
+    for normalized in (False, True):
+        parallel = calculate_phi_mip(state, connectivity, normalized=normalized, workers=3)[0]
+        serial = calculate_phi_mip(state, connectivity, normalized=normalized, workers=1)[0]
+        assert parallel == pytest.approx(serial, rel=1e-12)
+        assert serial == pytest.approx(brute_force(state, connectivity, normalized), rel=1e-12)
+
+
+def test_singleton_cuts_bound_the_mip():
+    connectivity = build_connectivity_matrix([-4, -1, 0, 3, 5, 8])
+    state = np.ones(6)
+    phi, _ = calculate_phi_mip(state, connectivity, workers=1)
+    assert 0 < phi <= calculate_phi_simple(state, connectivity)
+
+
+def test_trivial_states():
+    connectivity = build_connectivity_matrix([0, 1, 2])
+    for state in ([0, 0, 0], [0, 1, 0]):
+        phi, metrics = calculate_phi_mip(np.array(state), connectivity)
+        assert phi == 0.0 and metrics['partition'] is None
+
+
+def test_analyze_gem_chain_reports_layers():
+    _, metrics = analyze_gem_chain([0, 3, -2, 0, 9], verbose=False, mip=True)
+    left, right = metrics['mip_partition']
+    assert sorted(left + right) == [-2, 0, 3, 9]
+    assert metrics['phi_mip'] > 0
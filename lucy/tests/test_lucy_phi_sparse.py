@@ -0,0 +1,82 @@
+"""Tests for the sparse Φ engine against the dense calculator"""
+
+import numpy as np
+import pytest
+
+from lucy.lucy_phi_calculator import (build_connectivity_matrix, calculate_phi_rigorous,
+                                      calculate_phi_simple)
+from lucy.lucy_phi_sparse import calculate_phi_sparse, csr_from_edges
+
+
+def dense_of(indptr, indices, data):
+    n = len(indptr) - 1
+    dense = np.zeros((n, n))
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    np.add.at(dense, (rows, indices), data)
+    return dense
+
+
+def random_edges(n, m, seed):
+    rng = np.random.default_rng(seed)
+    edges = rng.integers(0, n, size=(m, 2))
+    return np.column_stack((edges, rng.random(m)))
+
+
+def test_csr_from_edges_sums_and_mirrors():
+    edges = [[0, 1, 2.0], [1, 0, 0.5], [2, 2, 3.0], [0, 1, 1.0]]
+    dense = dense_of(*csr_from_edges(edges, num_nodes=4, diagonal=1.0))
+    expected = np.diag([1.0, 1.0, 1.0 + 3.0, 1.0])
+    expected[0, 1] = expected[1, 0] = 3.5
+    np.testing.assert_array_equal(dense, expected)
+
+    directed = dense_of(*csr_from_edges(edges, symmetric=False))
+    assert directed[0, 1] == 3.0 and directed[1, 0] == 0.5
+    assert len(csr_from_edges([], num_nodes=3)[0]) == 4
+
+    for bad in ([[0, -1]], [[0, 1, 2, 3]]):
+        with pytest.raises(ValueError):
+            csr_from_edges(bad)
+    with pytest.raises(ValueError):
+        csr_from_edges([[0, 5]], num_nodes=3)
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_matches_dense(symmetric):
+    n = 400
+    csr = csr_from_edges(random_edges(n, 3000, 5), num_nodes=n, symmetric=symmetric,
+                         diagonal=1.0)
+    dense = dense_of(*csr)
+    state = (np.random.default_rng(6).random(n) < 0.7).astype(np.float64)
+
+    phi, metrics = calculate_phi_sparse(*csr, state=state, symmetric=symmetric)
+    dense_phi, dense_metrics = calculate_phi_rigorous(state, dense)
+    assert phi == pytest.approx(calculate_phi_simple(state, dense), rel=1e-9)
+    assert phi == pytest.approx(dense_phi, rel=1e-9)
+    assert metrics['avg_conductance'] == pytest.approx(dense_metrics['avg_conductance'])
+    assert metrics['max_conductance'] == dense_metrics['max_conductance']
+    assert metrics['active_nodes'] == int(state.sum()) and metrics['total_nodes'] == n
+
+    assert metrics['converged']
+    radius = np.max(np.abs(np.linalg.eigvalsh((dense + dense.T) / 2)))
+    assert metrics['max_eigenvalue'] == pytest.approx(radius, rel=1e-8)
+
+
+def test_dense_connectivity_round_trip():
+    gamma = build_connectivity_matrix([-9, -4, 0, 2, 3, 8])
+    rows, cols = np.nonzero(gamma)
+    indptr = np.searchsorted(rows, np.arange(len(gamma) + 1))
+    phi, metrics = calculate_phi_sparse(indptr, cols, gamma[rows, cols], symmetric=True)
+    dense_phi, dense_metrics = calculate_phi_rigorous(np.ones(len(gamma)), gamma)
+    assert phi == pytest.approx(dense_phi, rel=1e-12)
+    assert metrics['max_eigenvalue'] == pytest.approx(dense_metrics['max_eigenvalue'], rel=1e-9)
+
+
+def test_invalid_csr():
+    with pytest.raises(ValueError):
+        calculate_phi_sparse([0, 2, 1], [0, 1])
+    with pytest.raises(ValueError):
+        calculate_phi_sparse([0, 1], [3])
+    with pytest.raises(ValueError):
+        calculate_phi_sparse([0, 1], [0], data=[1.0, 2.0])
+    phi, metrics = calculate_phi_sparse([0, 0, 0], [])
+    assert phi == 0.0 and metrics['max_eigenvalue'] == 0.0
@@ -0,0 +1,95 @@
+"""Tests for the long-lived Lucy worker pool"""
+
+import os
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from lucy.lucy_agent import LucyAgent
+from lucy.lucy_pool import LucyWorker, LucyWorkerPool
+
+LUCY_SCRIPT = Path(__file__).resolve().parent.parent / 'local_lucy_agent.rb'
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'review'
+
+
+@pytest.fixture(autouse=True)
+def ruby():
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+
+
+@pytest.fixture
+def pool():
+    pool = LucyWorkerPool(LUCY_SCRIPT, size=2, max_requests=3)
+    yield pool
+    pool.close()
+
+
+def review(pool, name='worker.rb'):
+    return pool.run('review', str(FIXTURES / name))
+
+
+def test_concurrent_requests(pool):
+    names = sorted(p.name for p in FIXTURES.iterdir() if p.is_file())
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda name: review(pool, name), names * 2))
+
+    for name, result in zip(names * 2, results):
+        assert f"Analyzing {FIXTURES / name}..." in result.stdout
+    assert len(pool._workers) <= 2
+
+
+def test_dead_worker_is_replaced(pool):
+    assert review(pool).returncode == 0
+    worker = pool._idle[-1]
+    os.kill(worker.process.pid, signal.SIGKILL)
+    worker.process.wait()
+
+    assert review(pool).returncode == 0
+    assert worker not in pool._workers
+
+
+def test_workers_recycled_after_max_requests(pool):
+    pids = []
+    for _ in range(4):
+        assert review(pool).returncode == 0
+        pids.append(pool._idle[-1].process.pid if pool._idle else None)
+    # The third request spends the first worker; the fourth gets a new one
+    assert pids[0] == pids[1] and pids[2] is None and pids[3] != pids[0]
+
+
+def test_close_wakes_every_waiter():
+    pool = LucyWorkerPool(LUCY_SCRIPT, size=1)
+    worker = pool._acquire()
+    errors = []
+
+    def wait_for_worker():
+        try:
+            pool.run('pillars')
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiters = [threading.Thread(target=wait_for_worker) for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    pool.close()
+    for thread in waiters:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in waiters)
+    assert len(errors) == 4
+    assert not worker.is_alive()
+
+
+def test_request_timeout_kills_worker(tmp_path):
+    script = tmp_path / 'hang.rb'
+    script.write_text("STDIN.each_line { sleep }\n")
+    worker = LucyWorker(script)
+
+    result = worker.request('review', 'a.rb', timeout=0.5)
+    assert result.returncode == -signal.SIGKILL
+    assert 'timed out' in result.stderr
+    assert not worker.is_alive()
@@ -0,0 +1,55 @@
+"""Parity tests: the in-process ReviewEngine against the Ruby review path"""
+
+from pathlib import Path
+
+import pytest
+
+from lucy.lucy_agent import LucyAgent
+from lucy.lucy_review import ReviewEngine
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'review'
+
+
+@pytest.fixture(scope='module')
+def ruby_agent():
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    return LucyAgent(instrument=False)
+
+
+def ruby_review(agent: LucyAgent, path: str) -> dict:
+    """Ruby review output from the "Analyzing" line on (past the Φ banner)"""
+    result = agent.review(path)
+    marker = result['output'].find('Lucy Agent: Analyzing')
+    if marker >= 0:
+        result['output'] = result['output'][marker:]
+    return result
+
+
+@pytest.mark.parametrize('name', sorted(p.name for p in FIXTURES.iterdir() if p.is_file()))
+def test_engine_matches_ruby(ruby_agent, name):
+    path = str(FIXTURES / name)
+    expected = ruby_review(ruby_agent, path)
+    actual = ReviewEngine().review(path)
+
+    assert actual['success'] == expected['success']
+    if expected['success']:
+        assert actual['output'] == expected['output']
+
+
+def test_relative_path_matches_ruby(ruby_agent, tmp_path, monkeypatch):
+    # Both engines resolve relative paths against lucy_dir, not the Python cwd
+    relative = str(FIXTURES.relative_to(ruby_agent.lucy_dir) / 'worker.rb')
+    monkeypatch.chdir(tmp_path)
+    expected = ruby_review(ruby_agent, relative)
+    with LucyAgent(in_process_review=True, instrument=False) as agent:
+        actual = agent.review(relative)
+
+    assert expected['success'] and actual['success']
+    assert actual['output'] == expected['output']
+
+
+def test_missing_file_fails_on_both(ruby_agent, tmp_path):
+    path = str(tmp_path / 'missing.rb')
+    assert not ruby_agent.review(path)['success']
+    assert not ReviewEngine().review(path)['success']
@@ -0,0 +1,41 @@
+"""Tests for LucySelf construction"""
+
+import threading
+import time
+
+import pytest
+
+from lucy import lucy_phi_cache
+from lucy.lucy_agent import LucyAgent
+from lucy.lucy_self import LucySelf
+
+
+@pytest.fixture
+def slow_vault(tmp_path, monkeypatch):
+    """A stale shared Φ whose recomputation takes a while"""
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.delenv('LUCY_PHI_CACHE', raising=False)
+    release = threading.Event()
+    calls = []
+
+    def shared_system_phi(*args, **kwargs):
+        calls.append(1)
+        release.wait(5)
+        return 2_000_000.0
+
+    monkeypatch.setattr(lucy_phi_cache, 'shared_system_phi', shared_system_phi)
+    return release, calls
+
+
+def test_fast_start_does_not_wait_for_phi(slow_vault):
+    release, calls = slow_vault
+    start = time.perf_counter()
+    lucy = LucySelf(fast_start=True)
+    assert time.perf_counter() - start < 2
+
+    release.set()
+    assert lucy.phi == 2_000_000.0
+    # The background check's result is reused, not walked again
+    assert len(calls) == 1
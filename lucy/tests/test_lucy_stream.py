@@ -0,0 +1,73 @@
+"""Tests for LucyAgent.stream and run_streaming"""
+
+import os
+import time
+
+import pytest
+
+from lucy.lucy_agent import LucyAgent
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    if not LucyAgent.is_available():
+        pytest.skip('ruby is not installed')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return LucyAgent()
+
+
+def with_script(agent, tmp_path, source):
+    """Point the agent at a stand-in Lucy script"""
+    script = tmp_path / 'lucy.rb'
+    script.write_text(source)
+    agent.lucy_script = script
+    return agent
+
+
+def test_stream_yields_both_pipes_and_exit_code(agent, tmp_path):
+    with_script(agent, tmp_path, "puts 'one'\nwarn 'oops'\nputs 'x' * 10\nexit 3\n")
+    chunks = agent.stream('ocr', chunk_size=4)
+    received = []
+    while True:
+        try:
+            received.append(next(chunks))
+        except StopIteration as done:
+            assert done.value == 3
+            break
+
+    stdout = [text for name, text in received if name == 'stdout']
+    assert ''.join(stdout) == 'one\n' + 'x' * 10 + '\n'
+    assert max(map(len, stdout)) <= 4
+    assert ''.join(text for name, text in received if name == 'stderr') == 'oops\n'
+
+
+def test_run_streaming_keeps_only_the_error_tail(agent, tmp_path):
+    with_script(agent, tmp_path, "5.times { |i| puts i; warn \"e#{i}\" }\nexit 1\n")
+    seen = []
+    result = agent.run_streaming('ocr', callback=lambda name, text: seen.append((name, text)),
+                                 error_tail=2)
+
+    assert result == {'success': False, 'output': None, 'error': 'e3\ne4\n'}
+    assert [text for name, text in seen if name == 'stdout'] == [f'{i}\n' for i in range(5)]
+
+
+def test_closing_early_kills_the_process_group(agent, tmp_path):
+    with_script(agent, tmp_path,
+                "$stdout.sync = true\nputs spawn('sleep', '60')\nloop { puts 'tick'; sleep 0.01 }\n")
+    chunks = agent.stream('ocr')
+    child = int(next(chunks)[1])
+    next(chunks)
+    chunks.close()
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            with open(f'/proc/{child}/stat') as f:
+                if f.read().split(') ')[1].startswith('Z'):
+                    break
+        except FileNotFoundError:
+            break
+        time.sleep(0.05)
+    else:
+        os.kill(child, 9)
+        pytest.fail('child outlived the stream')
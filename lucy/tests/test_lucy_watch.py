@@ -0,0 +1,92 @@
+"""Tests for the inotify-driven PhiWatcher: counts must match os.walk"""
+
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from lucy.lucy_phi import _walk_counts, calculate_system_phi, live_counter
+from lucy import lucy_watch
+from lucy.lucy_watch import PhiWatcher
+
+
+@pytest.fixture(autouse=True)
+def inotify():
+    if not PhiWatcher.is_supported():
+        pytest.skip('inotify is not available')
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / 'vault'
+    for d in ('a/b/c', 'a/d', 'e'):
+        (root / d).mkdir(parents=True)
+    for f in ('x.txt', 'a/y.txt', 'a/b/z.txt', 'a/b/c/w.txt', 'e/v.txt'):
+        (root / f).write_text(f)
+    os.symlink(root / 'x.txt', root / 'a/link')
+    os.symlink(root / 'a/b', root / 'e/dirlink')
+    return root
+
+
+def wait_for_walk(watcher, root, timeout=5.0):
+    """Wait until the watcher agrees with a fresh os.walk"""
+    deadline = time.monotonic() + timeout
+    while watcher.counts() != _walk_counts(str(root)):
+        if time.monotonic() > deadline:
+            pytest.fail(f'{watcher.counts()} != {_walk_counts(str(root))}')
+        time.sleep(0.02)
+
+
+def test_counts_follow_changes(root):
+    with PhiWatcher(str(root)) as watcher:
+        assert watcher.counts() == _walk_counts(str(root))
+
+        (root / 'new.txt').write_text('n')
+        (root / 'a/b/c/deep/er/still').mkdir(parents=True)
+        (root / 'a/b/c/deep/er/still/f.txt').write_text('f')
+        wait_for_walk(watcher, root)
+
+        os.rename(root / 'a/b', root / 'e/b')
+        os.symlink(root / 'a', root / 'e/alink')
+        wait_for_walk(watcher, root)
+
+        shutil.rmtree(root / 'e')
+        (root / 'x.txt').unlink()
+        wait_for_walk(watcher, root)
+
+
+def test_unwatched_subtrees_are_counted(root):
+    with PhiWatcher(str(root), max_watches=2, resync_interval=None) as watcher:
+        assert watcher.stats()['unwatched'] > 0
+        assert watcher.counts() == _walk_counts(str(root))
+
+
+def test_system_phi_answers_from_watcher(root):
+    with PhiWatcher(str(root)) as watcher:
+        assert live_counter(str(root)) is watcher
+        assert calculate_system_phi(str(root)) == watcher.phi()
+    assert live_counter(str(root)) is None
+
+
+def test_counts_do_not_wait_for_scans(root, monkeypatch):
+    with PhiWatcher(str(root)) as watcher:
+        before = watcher.counts()
+        scanning = threading.Event()
+        list_directory = lucy_watch._list_directory
+
+        def slow_list_directory(path, *args):
+            scanning.set()
+            time.sleep(0.5)
+            return list_directory(path, *args)
+
+        monkeypatch.setattr(lucy_watch, '_list_directory', slow_list_directory)
+        (root / 'a/new').mkdir()
+        assert scanning.wait(5)
+
+        start = time.monotonic()
+        assert watcher.counts() == before
+        assert time.monotonic() - start < 0.1
+        monkeypatch.setattr(lucy_watch, '_list_directory', list_directory)
+        wait_for_walk(watcher, root)